@@ -0,0 +1,69 @@
+"""
+Benchmark of DataHandlerContext.handle_many against one handle call per column.
+
+run from the repository root:
+    python -m benchmarks.batched_imputation
+"""
+import time
+
+import pandas as pd
+
+from design_patterns.strategy_pattern import DataHandlerContext, MeanStrategy, MedianStrategy
+
+
+def tile(df: pd.DataFrame, rows: int) -> pd.DataFrame:
+    """
+    Repeat the dataframe until it has the requested number of rows.
+
+    args:
+        df: pandas.DataFrame - dataframe to repeat
+        rows: int - number of rows wanted
+    returns:
+        pandas.DataFrame
+    """
+    repeats = -(-rows // len(df))
+    return pd.concat([df] * repeats, ignore_index=True).iloc[:rows]
+
+
+def best_of(func, setup, repeat: int = 5) -> float:
+    """
+    Best wall time of repeated calls on a fresh setup() argument, in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        func(arg)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    base = pd.read_csv("data/car_insurance.csv")
+    numeric = base.select_dtypes("number").columns
+    strategies = {
+        column: MedianStrategy() if i % 2 else MeanStrategy()
+        for i, column in enumerate(numeric)
+    }
+    context = DataHandlerContext(MeanStrategy())
+
+    for rows in (10_000, 1_000_000):
+        df = tile(base, rows)
+
+        def per_column(frame):
+            for column, strategy in strategies.items():
+                context.set_strategy(strategy)
+                frame = context.handle(frame, column)
+            return frame
+
+        def batched(frame):
+            return context.handle_many(frame, strategies)
+
+        pd.testing.assert_frame_equal(per_column(df.copy()), batched(df.copy()))
+        loop_time = best_of(per_column, df.copy)
+        batch_time = best_of(batched, df.copy)
+        print(
+            f"{rows:>9} rows x {len(strategies)} columns: "
+            f"per-column {loop_time * 1e3:8.1f} ms, batched {batch_time * 1e3:8.1f} ms, "
+            f"speedup {loop_time / batch_time:4.1f}x"
+        )
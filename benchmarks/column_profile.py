@@ -0,0 +1,54 @@
+"""
+Cost of running several strategy checks on every column of a wide frame,
+rescanning the column per check against sharing one column_profile per frame.
+
+run from the repository root:
+    python -m benchmarks.column_profile
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from design_patterns.column_profile import profile_of
+from design_patterns.public_method.public import CustomStrategy, DropStrategy, MeanStrategy
+
+
+def rescan(df: pd.DataFrame) -> list:
+    """
+    The checks as written before profiles: one isnull or mean scan each.
+    """
+    return [
+        (df[column].isnull().any(), df[column].isnull().mean() > 0.6, df[column].mean())
+        for column in df.columns
+    ]
+
+
+def shared(df: pd.DataFrame) -> list:
+    """
+    The same checks through the strategies, sharing the frame's profile.
+    """
+    drop, custom, mean = DropStrategy(), CustomStrategy(), MeanStrategy()
+    return [
+        (
+            drop._column_has_missing_values(df, column),
+            custom._too_many_nulls(df, column),
+            mean._calculate_mean(df, column),
+        )
+        for column in df.columns
+    ]
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    rows, columns = 200_000, 200
+    values = rng.normal(size=(rows, columns))
+    values[rng.random((rows, columns)) < 0.1] = np.nan
+    df = pd.DataFrame(values, columns=[f"c{i}" for i in range(columns)])
+
+    for name, checks in (("rescan per check", rescan), ("shared profile", shared)):
+        start = time.perf_counter()
+        for _ in range(3):  # e.g. three candidate selections over the same frame
+            checks(df)
+        print(f"{name:<18} {(time.perf_counter() - start) * 1e3:8.1f} ms")
+        profile_of(df).invalidate()
@@ -0,0 +1,44 @@
+"""
+Benchmark of the fitted encoders against the Series.map path they replace,
+on object and categorical columns.
+
+run from the repository root:
+    python -m benchmarks.encoders
+"""
+import time
+
+import pandas as pd
+
+from benchmarks.batched_imputation import tile
+from design_patterns.encoders import FrequencyEncoder, OneHotEncoder, OrdinalEncoder
+
+MAPPING = {"sedan": 0, "sports car": 1}
+
+
+def best_of(func, repeat: int = 5) -> float:
+    """
+    Best wall time of repeated calls, in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    base = pd.read_csv("data/car_insurance.csv")
+    rows = 1_000_000
+    column = tile(base, rows)["vehicle_type"]
+    for label, series in (("object", column.astype(object)), ("category", column.astype("category"))):
+        candidates = {
+            "Series.map": lambda: series.map(MAPPING),
+            "OrdinalEncoder": lambda: OrdinalEncoder(MAPPING).transform(series),
+            "OneHotEncoder": lambda: OneHotEncoder().fit(series).transform(series),
+            "FrequencyEncoder": lambda: FrequencyEncoder().fit(series).transform(series),
+        }
+        print(f"{rows} rows, {label} dtype")
+        for name, func in candidates.items():
+            seconds = best_of(func)
+            print(f"  {name:<18} {seconds * 1e3:8.1f} ms {rows / seconds / 1e6:8.1f} M rows/s")
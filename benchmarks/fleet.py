@@ -0,0 +1,49 @@
+"""
+Benchmark of CarFleet, computing lifespan, inflation and descriptions for a whole
+fleet at once, against calling the ElectricCar methods on each object.
+
+run from the repository root:
+    python -m benchmarks.fleet
+"""
+import time
+
+import numpy as np
+
+from design_patterns.fleet import CarFleet
+from design_patterns.oops import ElectricCar
+
+
+if __name__ == "__main__":
+    count = 500_000
+    rng = np.random.default_rng(0)
+    models = [("Tesla", "Model 3"), ("Nissan", "Leaf"), ("Toyota", "Corolla"), ("Hyundai", "Kona")]
+    cars = [
+        ElectricCar(*models[i % len(models)], int(rng.integers(2005, 2025)), int(rng.integers(40, 100)),
+                    int(rng.integers(10_000, 80_000)))
+        for i in range(count)
+    ]
+
+    start = time.perf_counter()
+    numbers = [(car.car_lifespan(), car.inflation()) for car in cars]
+    numbers_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    texts = [str(car) for car in cars]
+    texts_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fleet = CarFleet.from_cars(cars)
+    build_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    lifespan, inflation = fleet.lifespan(), fleet.inflation()
+    fleet_numbers_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    descriptions = fleet.descriptions()
+    fleet_texts_seconds = time.perf_counter() - start
+
+    assert numbers == list(zip(lifespan.tolist(), inflation.tolist()))
+    assert texts == descriptions
+    print(f"{count} cars, building the fleet from objects takes {build_seconds:.2f} s")
+    print(f"lifespan + inflation  per object {numbers_seconds:6.3f} s  fleet {fleet_numbers_seconds:6.3f} s "
+          f"({numbers_seconds / fleet_numbers_seconds:.0f}x)")
+    print(f"descriptions          per object {texts_seconds:6.3f} s  fleet {fleet_texts_seconds:6.3f} s "
+          f"({texts_seconds / fleet_texts_seconds:.1f}x)")
@@ -0,0 +1,52 @@
+"""
+Benchmark of GroupedStrategy against a naive per-group Python loop, with low-cardinality
+keys (income and age) and high-cardinality keys (synthetic postal codes).
+
+run from the repository root:
+    python -m benchmarks.grouped_imputation
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.batched_imputation import tile
+from design_patterns.strategy_pattern import GroupedStrategy
+
+
+def naive(df: pd.DataFrame, by, column: str) -> pd.DataFrame:
+    """
+    One boolean mask and one median per group, the slow path GroupedStrategy replaces.
+    """
+    fallback = df[column].median()
+    for _, group in df.groupby(by, observed=True)[column]:
+        df.loc[group.index, column] = group.fillna(group.median()).fillna(fallback)
+    return df
+
+
+def timed(func) -> float:
+    """
+    Wall time of one call, in seconds.
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    base = pd.read_csv("data/car_insurance.csv")
+    for rows in (100_000, 5_000_000):
+        df = tile(base, rows)
+        df["postal_code"] = np.random.default_rng(0).integers(0, rows // 10, rows)
+        for by in (["income", "age"], ["postal_code"]):
+            groups = df.groupby(by).ngroups
+            fitted = GroupedStrategy(by).fit(df, "credit_score")
+            vectorized = timed(lambda: GroupedStrategy(by).handle_missing(df.copy(), "credit_score"))
+            transform = timed(lambda: fitted.transform(df.copy(), "credit_score"))
+            line = (
+                f"{rows:>9} rows, {groups:>7} groups of {'+'.join(by):<12}: "
+                f"handle_missing {vectorized * 1e3:8.1f} ms, fitted transform {transform * 1e3:8.1f} ms"
+            )
+            if rows <= 100_000:
+                line += f", naive loop {timed(lambda: naive(df.copy(), by, 'credit_score')) * 1e3:8.1f} ms"
+            print(line)
@@ -0,0 +1,62 @@
+"""
+Import time budget of the strategy and template APIs, measured with python -X importtime
+in fresh interpreters. Fails when the median is over budget or when importing the APIs
+pulls in pandas, numpy or matplotlib, which the modules import on first use only.
+
+run from the repository root:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget-ms 60 --runs 11
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = ["design_patterns.strategy_pattern", "design_patterns.template_pattern"]
+HEAVY = ("pandas", "numpy", "matplotlib")
+
+
+def import_time(modules) -> tuple:
+    """
+    Cumulative import time of the modules in a fresh interpreter, and every module it imported.
+
+    args:
+        modules: List[str] - modules to import
+    returns:
+        tuple - microseconds, set of imported module names
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    total, imported = 0, set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imported.add(name.strip())
+        # top-level entries of the package include every module imported on their behalf
+        if not name.startswith("  ") and name.strip().split(".")[0] == modules[0].split(".")[0]:
+            total += int(cumulative)
+    return total, imported
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    timings, imported = [], set()
+    for _ in range(args.runs):
+        total, imported = import_time(MODULES)
+        timings.append(total / 1e3)
+    median = statistics.median(timings)
+    heavy = sorted(name for name in imported if name.split(".")[0] in HEAVY)
+
+    print(f"import {', '.join(MODULES)}")
+    print(f"median {median:.1f} ms over {args.runs} runs (min {min(timings):.1f}, budget {args.budget_ms:.1f})")
+    if heavy:
+        print(f"heavy modules imported: {', '.join(heavy[:10])}{' ...' if len(heavy) > 10 else ''}")
+    if heavy or median > args.budget_ms:
+        sys.exit(1)
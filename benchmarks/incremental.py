@@ -0,0 +1,50 @@
+"""
+Time of an incremental run over rows appended to a large csv against a full rerun,
+checking that the new rows match what the full rerun gives them.
+
+run from the repository root:
+    python -m benchmarks.incremental
+"""
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.batched_imputation import tile
+from design_patterns.incremental import IncrementalRunner
+from design_patterns.template_pattern import ProcessData
+
+if __name__ == "__main__":
+    base = pd.read_csv("data/car_insurance.csv")
+    rows, appended = 2_000_000, 20_000
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()) as quiet:
+        path = os.path.join(tmp, "car_insurance.csv")
+        tile(base, rows).to_csv(path, index=False)
+        runner = IncrementalRunner(ProcessData(), os.path.join(tmp, "state.json"))
+
+        start = time.perf_counter()
+        runner.run(path)
+        first = time.perf_counter() - start
+
+        tile(base, appended).to_csv(path, mode="a", header=False, index=False)
+        start = time.perf_counter()
+        delta = runner.run(path)
+        incremental = time.perf_counter() - start
+
+        start = time.perf_counter()
+        full = ProcessData().run_pipeline(path)
+        rerun = time.perf_counter() - start
+
+    new_rows = full.iloc[rows:]
+    assert len(delta) == appended
+    assert delta.index.equals(new_rows.index)
+    assert np.allclose(delta["annual_mileage"], new_rows["annual_mileage"])
+    assert (delta["vehicle_type"] == new_rows["vehicle_type"]).all()
+    print(
+        f"first run over {rows} rows {first:6.2f} s, "
+        f"{appended} appended rows: incremental {incremental:6.3f} s, full rerun {rerun:6.2f} s"
+    )
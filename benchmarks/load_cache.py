@@ -0,0 +1,43 @@
+"""
+Benchmark of a cold load, parsing the csv and filling the cache, against a warm
+load memory-mapping the cached Feather file.
+
+run from the repository root:
+    python -m benchmarks.load_cache
+"""
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.batched_imputation import tile
+from design_patterns.load_cache import LoadCache
+from design_patterns.template_pattern import ProcessData
+
+PATH = "data/car_insurance.csv"
+
+
+def timed(func) -> float:
+    """
+    Wall time of one call, in seconds.
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        large = os.path.join(tmp, "car_insurance_1m.csv")
+        tile(pd.read_csv(PATH), 1_000_000).to_csv(large, index=False)
+        for path, label in ((PATH, "10k rows"), (large, "1M rows")):
+            cache_dir = os.path.join(tmp, f"cache_{label.split()[0]}")
+            pipeline = ProcessData(cache=LoadCache(cache_dir))
+            cold = timed(lambda: pipeline.load_data(path))
+            warm = min(timed(lambda: pipeline.load_data(path)) for _ in range(5))
+            uncached = timed(lambda: ProcessData().load_data(path))
+            print(
+                f"{label:>8}: uncached {uncached * 1e3:8.1f} ms, cold {cold * 1e3:8.1f} ms, "
+                f"warm {warm * 1e3:8.1f} ms"
+            )
@@ -0,0 +1,56 @@
+"""
+Accuracy and speed of MedianStrategy(approximate=True) against the exact median,
+on credit_score repeated to 10M rows, in one pass and merged from per-chunk sketches.
+
+run from the repository root:
+    python -m benchmarks.median_sketch
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.batched_imputation import tile
+from design_patterns.running_stats import ExactMedian, QuantileSketch
+
+
+def rank_error(sorted_values: np.ndarray, estimate: float) -> float:
+    """
+    Distance between the normalized rank of the estimate and 0.5.
+    """
+    low = np.searchsorted(sorted_values, estimate, side="left")
+    high = np.searchsorted(sorted_values, estimate, side="right")
+    middle = sorted_values.size / 2
+    return 0.0 if low <= middle <= high else min(abs(low - middle), abs(high - middle)) / sorted_values.size
+
+
+if __name__ == "__main__":
+    rows = 10_000_000
+    series = tile(pd.read_csv("data/car_insurance.csv"), rows)["credit_score"]
+    # break the exact repetition of the 10k source rows
+    series = series + np.random.default_rng(0).normal(0, 1e-3, rows)
+    chunks = np.array_split(series.to_numpy(), 16)
+    sorted_values = np.sort(series.dropna().to_numpy())
+    exact = float(np.median(sorted_values))
+
+    start = time.perf_counter()
+    ExactMedian().update(series).value()
+    print(f"exact median          {time.perf_counter() - start:6.2f} s  value {exact:.6f}")
+
+    for error in (0.05, 0.01, 0.001):
+        start = time.perf_counter()
+        sketch = QuantileSketch(error).update(series)
+        one_pass = time.perf_counter() - start
+
+        start = time.perf_counter()
+        merged = QuantileSketch(error)
+        for chunk in chunks:
+            merged.merge(QuantileSketch(error).update(chunk))
+        merge_time = time.perf_counter() - start
+
+        items = sum(level.size for level in merged.levels)
+        print(
+            f"sketch error={error:<6} one pass {one_pass:6.2f} s rank error {rank_error(sorted_values, sketch.value()):.5f} | "
+            f"16 merged {merge_time:6.2f} s rank error {rank_error(sorted_values, merged.value()):.5f} | "
+            f"{items} items kept"
+        )
@@ -0,0 +1,63 @@
+"""
+Mean and median imputation of a large numeric column through the memory-mapped NpyFrame
+backend against a pandas.Series loaded in memory: wall time and traced heap peak.
+
+run from the repository root:
+    python -m benchmarks.numpy_backend
+"""
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from design_patterns.numpy_backend import NpyFrame
+from design_patterns.strategy_pattern import MeanStrategy, MedianStrategy
+
+
+def measure(func):
+    """
+    Wall time in seconds and traced heap peak in bytes of one call.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+if __name__ == "__main__":
+    rows = 50_000_000
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source")
+        os.makedirs(source)
+        values = np.lib.format.open_memmap(os.path.join(source, "credit_score.npy"), mode="w+", dtype="float32", shape=(rows,))
+        for start in range(0, rows, 1 << 22):
+            block = rng.random(min(1 << 22, rows - start), dtype=np.float32)
+            block[rng.random(block.size) < 0.1] = np.nan
+            values[start:start + block.size] = block
+        values.flush()
+        del values
+
+        for strategy in (MeanStrategy(), MedianStrategy(), MedianStrategy(approximate=True)):
+            label = type(strategy).__name__ + (" approximate" if getattr(strategy, "approximate", False) else "")
+            work = os.path.join(tmp, "work")
+            shutil.copytree(source, work)
+
+            def pandas_path():
+                df = pd.DataFrame({"credit_score": np.load(os.path.join(work, "credit_score.npy"))})
+                strategy.handle_missing(df, "credit_score")
+
+            def mmap_path():
+                strategy.handle_missing(NpyFrame(work), "credit_score")
+
+            for name, func in (("pandas", pandas_path), ("npy mmap", mmap_path)):
+                seconds, peak = measure(func)
+                print(f"{label:<27} {name:<9} {seconds:6.2f} s  heap peak {peak / 2**20:8.1f} MiB")
+            shutil.rmtree(work)
@@ -0,0 +1,40 @@
+"""
+Throughput of parallel.run_parallel over many per-region extracts as the worker count grows.
+
+run from the repository root:
+    python -m benchmarks.parallel
+"""
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.batched_imputation import tile
+from design_patterns.parallel import run_parallel
+from design_patterns.template_pattern import ProcessData
+
+
+def row_count(df: pd.DataFrame) -> int:
+    """
+    Worker-side reduction so only a number travels back to the parent.
+    """
+    return len(df)
+
+
+if __name__ == "__main__":
+    files = 32
+    with tempfile.TemporaryDirectory() as tmp:
+        extract = tile(pd.read_csv("data/car_insurance.csv"), 200_000)
+        for i in range(files):
+            extract.to_csv(os.path.join(tmp, f"region_{i:03}.csv"), index=False)
+        pattern = os.path.join(tmp, "region_*.csv")
+
+        workers = 1
+        while workers <= os.cpu_count():
+            start = time.perf_counter()
+            results = list(run_parallel(ProcessData(), pattern, workers=workers, ordered=False, reduce=row_count))
+            seconds = time.perf_counter() - start
+            assert all(result.ok for result in results)
+            print(f"{workers:>3} workers: {seconds:6.2f} s, {files / seconds:6.2f} files/s")
+            workers *= 2
@@ -0,0 +1,66 @@
+"""
+Benchmark of one dataframe over a PolicyStore against concatenating the get_info
+frames of individual AutoInsurance and HomeInsurance objects.
+
+run from the repository root:
+    python -m benchmarks.policy_store
+"""
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from design_patterns.oops import AutoInsurance, HomeInsurance
+from design_patterns.policy_store import PolicyStore
+
+
+def policies(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    makes = [("Toyota", "Corolla"), ("Ford", "Mustang"), ("Honda", "Civic"), ("Tesla", "Model 3")]
+    result = []
+    for i in range(count):
+        start = f"2024-{rng.integers(1, 13):02d}-01"
+        if i % 2:
+            make, model = makes[rng.integers(len(makes))]
+            result.append(AutoInsurance(f"{i:010d}", f"holder {i}", "Auto", start, "2024-12-31", make, model,
+                                        int(rng.integers(2000, 2025))))
+        else:
+            result.append(HomeInsurance(f"{i:010d}", f"holder {i}", "Home", start, "2024-12-31",
+                                        f"{i} Main St", int(rng.integers(50_000, 1_000_000))))
+    return result
+
+
+if __name__ == "__main__":
+    book = policies(1_000_000)
+
+    sample = book[:5_000]
+    start = time.perf_counter()
+    per_object = pd.concat([policy.get_info() for policy in sample], ignore_index=True)
+    per_object_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store = PolicyStore.from_policies(book)
+    build_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    frame = store.to_frame()
+    frame_seconds = time.perf_counter() - start
+
+    # same values as the per-object frames
+    assert (frame["Policy Number"][:len(sample)] == per_object["Policy Number"]).all()
+    assert np.shares_memory(frame["Home Value"].array._data, store._values["home_value"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "policies.csv")
+        frame.to_csv(path, index=False)
+        start = time.perf_counter()
+        loaded = PolicyStore.from_csv(path)
+        csv_seconds = time.perf_counter() - start
+        assert len(loaded) == len(store)
+
+    per_policy = per_object_seconds / len(sample)
+    print(f"get_info + concat   {per_policy * 1e6:8.1f} us/policy, {per_policy * len(book):8.1f} s for {len(book)} (extrapolated)")
+    print(f"PolicyStore build   {build_seconds / len(book) * 1e6:8.1f} us/policy, {build_seconds:8.2f} s")
+    print(f"PolicyStore frame   {frame_seconds * 1e3:8.2f} ms for {len(book)} policies")
+    print(f"PolicyStore csv     {csv_seconds:8.2f} s for {len(book)} policies")
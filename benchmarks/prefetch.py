@@ -0,0 +1,52 @@
+"""
+Benchmark of ExploratoryDataAnalysis.run_pipelines, which loads the next files in a
+background thread, against calling run_pipeline on each file in turn.
+
+run from the repository root:
+    python -m benchmarks.prefetch
+"""
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.batched_imputation import tile
+from design_patterns.template_pattern import ProcessData
+
+
+class SlowerProcessData(ProcessData):
+    """
+    ProcessData with some extra compute per file, standing in for heavier cleaning.
+    """
+
+    def handle_missing(self, df):
+        df = super().handle_missing(df)
+        df["credit_score"] = df["credit_score"].rolling(50, min_periods=1).median()
+        return df
+
+
+if __name__ == "__main__":
+    files = 8
+    with tempfile.TemporaryDirectory() as tmp:
+        extract = tile(pd.read_csv("data/car_insurance.csv"), 300_000)
+        paths = []
+        for i in range(files):
+            paths.append(os.path.join(tmp, f"region_{i}.csv"))
+            extract.to_csv(paths[-1], index=False)
+
+        for engine in ("c", "pyarrow"):
+            pipeline = SlowerProcessData(engine=engine)
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                for path in paths:
+                    pipeline.run_pipeline(path)
+                sequential = time.perf_counter() - start
+
+                start = time.perf_counter()
+                for _ in pipeline.run_pipelines(paths, prefetch=2):
+                    pass
+                prefetched = time.perf_counter() - start
+            print(f"{engine:>8} engine: sequential {sequential:6.2f} s, prefetched {prefetched:6.2f} s")
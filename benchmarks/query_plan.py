@@ -0,0 +1,54 @@
+"""
+Benchmark of the lazy ProcessData run, which loads and processes only the selected
+columns, against the eager run on a wide extract.
+
+run from the repository root:
+    python -m benchmarks.query_plan
+"""
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.suite import generate
+from design_patterns.template_pattern import ProcessData
+
+SELECT = ["vehicle_type", "vehicle_year", "annual_mileage"]
+
+
+def timed(pipeline, path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        df = pipeline.run_pipeline(path)
+        seconds = time.perf_counter() - start
+        tracemalloc.start()
+        pipeline.run_pipeline(path)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return df, seconds, peak
+
+
+if __name__ == "__main__":
+    rows = 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        # a wide extract: the insurance columns plus 30 numeric ones nobody reads
+        df = generate(rows)
+        rng = np.random.default_rng(0)
+        extra = pd.DataFrame(rng.random((rows, 30)).round(4), columns=[f"feature_{i}" for i in range(30)])
+        path = os.path.join(tmp, "wide.csv")
+        pd.concat([df, extra], axis=1).to_csv(path, index=False)
+
+        eager, eager_seconds, eager_peak = timed(ProcessData(), path)
+        lazy_pipeline = ProcessData(lazy=True, select=SELECT)
+        lazy, lazy_seconds, lazy_peak = timed(lazy_pipeline, path)
+        pd.testing.assert_frame_equal(eager[SELECT], lazy[SELECT])
+
+        print(lazy_pipeline.plan().explain())
+        print(f"eager {eager_seconds:6.2f} s  peak {eager_peak / 2**20:7.1f} MiB  {eager.shape[1]} columns")
+        print(f"lazy  {lazy_seconds:6.2f} s  peak {lazy_peak / 2**20:7.1f} MiB  {lazy.shape[1]} columns")
+        print(f"speedup {eager_seconds / lazy_seconds:.1f}x")
@@ -0,0 +1,80 @@
+"""
+Benchmark of RunningMoments, the single-pass statistics behind AvgCalculator, against
+the previous AvgCalculator walking a list twice in Python.
+
+run from the repository root:
+    python -m benchmarks.running_moments
+    python -m benchmarks.running_moments --values 10000000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from design_patterns.running_stats import RunningMoments
+
+
+class ListAvgCalculator:
+    """
+    The previous oops.AvgCalculator, kept as the baseline.
+    """
+
+    def __init__(self, numbers):
+        self.numbers = numbers
+
+    def total(self):
+        total = 0
+        for number in self.numbers:
+            total += number
+        return total
+
+    def length(self):
+        length = 0
+        for number in self.numbers:
+            length += 1
+        return length
+
+    def avg(self):
+        return self.total() / self.length()
+
+
+def blocks(count: int, size: int = 1 << 20, seed: int = 0):
+    # values around a large offset, where naive sums of squares lose the variance
+    rng = np.random.default_rng(seed)
+    for start in range(0, count, size):
+        yield rng.normal(1e9, 1.0, min(size, count - start))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--values", type=int, default=100_000_000)
+    parser.add_argument("--list-values", type=int, default=5_000_000, help="values given to the list baseline")
+    args = parser.parse_args()
+
+    moments = RunningMoments()
+    naive_sum = naive_squares = 0.0
+    # only the updates are timed, not generating the blocks
+    moments_seconds = 0.0
+    for block in blocks(args.values):
+        start = time.perf_counter()
+        moments.update(block)
+        moments_seconds += time.perf_counter() - start
+    for block in blocks(args.values):
+        naive_sum += block.sum()
+        naive_squares += np.square(block).sum()
+    naive_variance = naive_squares / args.values - (naive_sum / args.values) ** 2
+
+    numbers = next(blocks(args.list_values, size=args.list_values)).tolist()
+    start = time.perf_counter()
+    ListAvgCalculator(numbers).avg()
+    list_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    RunningMoments().update(iter(numbers)).value()
+    iterator_seconds = time.perf_counter() - start
+
+    print(f"RunningMoments, numpy blocks {args.values / moments_seconds / 1e6:8.1f} M values/s "
+          f"({moments_seconds:.2f} s for {args.values})")
+    print(f"RunningMoments, iterator     {args.list_values / iterator_seconds / 1e6:8.1f} M values/s")
+    print(f"previous AvgCalculator, list {args.list_values / list_seconds / 1e6:8.1f} M values/s "
+          f"({list_seconds * args.values / args.list_values:.1f} s extrapolated to {args.values}, plus the list)")
+    print(f"variance of N(1e9, 1): RunningMoments {moments.variance():.6f}, naive sum of squares {naive_variance:.1f}")
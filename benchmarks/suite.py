@@ -0,0 +1,217 @@
+"""
+Benchmark suite of every missing value strategy and both template pipelines on synthetic,
+insurance-shaped data, with results stored as json so commits can be compared.
+
+run from the repository root:
+    python -m benchmarks.suite                                  # 10k and 1M rows
+    python -m benchmarks.suite --rows 10000 1000000 50000000
+    python -m benchmarks.suite --compare benchmarks/results/<commit>.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from design_patterns import strategy_pattern, template_pattern
+from design_patterns.private_method import private
+from design_patterns.public_method import public
+
+# constructor arguments of the strategies that need some
+STRATEGY_ARGS = {
+    "GroupedStrategy": {"by": ["income", "age"]},
+}
+
+
+def generate(rows: int, null_ratio: float = 0.1, postal_codes: int = 4, seed: int = 0) -> pd.DataFrame:
+    """
+    Synthetic data with the columns and value domains of data/car_insurance.csv.
+
+    args:
+        rows: int - number of rows
+        null_ratio: float - share of missing values in credit_score and annual_mileage
+        postal_codes: int - cardinality of postal_code
+        seed: int - random seed
+    returns:
+        pandas.DataFrame
+    """
+    rng = np.random.default_rng(seed)
+
+    def choice(values):
+        return np.asarray(values, dtype=object)[rng.integers(0, len(values), rows)]
+
+    def flag():
+        return rng.integers(0, 2, rows)
+
+    df = pd.DataFrame({
+        "id": rng.permutation(rows),
+        "age": rng.integers(0, 4, rows),
+        "gender": flag(),
+        "driving_experience": choice(["0-9y", "10-19y", "20-29y", "30y+"]),
+        "education": choice(["high school", "none", "university"]),
+        "income": choice(["upper class", "poverty", "working class", "middle class"]),
+        "credit_score": rng.beta(5, 5, rows),
+        "vehicle_ownership": flag().astype(float),
+        "vehicle_year": choice(["after 2015", "before 2015"]),
+        "married": flag().astype(float),
+        "children": flag().astype(float),
+        "postal_code": 10000 + rng.integers(0, postal_codes, rows),
+        "annual_mileage": np.round(rng.normal(11700, 2800, rows), -3),
+        "vehicle_type": choice(["sedan", "sports car"]),
+        "speeding_violations": rng.poisson(1.5, rows),
+        "duis": rng.poisson(0.25, rows),
+        "past_accidents": rng.poisson(1.0, rows),
+        "outcome": flag().astype(float),
+    })
+    for column in ("credit_score", "annual_mileage"):
+        df.loc[rng.random(rows) < null_ratio, column] = np.nan
+    return df
+
+
+def strategy_classes():
+    """
+    Every concrete MissingValueStrategy of strategy_pattern.py and public_method/public.py.
+    """
+    classes = []
+    for module in (strategy_pattern, public):
+        pending = list(module.MissingValueStrategy.__subclasses__())
+        while pending:
+            cls = pending.pop(0)
+            pending.extend(cls.__subclasses__())
+            if not getattr(cls, "__abstractmethods__", None) and cls.__module__ == module.__name__:
+                classes.append((module.__name__.split(".")[-1], cls))
+    return classes
+
+
+def measure(func, setup, trace_memory: bool) -> dict:
+    """
+    Wall time of one call on a fresh setup() argument, and its traced heap peak.
+
+    args:
+        func: callable - the measured call
+        setup: callable - builds the argument, not measured
+        trace_memory: bool - run a second, traced call to measure the heap peak
+    returns:
+        dict - seconds and peak_bytes
+    """
+    arg = setup()
+    start = time.perf_counter()
+    func(arg)
+    seconds = time.perf_counter() - start
+    peak = None
+    if trace_memory:
+        arg = setup()
+        tracemalloc.start()
+        func(arg)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"seconds": seconds, "peak_bytes": peak}
+
+
+def run(rows_list, null_ratio: float, postal_codes: int, trace_memory: bool) -> list:
+    """
+    Measure every strategy on credit_score and both pipelines at each size.
+
+    returns:
+        list - one dict per (benchmark, rows)
+    """
+    results = []
+    for rows in rows_list:
+        df = generate(rows, null_ratio, postal_codes)
+        for module, cls in strategy_classes():
+            strategy = cls(**STRATEGY_ARGS.get(cls.__name__, {}))
+            result = measure(lambda frame: strategy.handle_missing(frame, "credit_score"), df.copy, trace_memory)
+            results.append({"benchmark": f"{module}.{cls.__name__}", "rows": rows, **result})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "car_insurance.csv")
+            df.to_csv(path, index=False)
+            for name, pipeline in (
+                ("template_pattern.ProcessData", template_pattern.ProcessData()),
+                ("private.ProcessData", private.ProcessData(plot_dir=tmp)),
+            ):
+                def run_pipeline(path):
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        if isinstance(pipeline, private.DataPreprocessing):
+                            # the private pipeline renders its plot off-thread, wait for it
+                            _, plot = pipeline.run_pipeline_with_plot(path)
+                            if plot is not None:
+                                plot.result()
+                        else:
+                            pipeline.run_pipeline(path)
+
+                result = measure(run_pipeline, lambda: path, trace_memory)
+                results.append({"benchmark": name, "rows": rows, **result})
+
+        for result in results:
+            if result["rows"] == rows:
+                result["rows_per_second"] = rows / result["seconds"]
+                print(
+                    f"{result['benchmark']:<40} {rows:>10} rows {result['seconds'] * 1e3:10.1f} ms "
+                    f"{result['rows_per_second'] / 1e6:8.2f} M rows/s"
+                    + (f" peak {result['peak_bytes'] / 2**20:9.1f} MiB" if result["peak_bytes"] is not None else "")
+                )
+    return results
+
+
+def current_commit() -> str:
+    """
+    Hash of the checked out commit, "unknown" outside a git checkout.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: list, baseline_path: str) -> None:
+    """
+    Print the time ratio of each benchmark against a previous results file.
+    """
+    with open(baseline_path) as f:
+        baseline = {(r["benchmark"], r["rows"]): r for r in json.load(f)["results"]}
+    print(f"\nagainst {baseline_path} (ratio > 1 is slower now)")
+    for result in results:
+        old = baseline.get((result["benchmark"], result["rows"]))
+        if old is not None:
+            print(f"{result['benchmark']:<40} {result['rows']:>10} rows {result['seconds'] / old['seconds']:6.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--null-ratio", type=float, default=0.1)
+    parser.add_argument("--postal-codes", type=int, default=4)
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced run measuring heap peaks")
+    parser.add_argument("--output", help="json file, benchmarks/results/<commit>.json by default")
+    parser.add_argument("--compare", help="previous json file to compare against")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.null_ratio, args.postal_codes, not args.no_memory)
+    commit = current_commit()
+    output = args.output or os.path.join("benchmarks", "results", f"{commit}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "commit": commit,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "null_ratio": args.null_ratio,
+            "postal_codes": args.postal_codes,
+            "results": results,
+        }, f, indent=2)
+    print(f"results written to {output}")
+    if args.compare:
+        compare(results, args.compare)
@@ -0,0 +1,60 @@
+"""
+Benchmark of BatchTokenizer against one Tokenizer per document: documents per second
+and bytes per token, both retained by the output and at the traced heap peak.
+
+run from the repository root:
+    python -m benchmarks.tokenizer
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from design_patterns.oops import Tokenizer
+from design_patterns.tokenizer import BatchTokenizer
+
+
+def corpus(documents: int, words: int = 50_000, length: int = 40, seed: int = 0):
+    # zipf-distributed words, like natural text
+    rng = np.random.default_rng(seed)
+    vocabulary = np.array([f"w{i}" for i in range(words)])
+    for _ in range(documents):
+        ranks = np.minimum(rng.zipf(1.2, length), words) - 1
+        yield " ".join(vocabulary[ranks])
+
+
+def measure(func):
+    """
+    Seconds of one call, then the bytes its result retains and the heap peak of a traced call.
+    """
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    result = func()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return seconds, retained, peak
+
+
+if __name__ == "__main__":
+    documents = 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus.txt")
+        with open(path, "w") as f:
+            f.writelines(document + "\n" for document in corpus(documents))
+        tokens = sum(len(line.split()) for line in open(path))
+
+        cases = {
+            "Tokenizer per document": lambda: [Tokenizer(line).tokenize() for line in open(path)],
+            "BatchTokenizer": lambda: BatchTokenizer().tokenize(path),
+            "BatchTokenizer, 2 workers": lambda: BatchTokenizer(workers=2).tokenize(path),
+        }
+        print(f"{documents} documents, {tokens} tokens, {os.cpu_count()} cpu")
+        for name, func in cases.items():
+            seconds, retained, peak = measure(func)
+            print(f"{name:<26} {documents / seconds:10.0f} docs/s  "
+                  f"{retained / tokens:6.1f} B/token retained  {peak / tokens:6.1f} B/token peak")
@@ -0,0 +1,48 @@
+"""
+Benchmark of typed_loader.read_typed_csv against a bare pandas.read_csv:
+parse time and memory footprint of the loaded frame.
+
+run from the repository root:
+    python -m benchmarks.typed_loader
+"""
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.batched_imputation import tile
+from design_patterns.typed_loader import read_typed_csv
+
+PATH = "data/car_insurance.csv"
+
+
+def measure(load, path: str, repeat: int = 3):
+    """
+    Best parse time in seconds and deep memory usage in bytes of a loader.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = load(path)
+        times.append(time.perf_counter() - start)
+    return min(times), int(df.memory_usage(deep=True).sum())
+
+
+if __name__ == "__main__":
+    loaders = {
+        "read_csv": pd.read_csv,
+        "typed c": read_typed_csv,
+        "typed pyarrow": lambda path: read_typed_csv(path, engine="pyarrow"),
+        "typed c, 3 columns": lambda path: read_typed_csv(
+            path, usecols=["annual_mileage", "vehicle_type", "vehicle_year"]
+        ),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        large = os.path.join(tmp, "car_insurance_1m.csv")
+        tile(pd.read_csv(PATH), 1_000_000).to_csv(large, index=False)
+        for path, label in ((PATH, "10k rows"), (large, "1M rows")):
+            print(label)
+            for name, load in loaders.items():
+                seconds, size = measure(load, path)
+                print(f"  {name:<20} {seconds * 1e3:8.1f} ms {size / 2**20:8.2f} MiB")
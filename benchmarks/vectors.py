@@ -0,0 +1,58 @@
+"""
+Benchmark of VectorArray against Vector objects for bulk arithmetic: throughput, the
+memory blocks the result holds and the heap peak, counted with tracemalloc.
+
+run from the repository root:
+    python -m benchmarks.vectors
+"""
+import functools
+import operator
+import time
+import tracemalloc
+
+import numpy as np
+
+from design_patterns.oops import Vector
+from design_patterns.vectors import VectorArray
+
+
+def measure(func):
+    """
+    Seconds of one call, then the blocks its result holds and the heap peak of a traced call.
+    """
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func()
+    after = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    return seconds, blocks, peak
+
+
+if __name__ == "__main__":
+    count = 1_000_000
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(count, 2))
+    vectors = [Vector(x, y) for x, y in data.tolist()]
+    others = [Vector(x, y) for x, y in rng.normal(size=(count, 2)).tolist()]
+    array, other_array = VectorArray(data), VectorArray.from_vectors(others)
+
+    cases = {
+        "sum": (lambda: functools.reduce(operator.add, vectors), lambda: array.sum()),
+        "pairwise +": (lambda: [a + b for a, b in zip(vectors, others)], lambda: array + other_array),
+        "pairwise *": (lambda: [a * b for a, b in zip(vectors, others)], lambda: array * other_array),
+        "dot": (lambda: [a.x * b.x + a.y * b.y for a, b in zip(vectors, others)], lambda: array.dot(other_array)),
+        "norm": (lambda: [(a.x * a.x + a.y * a.y) ** 0.5 for a in vectors], lambda: array.norm()),
+    }
+    print(f"{count} vectors")
+    for name, (objects, batched) in cases.items():
+        object_seconds, object_blocks, object_peak = measure(objects)
+        array_seconds, array_blocks, array_peak = measure(batched)
+        print(f"{name:<11} Vector {object_seconds * 1e3:8.1f} ms {object_blocks:>8} blocks {object_peak / 2**20:7.1f} MiB | "
+              f"VectorArray {array_seconds * 1e3:7.2f} ms {array_blocks:>3} blocks {array_peak / 2**20:6.1f} MiB "
+              f"({object_seconds / array_seconds:.0f}x)")
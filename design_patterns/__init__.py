@@ -0,0 +1,67 @@
+"""
+Design patterns in Python, applied to cleaning the car insurance data.
+
+The public classes are importable from the package itself, e.g.
+`from design_patterns import MeanStrategy`. Each name imports its module on first
+access only, and pandas, numpy and matplotlib are imported when first used, so
+importing the strategy or template API does not pay for them.
+"""
+import importlib
+
+# module defining each public name
+_EXPORTS = {
+    "MissingValueStrategy": "strategy_pattern",
+    "DropStrategy": "strategy_pattern",
+    "MeanStrategy": "strategy_pattern",
+    "MedianStrategy": "strategy_pattern",
+    "ConstantStrategy": "strategy_pattern",
+    "GroupedStrategy": "strategy_pattern",
+    "AutoStrategy": "strategy_pattern",
+    "DataHandlerContext": "strategy_pattern",
+    "ExploratoryDataAnalysis": "template_pattern",
+    "ProcessData": "template_pattern",
+    "CategoricalEncoder": "encoders",
+    "OrdinalEncoder": "encoders",
+    "OneHotEncoder": "encoders",
+    "FrequencyEncoder": "encoders",
+    "EncoderContext": "encoders",
+    "RunningMean": "running_stats",
+    "RunningMoments": "running_stats",
+    "ExactMedian": "running_stats",
+    "QuantileSketch": "running_stats",
+    "profile_of": "column_profile",
+    "Operation": "query_plan",
+    "QueryPlan": "query_plan",
+    "StepHook": "profiling",
+    "CallbackHook": "profiling",
+    "StepProfiler": "profiling",
+    "CAR_INSURANCE_DTYPES": "typed_loader",
+    "read_typed_csv": "typed_loader",
+    "LoadCache": "load_cache",
+    "IncrementalRunner": "incremental",
+    "FileResult": "parallel",
+    "run_parallel": "parallel",
+    "NpyColumn": "numpy_backend",
+    "NpyFrame": "numpy_backend",
+    "PolicyStore": "policy_store",
+    "PolicyView": "policy_store",
+    "CarFleet": "fleet",
+    "VectorArray": "vectors",
+    "Vocabulary": "tokenizer",
+    "TokenBatch": "tokenizer",
+    "BatchTokenizer": "tokenizer",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,28 @@
+import importlib
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported on first attribute access, so
+    `pd = LazyModule("pandas")` at the top of a module costs nothing until pandas
+    is actually used. Attributes are cached on the instance once resolved.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the stand-in without importing anything.
+
+        args:
+            name: str - module to import on first use
+        returns:
+            None
+        """
+        self._name = name
+
+    def __getattr__(self, attr: str):
+        value = getattr(importlib.import_module(self._name), attr)
+        setattr(self, attr, value)
+        return value
+
+    def __repr__(self):
+        return f"<lazy module '{self._name}'>"
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import weakref
+from functools import cached_property
+
+from ._lazy import LazyModule
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+
+def _same_values(a, b) -> bool:
+    """
+    True when two columns wrap the same stored array. A numpy column comes back as a
+    new view on every df[column], so numpy arrays are compared by buffer and layout.
+    """
+    if isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
+        return (
+            a.__array_interface__["data"] == b.__array_interface__["data"]
+            and a.shape == b.shape
+            and a.strides == b.strides
+            and a.dtype == b.dtype
+        )
+    return a is b
+
+
+def _is_current(profile: "ColumnProfile", values) -> bool:
+    """
+    True when a profile was computed from the values df[column] returns now.
+    Columns of other backends, e.g. numpy_backend.NpyColumn, are written in place and
+    count their writes in version instead.
+    """
+    if isinstance(values, pd.Series) and isinstance(profile.values, pd.Series):
+        return _same_values(profile.values._values, values._values)
+    return profile.values is values and profile.version == getattr(values, "version", None)
+
+
+class ColumnProfile:
+    """
+    Lazily computed summary of one column. Every statistic is computed on first
+    access and reused afterwards, so checks sharing a profile scan the column once.
+    """
+
+    def __init__(self, values: pd.Series):
+        """
+        Initialize the profile of a column, computing nothing yet.
+
+        args:
+            values: pandas.Series - the column
+        returns:
+            None
+        """
+        self.values = values
+        self.version = getattr(values, "version", None)
+
+    @cached_property
+    def null_mask(self) -> np.ndarray:
+        """
+        Boolean mask of the missing values.
+        """
+        return self.values.isna().to_numpy()
+
+    @cached_property
+    def null_count(self) -> int:
+        """
+        Number of missing values.
+        """
+        return int(self.null_mask.sum())
+
+    @property
+    def size(self) -> int:
+        """
+        Number of rows.
+        """
+        return len(self.values)
+
+    @property
+    def null_ratio(self) -> float:
+        """
+        Share of missing values.
+        """
+        return self.null_count / self.size if self.size else 0.0
+
+    @property
+    def is_numeric(self) -> bool:
+        """
+        True for numeric dtypes.
+        """
+        return pd.api.types.is_numeric_dtype(self.values.dtype)
+
+    @cached_property
+    def min(self):
+        """
+        Smallest non-null value.
+        """
+        return self.values.min()
+
+    @cached_property
+    def max(self):
+        """
+        Largest non-null value.
+        """
+        return self.values.max()
+
+    @cached_property
+    def mean(self) -> float:
+        """
+        Mean of the non-null values, NaN for non-numeric columns.
+        """
+        return self.values.mean() if self.is_numeric else float("nan")
+
+    @cached_property
+    def skew(self) -> float:
+        """
+        Sample skewness of the non-null values, NaN for non-numeric columns.
+        """
+        return float(self.values.skew()) if self.is_numeric else float("nan")
+
+    @cached_property
+    def cardinality(self) -> int:
+        """
+        Number of distinct non-null values.
+        """
+        return int(self.values.nunique())
+
+
+class FrameProfile:
+    """
+    Column profiles of one dataframe, created on first use of each column.
+    A profile is reused only while df[column] still wraps the array it was computed
+    from. Any write to the frame (assigning a column, dropping rows, or .loc on a
+    column the profile references, which copy-on-write turns into a new array)
+    gives the column a new array, so the next lookup recomputes from the new values.
+    invalidate frees stale profiles right away.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Initialize an empty profile of a dataframe.
+
+        args:
+            df: pandas.DataFrame - the profiled dataframe
+        returns:
+            None
+        """
+        self._frame = weakref.ref(df)
+        self._columns = {}
+
+    def column(self, column: str) -> ColumnProfile:
+        """
+        Profile of a column, created on first use.
+
+        args:
+            column: str - column name
+        returns:
+            ColumnProfile
+        """
+        df = self._frame()
+        values = df[column]
+        profile = self._columns.get(column)
+        if profile is None or not _is_current(profile, values):
+            if profile is not None:
+                # the frame was written: drop every stale profile, not only this one
+                self._columns = {
+                    name: kept for name, kept in self._columns.items()
+                    if name in df.columns and _is_current(kept, df[name])
+                }
+            profile = self._columns[column] = ColumnProfile(values)
+        return profile
+
+    def invalidate(self, column: str = None) -> None:
+        """
+        Forget the profile of a written column, or of every column when None.
+
+        args:
+            column: str - written column, None after rows were added or dropped
+        returns:
+            None
+        """
+        if column is None:
+            self._columns.clear()
+        else:
+            self._columns.pop(column, None)
+
+
+# profiles shared by every strategy, keyed by the id of their live dataframe
+_profiles = {}
+
+
+def profile_of(df: pd.DataFrame) -> FrameProfile:
+    """
+    The profile shared by every check on this dataframe, dropped with the dataframe.
+
+    args:
+        df: pandas.DataFrame - the profiled dataframe
+    returns:
+        FrameProfile
+    """
+    profile = _profiles.get(id(df))
+    if profile is None or profile._frame() is not df:
+        profile = _profiles[id(df)] = FrameProfile(df)
+        weakref.finalize(df, _profiles.pop, id(df), None)
+    return profile
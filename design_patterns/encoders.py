@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from ._lazy import LazyModule
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+
+def _positions(series: pd.Series, categories: pd.Index) -> np.ndarray:
+    """
+    Position of every value of the series in the fitted categories, -1 for unseen values and NaN.
+    Categorical series are resolved through their codes, so only the categories are hashed.
+
+    args:
+        series: pandas.Series - values to look up
+        categories: pandas.Index - fitted categories
+    returns:
+        numpy.ndarray - position per row
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        remap = np.append(categories.get_indexer(series.cat.categories), -1)
+        return remap[series.cat.codes.to_numpy()]
+    return categories.get_indexer(series)
+
+
+def _compact(values: np.ndarray) -> np.ndarray:
+    """
+    The values cast to the smallest integer dtype holding them.
+    """
+    return values.astype(np.result_type(np.min_scalar_type(values.min()), np.min_scalar_type(values.max())))
+
+
+# abstract base class for categorical encoders
+class CategoricalEncoder(ABC):
+    """
+    The Strategy interface of the categorical encoders.
+    An encoder is fitted once on the categories of a column, then applied to any
+    number of frames through vectorized lookups. Unseen categories always map to
+    the same documented value instead of NaN.
+    """
+
+    @abstractmethod
+    def fit(self, series: pd.Series) -> "CategoricalEncoder":
+        """
+        The abstract method to learn the categories of a column.
+
+        args:
+            series: pandas.Series - column to learn from
+        returns:
+            CategoricalEncoder - self
+        """
+        pass
+
+    @abstractmethod
+    def transform(self, series: pd.Series):
+        """
+        The abstract method to encode a column.
+
+        args:
+            series: pandas.Series - column to encode
+        returns:
+            pandas.Series | pandas.DataFrame - encoded column(s)
+        """
+        pass
+
+
+class OrdinalEncoder(CategoricalEncoder):
+    """
+    Encodes each category as an integer, either from an explicit mapping or by sorted order.
+    Unseen categories and NaN become unknown_value.
+    """
+
+    def __init__(self, mapping: Optional[Dict] = None, unknown_value: int = -1):
+        """
+        Initialize the encoder, already fitted when a mapping is given.
+
+        args:
+            mapping: Dict - code per category, learned by fit when None
+            unknown_value: int - code of unseen categories
+        returns:
+            None
+        """
+        self.unknown_value = unknown_value
+        if mapping is not None:
+            self._set_mapping(mapping)
+
+    def _set_mapping(self, mapping: Dict) -> None:
+        self.categories_ = pd.Index(list(mapping))
+        # the last slot is hit by position -1, i.e. by unseen categories
+        self.lookup_ = _compact(np.array(list(mapping.values()) + [self.unknown_value]))
+
+    def fit(self, series):
+        categories = pd.Series(series.dropna().unique()).sort_values()
+        self._set_mapping({category: code for code, category in enumerate(categories)})
+        return self
+
+    def transform(self, series):
+        return pd.Series(self.lookup_[_positions(series, self.categories_)], index=series.index, name=series.name)
+
+
+class OneHotEncoder(CategoricalEncoder):
+    """
+    Encodes each category as its own 0/1 column named <column>_<category>.
+    Unseen categories and NaN are all zeros.
+    """
+
+    def fit(self, series):
+        self.categories_ = pd.Index(pd.Series(series.dropna().unique()).sort_values())
+        return self
+
+    def transform(self, series):
+        positions = _positions(series, self.categories_)
+        rows = np.flatnonzero(positions >= 0)
+        encoded = np.zeros((len(series), len(self.categories_)), dtype=np.int8)
+        encoded[rows, positions[rows]] = 1
+        columns = [f"{series.name}_{category}" for category in self.categories_]
+        return pd.DataFrame(encoded, index=series.index, columns=columns)
+
+
+class FrequencyEncoder(CategoricalEncoder):
+    """
+    Encodes each category as its relative frequency in the fitted column.
+    Unseen categories and NaN are 0.0.
+    """
+
+    def fit(self, series):
+        frequencies = series.value_counts(normalize=True, sort=False)
+        self.categories_ = pd.Index(frequencies.index)
+        self.lookup_ = np.append(frequencies.to_numpy(dtype=np.float32), np.float32(0.0))
+        return self
+
+    def transform(self, series):
+        return pd.Series(self.lookup_[_positions(series, self.categories_)], index=series.index, name=series.name)
+
+
+# context class selecting an encoder per column
+class EncoderContext:
+    """
+    The Context class holding one encoder per column.
+    """
+
+    def __init__(self, encoders: Dict[str, CategoricalEncoder]):
+        """
+        Initialize the context with an encoder per column.
+
+        args:
+            encoders: Dict[str, CategoricalEncoder] - encoder per column
+        returns:
+            None
+        """
+        self.encoders = encoders
+
+    def fit(self, df: pd.DataFrame) -> "EncoderContext":
+        """
+        Fit every encoder on its column.
+
+        args:
+            df: pandas.DataFrame - reference dataframe
+        returns:
+            EncoderContext - self
+        """
+        for column, encoder in self.encoders.items():
+            encoder.fit(df[column])
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Encode every column in place. Encoders returning several columns replace
+        the original column with them.
+
+        args:
+            df: pandas.DataFrame - dataframe to encode
+        returns:
+            pandas.DataFrame - dataframe with the columns encoded
+        """
+        for column, encoder in self.encoders.items():
+            encoded = encoder.transform(df[column])
+            if isinstance(encoded, pd.DataFrame):
+                df.drop(columns=[column], inplace=True)
+                df[encoded.columns] = encoded
+            else:
+                df[column] = encoded
+        return df
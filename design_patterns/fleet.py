@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import numbers
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+
+from ._lazy import LazyModule
+from .oops import Car, ElectricCar
+
+np = LazyModule("numpy")
+
+
+def _integers(values, dtype) -> np.ndarray:
+    """
+    Values as an integer array, raising ValueError instead of truncating a fraction
+    or wrapping around a value out of the dtype's range.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind not in "iu" and values.size:
+        if values.dtype.kind != "f" or not np.all(np.isfinite(values) & (values == np.round(values))):
+            raise ValueError(f"expected integers, got {values.dtype} values")
+    info = np.iinfo(dtype)
+    if values.size and (values.min() < info.min or values.max() > info.max):
+        raise ValueError(f"values out of the {np.dtype(dtype)} range [{info.min}, {info.max}]")
+    return values.astype(dtype)
+
+
+def _numbers(values):
+    """
+    Numbers as a float64 array, and a mask of the ones given as integers, so they read
+    back and print as the ints they were instead of as floats.
+    """
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64), np.full(len(values), values.dtype.kind in "iu")
+    values = list(values)
+    integral = np.fromiter((isinstance(value, numbers.Integral) for value in values), dtype=bool, count=len(values))
+    return np.asarray(values, dtype=np.float64), integral
+
+
+def _field(name: str) -> property:
+    """
+    Property reading and writing one element of a fleet array, as a Python scalar of
+    the type it was given as.
+    """
+
+    def get(self):
+        value = self.fleet.columns[name][self.index].item()
+        integral = self.fleet.integral.get(name)
+        if integral is not None and integral[self.index]:
+            return int(value)
+        return value
+
+    def set(self, value):
+        fleet = self.fleet
+        values = fleet.columns[name]
+        if values.dtype.kind == "U":
+            # widen fixed-width string arrays instead of truncating a longer value
+            if len(value) > values.dtype.itemsize // 4:
+                values = fleet.columns[name] = values.astype(f"<U{len(value)}")
+            values[self.index] = value
+        elif values.dtype.kind in "iu":
+            values[self.index] = _integers([value], values.dtype)[0]
+        else:
+            values[self.index] = value
+            fleet.integral[name][self.index] = isinstance(value, numbers.Integral)
+
+    return property(get, set)
+
+
+class _FleetView:
+    """
+    Mixin turning a Car class into a view of one row of a CarFleet: its fields are
+    read from and written to the fleet arrays, so the inherited methods work unchanged.
+    """
+
+    __slots__ = ("fleet", "index")
+
+    make = _field("make")
+    model = _field("model")
+    year = _field("year")
+    price = _field("price")
+
+    @classmethod
+    def _view(cls, fleet: "CarFleet", index: int):
+        view = cls.__new__(cls)
+        view.fleet = fleet
+        view.index = index
+        return view
+
+    def current_year(self):
+        # the year the fleet captured, so views agree with the batch results
+        return self.fleet.current_year
+
+
+class CarView(_FleetView, Car):
+    """
+    A Car stored in a CarFleet.
+    """
+
+    __slots__ = ()
+
+
+class ElectricCarView(_FleetView, ElectricCar):
+    """
+    An ElectricCar stored in a CarFleet.
+    """
+
+    __slots__ = ()
+
+    battery_size = _field("battery_size")
+
+
+class CarFleet:
+    """
+    Batch of Car and ElectricCar records held as one typed array per field.
+    Lifespan, inflation and descriptions are computed for the whole fleet in
+    vectorized form, against a current year captured once when the fleet is built
+    instead of once per car. fleet[i] is a Car or ElectricCar view of row i.
+    """
+
+    def __init__(self, make, model, year, price, battery_size=None, current_year: Optional[int] = None):
+        """
+        Initialize the fleet from one sequence per field.
+
+        args:
+            make: sequence of str - makes
+            model: sequence of str - models
+            year: sequence of int - purchase years
+            price: sequence of numbers - prices
+            battery_size: sequence of numbers - battery sizes in kWh, NaN for cars that are
+                not electric; no electric cars when None
+            Prices and battery sizes are stored as float64, remembering which were given
+            as integers so views and descriptions show them as given.
+            current_year: int - year the lifespans are computed against, this year when None
+        returns:
+            None
+        """
+        make = np.asarray(make, dtype=str)
+        if battery_size is None:
+            battery_size = np.full(len(make), np.nan)
+        price, price_integral = _numbers(price)
+        battery_size, battery_integral = _numbers(battery_size)
+        self.columns = {
+            "make": make,
+            "model": np.asarray(model, dtype=str),
+            "year": _integers(year, np.int16),
+            "price": price,
+            "battery_size": battery_size,
+        }
+        # which prices and battery sizes were given as integers
+        self.integral = {"price": price_integral, "battery_size": battery_integral}
+        if len({len(values) for values in self.columns.values()}) != 1:
+            raise ValueError("every field of a CarFleet must have the same length")
+        self.current_year = current_year if current_year is not None else datetime.now().year
+
+    @classmethod
+    def from_cars(cls, cars: Iterable[Car], current_year: Optional[int] = None) -> "CarFleet":
+        """
+        Fleet holding the fields of Car and ElectricCar objects.
+
+        args:
+            cars: Iterable[Car] - the cars
+            current_year: int - year the lifespans are computed against, this year when None
+        returns:
+            CarFleet
+        """
+        cars = list(cars)
+        return cls(
+            [car.make for car in cars],
+            [car.model for car in cars],
+            [car.year for car in cars],
+            [car.price for car in cars],
+            [getattr(car, "battery_size", np.nan) for car in cars],
+            current_year,
+        )
+
+    def __len__(self):
+        return len(self.columns["make"])
+
+    def __getitem__(self, index: int) -> Car:
+        if not -len(self) <= index < len(self):
+            raise IndexError("car index out of range")
+        index %= len(self)
+        view = CarView if np.isnan(self.columns["battery_size"][index]) else ElectricCarView
+        return view._view(self, index)
+
+    def __iter__(self) -> Iterator[Car]:
+        return (self[index] for index in range(len(self)))
+
+    @property
+    def is_electric(self) -> np.ndarray:
+        """
+        Mask of the electric cars.
+        """
+        return ~np.isnan(self.columns["battery_size"])
+
+    def lifespan(self) -> np.ndarray:
+        """
+        Age of every car, as ElectricCar.car_lifespan.
+        """
+        return self.current_year - self.columns["year"].astype(np.int32)
+
+    def inflation(self, inflation_rate: float = 0.05) -> np.ndarray:
+        """
+        Inflation of every price, as ElectricCar.inflation.
+
+        args:
+            inflation_rate: float - yearly inflation rate
+        returns:
+            numpy.ndarray
+        """
+        return self.columns["price"] * inflation_rate
+
+    def descriptions(self) -> List[str]:
+        """
+        Text of every car: ElectricCar.__str__ for electric cars, Car.get_description otherwise.
+        Each string still has to be built on its own, so this is one pass over the
+        columns converted to Python values at once; it measured faster than chaining
+        numpy string additions, which allocate an intermediate array per piece.
+        """
+        columns = self.columns
+        battery = self._scalars("battery_size")
+        battery[~self.is_electric] = None
+        return [
+            f"{year} {make} {model} {price}" if size is None else f"{year} {make} {model} with a {size} kWh battery {price}"
+            for year, make, model, size, price in zip(
+                columns["year"].tolist(), columns["make"].tolist(), columns["model"].tolist(),
+                battery.tolist(), self._scalars("price").tolist(),
+            )
+        ]
+
+    def _scalars(self, name: str) -> np.ndarray:
+        """
+        Object array of a numeric field, holding ints where the values were given as integers.
+        """
+        values, integral = self.columns[name], self.integral[name]
+        scalars = values.astype(object)
+        scalars[integral] = values[integral].astype(np.int64)
+        return scalars
+
+
+#   usage
+if __name__ == "__main__":
+    fleet = CarFleet.from_cars([
+        ElectricCar("Toyota", "Corolla", 2010, 100, 10000),
+        Car("Ford", "Mustang", 2021, 25000),
+    ])
+    print(fleet.lifespan(), fleet.inflation(), fleet.descriptions())
+    car = fleet[0]
+    print(isinstance(car, ElectricCar), car, car.car_lifespan(), car.inflation())
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+from typing import Optional
+
+
+from ._lazy import LazyModule
+from .profiling import StepHook
+from .running_stats import ExactMedian, QuantileSketch, RunningMean, RunningMoments
+
+pd = LazyModule("pandas")
+
+_STATISTICS = {cls.__name__: cls for cls in (RunningMean, RunningMoments, ExactMedian, QuantileSketch)}
+
+
+class _RunningStatisticsHook(StepHook):
+    """
+    Folds the loaded tail into the running statistics right before handle_missing,
+    and hands the updated values to the imputers as their fitted fill values.
+    It also counts the rows loaded from the tail, before any step drops some.
+    """
+
+    def __init__(self, imputers: dict, statistics: dict):
+        """
+        Initialize the hook with the imputers and their running statistics.
+
+        args:
+            imputers: dict - strategy per column of the pipeline
+            statistics: dict - running statistic per column
+        returns:
+            None
+        """
+        self.imputers = imputers
+        self.statistics = statistics
+        self.rows = 0
+
+    def before_step(self, name, data):
+        if name != "handle_missing":
+            return
+        for column, statistic in self.statistics.items():
+            statistic.update(data[column])
+            self.imputers[column].fill_values_[column] = statistic.value()
+
+    def after_step(self, name, result):
+        if name == "load_data":
+            self.rows = len(result)
+
+
+def _running_statistic(strategy, saved: Optional[dict]):
+    """
+    The running statistic of an imputer, restored from its saved state when there is one.
+    An ExactMedian would write every value seen so far to the state on each run, so
+    median imputers get a QuantileSketch instead, whose state stays bounded.
+
+    args:
+        strategy: imputer of the pipeline
+        saved: dict - type and state of the statistic persisted by the previous run, or None
+    returns:
+        running statistic, None when the imputer needs none
+    """
+    statistic = _STATISTICS[saved["type"]].from_state(saved["state"]) if saved else strategy.new_statistic()
+    if isinstance(statistic, ExactMedian):
+        sketch = QuantileSketch(getattr(strategy, "error", 0.01))
+        # a state saved before medians were sketched is folded into the sketch once
+        for part in statistic.parts:
+            sketch.update(part)
+        statistic = sketch
+    return statistic
+
+
+class IncrementalRunner:
+    """
+    Runs a template pipeline only on the rows appended to a csv since the previous run.
+    The watermark is the byte offset of the last complete line processed. It is persisted
+    with the csv header and the running statistics of the pipeline imputers, e.g. the sum
+    and count behind a mean, so each run reads and processes the new tail only.
+    The new rows are imputed with statistics over every row seen so far, the values a full
+    rerun would give them, and encoders with fixed or fitted categories keep their codes.
+    Medians are the exception: they are approximated by a QuantileSketch, within its
+    rank error, so the state does not grow with every row of the file.
+    The index of the new rows continues from the rows of earlier runs, so it is their row
+    number in the file, the index a full rerun gives them.
+    A file that shrank or changed its header is treated as rewritten and processed again
+    from the start.
+    """
+
+    def __init__(self, pipeline, state_path: str):
+        """
+        Initialize the runner on a pipeline and its persisted state.
+
+        args:
+            pipeline: template pipeline with run_pipeline(path) whose loader accepts a
+                file-like buffer, e.g. template_pattern.ProcessData. Its imputers, if any,
+                must define new_statistic() and fill_values_ like strategy_pattern strategies
+            state_path: str - json file holding the watermark and running statistics
+        returns:
+            None
+        """
+        self.pipeline = pipeline
+        self.state_path = state_path
+
+    def _load_state(self, path: str) -> dict:
+        """
+        The persisted state of the csv, an empty state when there is none.
+        """
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                state = json.load(f)
+            if state["path"] == os.path.abspath(path):
+                return state
+        return {"path": os.path.abspath(path), "offset": 0, "header": None, "rows": 0, "statistics": {}}
+
+    def _save_state(self, state: dict) -> None:
+        """
+        Persist the state atomically.
+        """
+        partial = self.state_path + ".tmp"
+        with open(partial, "w") as f:
+            json.dump(state, f)
+        os.replace(partial, self.state_path)
+
+    def run(self, path: str) -> Optional[pd.DataFrame]:
+        """
+        Process the rows appended since the previous run.
+
+        args:
+            path: str - path to the growing csv
+        returns:
+            pandas.DataFrame | None - the newly processed rows indexed by their row number
+                in the file, None when nothing was appended
+        """
+        state = self._load_state(path)
+        with open(path, "rb") as f:
+            header = f.readline()
+            if state["header"] != header.decode() or os.fstat(f.fileno()).st_size < state["offset"]:
+                state = {"path": state["path"], "offset": len(header), "header": header.decode(), "rows": 0, "statistics": {}}
+            f.seek(state["offset"])
+            tail = f.read()
+        # a partially written last line waits for the next run
+        tail = tail[: tail.rfind(b"\n") + 1]
+        if not tail:
+            return None
+
+        imputers = getattr(self.pipeline, "imputers", {})
+        statistics = {}
+        for column, strategy in imputers.items():
+            statistic = _running_statistic(strategy, state["statistics"].get(column))
+            if statistic is not None:
+                statistics[column] = statistic
+
+        hook = _RunningStatisticsHook(imputers, statistics)
+        hooks = self.pipeline.hooks
+        fitted = {column: dict(imputers[column].fill_values_) for column in statistics}
+        self.pipeline.hooks = list(hooks) + [hook]
+        try:
+            df = self.pipeline.run_pipeline(io.BytesIO(header + tail))
+        finally:
+            # leave the pipeline as it was for regular runs
+            self.pipeline.hooks = hooks
+            for column, fill_values in fitted.items():
+                imputers[column].fill_values_ = fill_values
+
+        # row labels of the tail start at 0, the full file numbers them after the rows read before
+        df.index = df.index + state["rows"]
+        state["offset"] += len(tail)
+        state["rows"] += hook.rows
+        state["statistics"] = {
+            column: {"type": type(statistic).__name__, "state": statistic.to_state()}
+            for column, statistic in statistics.items()
+        }
+        self._save_state(state)
+        return df
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Callable
+
+from ._lazy import LazyModule
+
+pd = LazyModule("pandas")
+
+
+
+# columnar cache of parsed csv files
+class LoadCache:
+    """
+    Transparent cache of parsed dataframes stored as uncompressed Feather (Arrow IPC) files.
+    An entry is keyed on the source path, its mtime and size, a hash of its content and
+    the dtype schema it was parsed with, so any change to the file or the schema is a miss.
+    Hits are memory-mapped instead of parsed. The least recently used entries are evicted
+    once the cache directory grows beyond max_bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1 << 30):
+        """
+        Initialize the cache on a directory, created when missing.
+
+        args:
+            cache_dir: str - directory holding the cached entries
+            max_bytes: int - size limit of the directory
+        returns:
+            None
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def load(self, path: str, loader: Callable[[str], pd.DataFrame], schema) -> pd.DataFrame:
+        """
+        Load a csv from the cache, or parse it with loader and cache the result.
+        A cached frame may share read-only memory with the mapped file: steps that
+        assign columns are fine, writing into the existing arrays is not.
+
+        args:
+            path: str - path to the csv
+            loader: Callable[[str], pandas.DataFrame] - parses the csv on a miss
+            schema: json-serializable description of how loader parses, e.g. its dtypes
+        returns:
+            pandas.DataFrame - the parsed dataframe
+        """
+        from pyarrow import feather
+
+        entry = os.path.join(self.cache_dir, self._key(path, schema) + ".feather")
+        if os.path.exists(entry):
+            os.utime(entry)  # mark as recently used
+            return feather.read_table(entry, memory_map=True).to_pandas()
+
+        df = loader(path)
+        partial = entry + ".tmp"
+        feather.write_feather(df, partial, compression="uncompressed")
+        os.replace(partial, entry)
+        self._evict(keep=entry)
+        return df
+
+    def _key(self, path: str, schema) -> str:
+        """
+        Hash of the source path, stat, content and schema.
+
+        args:
+            path: str - path to the csv
+            schema: json-serializable schema
+        returns:
+            str - hex digest naming the entry
+        """
+        stat = os.stat(path)
+        content = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                content.update(block)
+        key = json.dumps(
+            [os.path.abspath(path), stat.st_mtime_ns, stat.st_size, content.hexdigest(), schema],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    def _evict(self, keep: str) -> None:
+        """
+        Delete the least recently used entries until the directory fits in max_bytes.
+
+        args:
+            keep: str - entry just written, never evicted
+        returns:
+            None
+        """
+        entries = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".feather")
+        ]
+        entries.sort(key=os.path.getmtime)
+        total = sum(os.path.getsize(entry) for entry in entries)
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry != keep:
+                total -= os.path.getsize(entry)
+                os.remove(entry)
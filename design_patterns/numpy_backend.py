@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Iterator, List, Optional
+
+from ._lazy import LazyModule
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+
+
+class NpyColumn:
+    """
+    A numeric column stored as a memory-mapped .npy file.
+    It offers the few Series methods the numeric strategies and their fitted
+    statistics use (sum, count, mean, median, dropna, fillna, isna) and runs them block
+    by block over the mapping, so the column is never loaded into the Python heap as a
+    whole. fillna writes into the file in place and bumps version, which column
+    profiles compare to notice the write.
+    """
+
+    # elements processed per block
+    block = 1 << 20
+
+    def __init__(self, values: np.memmap, name: str):
+        """
+        Initialize the column on its memory map.
+
+        args:
+            values: numpy.memmap - the mapped array
+            name: str - column name
+        returns:
+            None
+        """
+        self.values = values
+        self.name = name
+        # number of in-place writes, so a cached profile of the column can tell it is stale
+        self.version = 0
+
+    @property
+    def dtype(self):
+        """
+        Dtype of the stored values.
+        """
+        return self.values.dtype
+
+    def __len__(self):
+        return len(self.values)
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.values, dtype=dtype)
+
+    def blocks(self) -> Iterator[np.ndarray]:
+        """
+        Consecutive views of at most block elements.
+        """
+        for start in range(0, len(self.values), self.block):
+            yield self.values[start:start + self.block]
+
+    def isna(self) -> pd.Series:
+        """
+        Boolean mask of the missing values, as a Series like pandas.Series.isna.
+        """
+        return pd.Series(np.isnan(self.values), name=self.name)
+
+    def sum(self) -> float:
+        """
+        Sum of the non-missing values, accumulated block by block in float64.
+        """
+        return float(sum(np.nansum(block, dtype=np.float64) for block in self.blocks()))
+
+    def count(self) -> int:
+        """
+        Number of non-missing values.
+        """
+        return int(sum(np.count_nonzero(~np.isnan(block)) for block in self.blocks()))
+
+    def mean(self) -> float:
+        """
+        Mean of the non-missing values, accumulated block by block in float64.
+        """
+        total, count = 0.0, 0
+        for block in self.blocks():
+            total += float(np.nansum(block, dtype=np.float64))
+            count += int(np.count_nonzero(~np.isnan(block)))
+        return total / count if count else float("nan")
+
+    def median(self) -> float:
+        """
+        Exact median of the non-missing values. The selection needs those values in
+        one array, gathered block by block; use MedianStrategy(approximate=True) to
+        stay within bounded memory.
+        """
+        values = self._present()
+        return float(np.median(values)) if values.size else float("nan")
+
+    def _present(self) -> np.ndarray:
+        """
+        The non-missing values in one float64 array, gathered block by block.
+        """
+        parts = [block[~np.isnan(block)].astype(np.float64) for block in self.blocks()]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.float64)
+
+    def dropna(self) -> pd.Series:
+        """
+        The non-missing values loaded into a Series, as ExactMedian keeps them.
+        """
+        return pd.Series(self._present(), name=self.name, copy=False)
+
+    def fillna(self, value) -> "NpyColumn":
+        """
+        Write value over the missing values, in place in the mapped file.
+
+        args:
+            value: fill value
+        returns:
+            NpyColumn - self
+        """
+        for block in self.blocks():
+            block[np.isnan(block)] = value
+        self.values.flush()
+        self.version += 1
+        return self
+
+
+class NpyFrame:
+    """
+    Numeric columns stored as one memory-mapped .npy file each in a directory.
+    It can stand in for a pandas.DataFrame with MeanStrategy and MedianStrategy,
+    including their fit, transform, save and load: df[column] gives an NpyColumn, and assigning that same column back is a no-op
+    because its fill already happened in place. Row-dropping strategies are not
+    supported on this backend.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Map every .npy file of the directory, read-write.
+
+        args:
+            directory: str - directory holding <column>.npy files
+        returns:
+            None
+        """
+        self.directory = directory
+        self._columns = {}
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".npy"):
+                column = name[: -len(".npy")]
+                self._columns[column] = NpyColumn(np.load(os.path.join(directory, name), mmap_mode="r+"), column)
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Names of the mapped columns.
+        """
+        return list(self._columns)
+
+    def __len__(self):
+        return len(next(iter(self._columns.values()))) if self._columns else 0
+
+    def __getitem__(self, column: str) -> NpyColumn:
+        return self._columns[column]
+
+    def __setitem__(self, column: str, values) -> None:
+        if values is self._columns.get(column):
+            return
+        stored = self._columns[column]
+        stored.values[:] = np.asarray(values, dtype=stored.dtype)
+        stored.values.flush()
+        stored.version += 1
+
+    def copy(self, directory: Optional[str] = None) -> "NpyFrame":
+        """
+        Copy of the files into another directory, a new temporary one when None.
+        A temporary directory is removed once the copy is garbage collected, or at exit.
+
+        args:
+            directory: str - destination directory
+        returns:
+            NpyFrame - the copy
+        """
+        temporary = directory is None
+        if temporary:
+            directory = tempfile.mkdtemp(prefix="npyframe_")
+        os.makedirs(directory, exist_ok=True)
+        for column in self._columns:
+            self._columns[column].values.flush()
+            shutil.copy(os.path.join(self.directory, f"{column}.npy"), directory)
+        frame = NpyFrame(directory)
+        if temporary:
+            weakref.finalize(frame, shutil.rmtree, directory, ignore_errors=True)
+        return frame
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        The columns loaded into a pandas.DataFrame.
+        """
+        return pd.DataFrame({column: np.array(col.values) for column, col in self._columns.items()})
+
+    @classmethod
+    def from_csv(
+        cls, path: str, directory: str, columns: List[str], dtype: str = "float32", chunksize: int = 1_000_000
+    ) -> "NpyFrame":
+        """
+        Convert numeric columns of a csv into .npy files, chunk by chunk.
+        A first pass counts the rows so each file is allocated once at its final size.
+
+        args:
+            path: str - csv to convert
+            directory: str - directory the .npy files are written to
+            columns: List[str] - numeric columns to convert
+            dtype: str - dtype of the stored columns, floating so NaN marks missing values
+            chunksize: int - rows parsed at a time
+        returns:
+            NpyFrame - the mapped columns
+        """
+        os.makedirs(directory, exist_ok=True)
+        rows = sum(len(chunk) for chunk in pd.read_csv(path, usecols=columns[:1], chunksize=chunksize))
+        targets = {
+            column: np.lib.format.open_memmap(
+                os.path.join(directory, f"{column}.npy"), mode="w+", dtype=dtype, shape=(rows,)
+            )
+            for column in columns
+        }
+        start = 0
+        for chunk in pd.read_csv(path, usecols=columns, dtype={column: dtype for column in columns}, chunksize=chunksize):
+            for column, target in targets.items():
+                target[start:start + len(chunk)] = chunk[column].to_numpy()
+            start += len(chunk)
+        for target in targets.values():
+            target.flush()
+        del targets
+        return cls(directory)
@@ -2,6 +2,12 @@
 
 from datetime import datetime
 
+from ._lazy import LazyModule
+from .running_stats import RunningMoments
+
+pd = LazyModule("pandas")
+
+
 class Car:
     def __init__(self, make, model, year, price):
         self.make = make
@@ -41,37 +47,29 @@ class ElectricCar(Car):
         current_price = self.price * inflation_rate
         return current_price
 
-car1 = ElectricCar("Toyota", "Corolla",2010, 100, 10000)
-
-print(car1.__str__())
-print(car1.car_lifespan())
-print(car1.inflation())
-
 
 #class that will calculate avg of number given list as input.
 
 class AvgCalculator:
-    def __init__(self, numbers: tuple):
-        self.numbers = numbers
+    def __init__(self, numbers):
+        # a single pass, so numbers can be any iterable, even a generator, or a numpy array
+        self.moments = RunningMoments().update(numbers)
         
     def total(self):
-        total = 0
-        for number in self.numbers:
-            total += number
-        return total
+        # exact for integers, which a float sum rounds past 2**53
+        if self.moments.integer_total is not None:
+            return self.moments.integer_total
+        return self.moments.total
     
     def length(self):
-        length = 0
-        for number in self.numbers:
-            length += 1
-        return length
+        return self.moments.count
     
     def avg(self):
-        avg = self.total() / self.length()
-        return avg
+        return self.moments.value()
+
+    def variance(self):
+        return self.moments.variance()
     
-avg_calculator = AvgCalculator([1, 2, 3, 4, 5])
-print(avg_calculator.avg())
 
 
 #class for calculating age of the person
@@ -84,8 +82,6 @@ class AgeCalculator:
         age = datetime.now().year - self.birth_year
         return age
     
-age_calculator = AgeCalculator(2000)
-print(age_calculator.age())
         
         
 #polymorphism
@@ -116,13 +112,6 @@ class Customer(Person):
     def get_info(self):
         return f"Name: {self.name}, Age: {self.age}, Balance: {self.balance}"
     
-person1 = Person("John", 20)
-employee1 = Employee("Jane", 30, 50000)
-customer1 = Customer("Jim", 40, 1000)
-
-print(person1.get_info())
-print(employee1.get_info())
-print(customer1.get_info())
 
 
 ##class for calculating interest of the bank account
@@ -143,8 +132,6 @@ class SavingsAccount(BankAccount):
         interest =  self.balance * self.interest_rate
         return interest
     
-savings_account = SavingsAccount(100000)
-print(savings_account.calculate_interest())
 
 ##class for calculating area of the circle
 
@@ -161,10 +148,6 @@ class Circle:
         circumference = round(2 * self.pi * self.radius, 2)
         return circumference
     
-circle = Circle(5)
-print(circle.area())
-print(circle.circumference())
-
 
 
 # incapsulation -
@@ -195,14 +178,8 @@ class BankAccount:
     def __str__(self):
         return f"Balance: {self.__balance}"   
     
-account1 = BankAccount(1000)
-account2 = BankAccount(2000)
 
-print(account1.transfer(500, account2))
-print(account1)
-print(account2)
 
-print(account1.get_balance())
     
     
 # example of abstraction
@@ -225,11 +202,6 @@ class Cat(Animal):
     def make_sound(self):
         return "Meow"
     
-dog = Dog("Buddy")
-cat = Cat("Whiskers")
-
-print(dog.make_sound())
-print(cat.make_sound())
 
 
 # inheritance
@@ -237,7 +209,6 @@ print(cat.make_sound())
 inheritance is a concept that allows a class to inherit the properties and methods of another class.
 
 '''
-import pandas as pd
 
 class Insurance:
     def __init__(self, policy_number: str, policy_holder: str, policy_type: str, policy_start_date: str, policy_end_date: str):
@@ -281,12 +252,6 @@ class HomeInsurance(Insurance):
                            "Home Value": [self.home_value]})
         return data
 
-auto_insurance = AutoInsurance("1234567890", "John Doe", "Auto", "2024-01-01", "2024-12-31", "Toyota", "Corolla", 2020)
-home_insurance = HomeInsurance("1234567890", "John Doe", "Home", "2024-01-01", "2024-12-31", "123 Main St", 100000)
-
-print(auto_insurance.get_info())
-print(home_insurance.get_info())
-
 
 ## class method and static method
 '''
@@ -313,13 +278,6 @@ class MathOperations:
     def subtract(self):
         return self.a - self.b
 
-math_operations = MathOperations(10, 5)
-
-print(math_operations.add())
-print(MathOperations.multiply(10, 5))
-print(math_operations.divide(10, 5))
-print(math_operations.subtract())
-
 
 ## property decorator
 '''
@@ -343,12 +301,6 @@ class House:
     def price(self):
         del self.__price
         
-house = House(1000000)
-
-print(house.price)
-house.price = 200000
-print(house.price)
-del house.price
 
 
 # magic methods
@@ -357,6 +309,9 @@ magic methods are methods that are used to define the behavior of an object.
 '''
 
 class Vector:
+    # no per-instance __dict__, many vectors cost less memory; see vectors.VectorArray for bulk math
+    __slots__ = ("x", "y")
+
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y  
@@ -365,24 +320,24 @@ class Vector:
         return f"Vector({self.x}, {self.y})"
     
     def __add__(self, other):
+        # other operands, e.g. a vectors.VectorArray, get their reflected method called
+        if not isinstance(other, Vector):
+            return NotImplemented
         return Vector(self.x + other.x, self.y + other.y)
     
     def __mul__(self, other):
+        if not isinstance(other, Vector):
+            return NotImplemented
         return Vector(self.x * other.x, self.y * other.y)
     
     def __len__(self):
-        return self.x + self.y  
-    
-vector1 = Vector(1, 2)
-vector2 = Vector(3, 4)
+        # number of components, len() must return a non-negative int
+        return 2
 
-print(vector1 + vector2)
-print(vector1 * vector2)
-print(vector1.__str__())
-print(vector2.__str__())
-print(vector1.__add__(vector2))
-print(vector1.__mul__(vector2))
-print(vector1.__len__())
+    def __iter__(self):
+        yield self.x
+        yield self.y
+    
 
 
     
@@ -395,8 +350,6 @@ class Tokenizer:
     def tokenize(self):
         return self.string.split()
     
-tokenizer = Tokenizer("Hi my name is bhavesh and i am a Data Scientist")
-print(tokenizer.tokenize())
 
 ## class to convert temperature from celsius to fahrenheit
 
@@ -409,15 +362,86 @@ class TemperatureConverter:
     
     def __str__(self):
         return f"Temperature in Celsius: {self.celsius}"
-    
-temperature_converter = TemperatureConverter(20.20)
-print(temperature_converter.convert_to_fahrenheit())
-      
-        
-        
-        
 
 
+#   usage
+if __name__ == "__main__":
+    car1 = ElectricCar("Toyota", "Corolla",2010, 100, 10000)
 
-        
-        
+    print(car1.__str__())
+    print(car1.car_lifespan())
+    print(car1.inflation())
+
+    avg_calculator = AvgCalculator([1, 2, 3, 4, 5])
+    print(avg_calculator.avg())
+    print(AvgCalculator(number / 10 for number in range(100)).avg())
+
+    age_calculator = AgeCalculator(2000)
+    print(age_calculator.age())
+
+    person1 = Person("John", 20)
+    employee1 = Employee("Jane", 30, 50000)
+    customer1 = Customer("Jim", 40, 1000)
+
+    print(person1.get_info())
+    print(employee1.get_info())
+    print(customer1.get_info())
+
+    savings_account = SavingsAccount(100000)
+    print(savings_account.calculate_interest())
+
+    circle = Circle(5)
+    print(circle.area())
+    print(circle.circumference())
+
+    account1 = BankAccount(1000)
+    account2 = BankAccount(2000)
+
+    print(account1.transfer(500, account2))
+    print(account1)
+    print(account2)
+
+    print(account1.get_balance())
+
+    dog = Dog("Buddy")
+    cat = Cat("Whiskers")
+
+    print(dog.make_sound())
+    print(cat.make_sound())
+
+    auto_insurance = AutoInsurance("1234567890", "John Doe", "Auto", "2024-01-01", "2024-12-31", "Toyota", "Corolla", 2020)
+    home_insurance = HomeInsurance("1234567890", "John Doe", "Home", "2024-01-01", "2024-12-31", "123 Main St", 100000)
+
+    print(auto_insurance.get_info())
+    print(home_insurance.get_info())
+
+    math_operations = MathOperations(10, 5)
+
+    print(math_operations.add())
+    print(MathOperations.multiply(10, 5))
+    print(math_operations.divide(10, 5))
+    print(math_operations.subtract())
+
+    house = House(1000000)
+
+    print(house.price)
+    house.price = 200000
+    print(house.price)
+    del house.price
+
+    vector1 = Vector(1, 2)
+    vector2 = Vector(3, 4)
+
+    print(vector1 + vector2)
+    print(vector1 * vector2)
+    print(vector1.__str__())
+    print(vector2.__str__())
+    print(vector1.__add__(vector2))
+    print(vector1.__mul__(vector2))
+    print(vector1.__len__())
+
+    tokenizer = Tokenizer("Hi my name is bhavesh and i am a Data Scientist")
+    print(tokenizer.tokenize())
+
+    temperature_converter = TemperatureConverter(20.20)
+    print(temperature_converter.convert_to_fahrenheit())
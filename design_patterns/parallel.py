@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import glob
+import os
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+
+class FileResult:
+    """
+    Outcome of one pipeline run: the processed frame, or the error that stopped it.
+    """
+
+    __slots__ = ("path", "result", "error")
+
+    def __init__(self, path: str, result: Any = None, error: Optional[str] = None):
+        """
+        Initialize the outcome of a file.
+
+        args:
+            path: str - input file
+            result: what the run returned, None on failure
+            error: str - formatted traceback on failure, None on success
+        returns:
+            None
+        """
+        self.path = path
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        True when the run succeeded.
+        """
+        return self.error is None
+
+    def __repr__(self):
+        return f"FileResult({self.path!r}, ok={self.ok})"
+
+
+def _run_file(pipeline, path: str, reduce: Optional[Callable]) -> FileResult:
+    """
+    Run the pipeline on one file inside a worker, turning any exception into a failed result.
+
+    args:
+        pipeline: object with a run_pipeline(path) method
+        path: str - input file
+        reduce: callable applied to the processed frame in the worker, None to return it as is
+    returns:
+        FileResult
+    """
+    try:
+        df = pipeline.run_pipeline(path)
+        return FileResult(path, df if reduce is None else reduce(df))
+    except Exception:
+        return FileResult(path, error=traceback.format_exc())
+
+
+def _collect(future, path: str) -> FileResult:
+    """
+    Result of a finished future, including failures of the worker process itself.
+    """
+    try:
+        return future.result()
+    except Exception:
+        return FileResult(path, error=traceback.format_exc())
+
+
+def run_parallel(
+    pipeline,
+    paths: Union[str, Iterable[str]],
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    ordered: bool = True,
+    reduce: Optional[Callable] = None,
+) -> Iterator[FileResult]:
+    """
+    Run a template pipeline over many files with a process pool, streaming the results.
+    At most max_in_flight files are submitted or finished but not yet consumed, which caps
+    the memory held by results waiting in the parent. A failing file yields a FileResult
+    carrying its traceback and does not stop the others.
+
+    args:
+        pipeline: picklable object with a run_pipeline(path) method, e.g. template_pattern.ProcessData()
+        paths: str | Iterable[str] - glob pattern or list of files
+        workers: int - worker processes, os.cpu_count() when None
+        max_in_flight: int - files in flight at once, twice the workers when None
+        ordered: bool - yield results in input order when True, as they finish otherwise
+        reduce: picklable callable applied to each processed frame inside the worker,
+            e.g. to write it out and return its path instead of shipping the frame back
+    returns:
+        Iterator[FileResult] - one result per file
+    """
+    if isinstance(paths, str):
+        paths = sorted(glob.glob(paths))
+    workers = workers or os.cpu_count()
+    max_in_flight = max_in_flight or 2 * workers
+    pending_paths = iter(paths)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+
+        def submit_next() -> bool:
+            path = next(pending_paths, None)
+            if path is None:
+                return False
+            in_flight.append((pool.submit(_run_file, pipeline, path, reduce), path))
+            return True
+
+        while len(in_flight) < max_in_flight and submit_next():
+            pass
+
+        while in_flight:
+            if ordered:
+                future, path = in_flight.popleft()
+                yield _collect(future, path)
+            else:
+                done, _ = wait([future for future, _ in in_flight], return_when=FIRST_COMPLETED)
+                for entry in [entry for entry in in_flight if entry[0] in done]:
+                    in_flight.remove(entry)
+                    yield _collect(*entry)
+            while len(in_flight) < max_in_flight and submit_next():
+                pass
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, Optional
+
+from ._lazy import LazyModule
+from .oops import AutoInsurance, HomeInsurance, Insurance
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+# get_info label and storage of every policy field
+FIELDS = {
+    "policy_number": ("Policy Number", "str"),
+    "policy_holder": ("Policy Holder", "str"),
+    "policy_type": ("Policy Type", "category"),
+    "policy_start_date": ("Policy Start Date", "date"),
+    "policy_end_date": ("Policy End Date", "date"),
+    "car_make": ("Car Make", "category"),
+    "car_model": ("Car Model", "category"),
+    "car_year": ("Car Year", "int"),
+    "home_address": ("Home Address", "str"),
+    "home_value": ("Home Value", "int"),
+}
+
+# record classes, in kind code order, with their constructor fields
+KINDS = (Insurance, AutoInsurance, HomeInsurance)
+KIND_FIELDS = {
+    Insurance: list(FIELDS)[:5],
+    AutoInsurance: list(FIELDS)[:5] + ["car_make", "car_model", "car_year"],
+    HomeInsurance: list(FIELDS)[:5] + ["home_address", "home_value"],
+}
+
+
+class PolicyView:
+    """
+    One record of a PolicyStore, read through attribute access like the Insurance
+    objects it replaces. A view holds only the store and the row number.
+    """
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "PolicyStore", index: int):
+        """
+        Initialize the view of a row.
+
+        args:
+            store: PolicyStore - the store holding the record
+            index: int - row of the record
+        returns:
+            None
+        """
+        self.store = store
+        self.index = index
+
+    def __getattr__(self, name: str):
+        if name not in FIELDS:
+            raise AttributeError(f"'PolicyView' object has no attribute '{name}'")
+        return self.store.value(self.index, name)
+
+    @property
+    def kind(self) -> type:
+        """
+        Class of the record: Insurance, AutoInsurance or HomeInsurance.
+        """
+        return KINDS[self.store.kinds[self.index]]
+
+    def get_info(self) -> pd.DataFrame:
+        """
+        One-row dataframe of the record, as the get_info of its class.
+        """
+        return pd.DataFrame({FIELDS[field][0]: [getattr(self, field)] for field in KIND_FIELDS[self.kind]})
+
+    def to_policy(self) -> Insurance:
+        """
+        The record as a standalone object of its class.
+        """
+        return self.kind(*[getattr(self, field) for field in KIND_FIELDS[self.kind]])
+
+    def __repr__(self):
+        return f"PolicyView({self.index}, {self.kind.__name__}, {self.policy_number!r})"
+
+
+class PolicyStore:
+    """
+    Columnar store of Insurance, AutoInsurance and HomeInsurance records.
+    Every field is one preallocated array grown by doubling: low-cardinality strings
+    and dates as integer codes of their text, integers with a missing mask and other
+    strings as object arrays. Dates keep the text they were given, so records read
+    back unchanged whatever their format; to_frame can parse them. Fields a record's class does not have are missing.
+    Codes are kept in the integer dtype pandas picks for the number of categories,
+    widened as categories are added, so to_frame wraps them as they are.
+    to_frame wraps the arrays in a single dataframe without copying them, instead
+    of one dataframe per record.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize an empty store.
+
+        args:
+            capacity: int - records allocated up front
+        returns:
+            None
+        """
+        self._size = 0
+        self._capacity = 0
+        self.kinds = np.empty(0, dtype=np.int8)
+        self._values = {}
+        self._masks = {}
+        # code per category, and category per code, of the coded fields
+        self._categories = {field: {} for field, (_, storage) in FIELDS.items() if storage in ("category", "date")}
+        self._names = {field: [] for field in self._categories}
+        for field, (_, storage) in FIELDS.items():
+            self._values[field] = np.empty(0, dtype=self._dtype(storage))
+            if storage == "int":
+                self._masks[field] = np.empty(0, dtype=bool)
+        self._reserve(capacity)
+
+    @staticmethod
+    def _dtype(storage: str):
+        return {"str": object, "category": np.int8, "date": np.int8, "int": np.int64}[storage]
+
+    @staticmethod
+    def _code_dtype(categories: int):
+        """
+        The dtype pandas.Categorical keeps the codes of that many categories in.
+        """
+        for dtype in (np.int8, np.int16, np.int32):
+            if categories < np.iinfo(dtype).max:
+                return dtype
+        return np.int64
+
+    def _reserve(self, size: int) -> None:
+        """
+        Grow every array to hold at least size records.
+        """
+        if size <= self._capacity:
+            return
+        capacity = max(size, 2 * self._capacity)
+
+        def grow(values):
+            grown = np.empty(capacity, dtype=values.dtype)
+            grown[: self._size] = values[: self._size]
+            return grown
+
+        self.kinds = grow(self.kinds)
+        self._values = {field: grow(values) for field, values in self._values.items()}
+        self._masks = {field: grow(mask) for field, mask in self._masks.items()}
+        self._capacity = capacity
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index: int) -> PolicyView:
+        if not -self._size <= index < self._size:
+            raise IndexError("policy index out of range")
+        return PolicyView(self, index % self._size)
+
+    def __iter__(self) -> Iterator[PolicyView]:
+        return (PolicyView(self, index) for index in range(self._size))
+
+    def value(self, index: int, field: str):
+        """
+        Value of one field of one record, as the record class would hold it.
+
+        args:
+            index: int - row of the record
+            field: str - field name
+        returns:
+            str | int | None - the value, None when the record has no such field
+        """
+        storage = FIELDS[field][1]
+        value = self._values[field][index]
+        if storage in ("category", "date"):
+            return None if value < 0 else self._names[field][value]
+        if storage == "int":
+            return None if self._masks[field][index] else int(value)
+        return value
+
+    def _codes(self, field: str, values: pd.Series) -> np.ndarray:
+        """
+        Codes of the values, adding unseen categories to the field and widening its
+        stored codes when pandas would keep that many categories in a wider dtype.
+        """
+        codes, uniques = pd.factorize(values)
+        categories, names = self._categories[field], self._names[field]
+        for value in uniques:
+            if value not in categories:
+                categories[value] = len(names)
+                names.append(value)
+        dtype = self._code_dtype(len(names))
+        if self._values[field].dtype != dtype:
+            self._values[field] = self._values[field].astype(dtype)
+        remap = np.array([categories[value] for value in uniques], dtype=dtype)
+        return np.where(codes < 0, -1, remap[codes] if remap.size else -1).astype(dtype)
+
+    def _append_columns(self, columns: Dict[str, Iterable], kinds: np.ndarray) -> None:
+        """
+        Append records given as one sequence per field, each converted in one vectorized pass.
+
+        args:
+            columns: Dict[str, Iterable] - values per field, fields left out are missing
+            kinds: numpy.ndarray - kind code of each record
+        returns:
+            None
+        """
+        count = len(kinds)
+        start, end = self._size, self._size + count
+        self._reserve(end)
+        self.kinds[start:end] = kinds
+        for field, (_, storage) in FIELDS.items():
+            values = pd.Series(columns[field] if field in columns else [None] * count, dtype=object)
+            if storage == "str":
+                self._values[field][start:end] = values.where(values.notna(), None).to_numpy()
+            elif storage in ("category", "date"):
+                # coded before indexing the array, which adding categories may widen
+                codes = self._codes(field, values)
+                self._values[field][start:end] = codes
+            else:
+                numbers = pd.to_numeric(values)
+                self._masks[field][start:end] = numbers.isna().to_numpy()
+                self._values[field][start:end] = numbers.fillna(0).to_numpy(dtype=np.int64)
+        self._size = end
+
+    def append(self, policy: Insurance) -> PolicyView:
+        """
+        Append one Insurance, AutoInsurance or HomeInsurance object.
+
+        args:
+            policy: Insurance - the record
+        returns:
+            PolicyView - view of the stored record
+        """
+        self.extend([policy])
+        return self[self._size - 1]
+
+    def extend(self, policies: Iterable[Insurance]) -> None:
+        """
+        Append many records, converting each field once for the whole batch.
+
+        args:
+            policies: Iterable[Insurance] - the records
+        returns:
+            None
+        """
+        policies = list(policies)
+        kinds = np.array([KINDS.index(type(policy)) for policy in policies], dtype=np.int8)
+        columns = {field: [getattr(policy, field, None) for policy in policies] for field in FIELDS}
+        self._append_columns(columns, kinds)
+
+    @classmethod
+    def from_policies(cls, policies: Iterable[Insurance]) -> "PolicyStore":
+        """
+        Store holding the given records.
+        """
+        policies = list(policies)
+        store = cls(capacity=max(1, len(policies)))
+        store.extend(policies)
+        return store
+
+    @classmethod
+    def from_csv(cls, path: str, chunksize: int = 1_000_000) -> "PolicyStore":
+        """
+        Bulk load records from a csv, chunk by chunk.
+        Columns are matched by field name or get_info label. A row is an AutoInsurance
+        when it has any car field, a HomeInsurance when it has any home field, an
+        Insurance otherwise.
+
+        args:
+            path: str - csv to load
+            chunksize: int - rows parsed at a time
+        returns:
+            PolicyStore
+        """
+        names = {label: field for field, (label, _) in FIELDS.items()}
+        auto = KIND_FIELDS[AutoInsurance][5:]
+        home = KIND_FIELDS[HomeInsurance][5:]
+        store = cls()
+        for chunk in pd.read_csv(path, dtype=object, chunksize=chunksize):
+            chunk = chunk.rename(columns=names)
+            kinds = np.zeros(len(chunk), dtype=np.int8)
+            present = [field for field in auto if field in chunk]
+            if present:
+                kinds[chunk[present].notna().any(axis=1).to_numpy()] = KINDS.index(AutoInsurance)
+            present = [field for field in home if field in chunk]
+            if present:
+                kinds[chunk[present].notna().any(axis=1).to_numpy()] = KINDS.index(HomeInsurance)
+            store._append_columns({field: chunk[field] for field in FIELDS if field in chunk}, kinds)
+        return store
+
+    def to_frame(self, labels: bool = True, date_format: Optional[str] = None) -> pd.DataFrame:
+        """
+        Every record in one dataframe wrapping the stored arrays without copying them.
+        The frame shares memory with the store: copy it before modifying either.
+
+        args:
+            labels: bool - name the columns with the get_info labels instead of the field names
+            date_format: str - strftime format the dates are parsed with into datetime64,
+                e.g. "%Y-%m-%d", text not in that format becoming NaT; None keeps the
+                dates as categories of their text
+        returns:
+            pandas.DataFrame
+        """
+        size = self._size
+        columns = {}
+        for field, (label, storage) in FIELDS.items():
+            values = self._values[field][:size]
+            if storage == "date" and date_format is not None:
+                # only the distinct dates are parsed, then taken by code
+                names = pd.Index(self._names[field], dtype=object)
+                parsed = pd.DatetimeIndex(pd.to_datetime(names, format=date_format, errors="coerce"))
+                column = parsed.take(values, allow_fill=True, fill_value=pd.NaT)
+            elif storage in ("category", "date"):
+                dtype = pd.CategoricalDtype(self._names[field])
+                column = pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+            elif storage == "int":
+                column = pd.arrays.IntegerArray(values, self._masks[field][:size])
+            elif storage == "str":
+                column = pd.Series(values, dtype=object, copy=False)
+            else:
+                column = values
+            columns[label if labels else field] = column
+        return pd.DataFrame(columns, copy=False)
+
+
+#   usage
+if __name__ == "__main__":
+    store = PolicyStore.from_policies([
+        AutoInsurance("1234567890", "John Doe", "Auto", "2024-01-01", "2024-12-31", "Toyota", "Corolla", 2020),
+        HomeInsurance("1234567891", "Jane Doe", "Home", "2024-01-01", "2024-12-31", "123 Main St", 100000),
+    ])
+    print(store.to_frame())
+    print(store[0], store[0].car_make, store[1].home_value)
+    print(store[1].get_info())
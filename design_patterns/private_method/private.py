@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import os
+import tempfile
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from .._lazy import LazyModule
+from ..profiling import run_step
+from ..typed_loader import CAR_INSURANCE_DTYPES, read_typed_csv
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+# input of the run in progress, so the plot step can name its png without a parameter
+_source = contextvars.ContextVar("source", default=None)
+
+
+class DataPreprocessing(ABC):
+    """
+    The DataPreprocessing class defines the template method that contains a skeleton of some algorithm.
+    The algorithm can be varied by overriding the abstract operations.
+    Every step after _load_data mutates the frame it is given and returns it.
+    """
+
+    # steps mutate the loaded frame, or a single copy of it taken after loading
+    inplace = True
+    # record the bytes allocated by each step in self.allocations
+    track_allocations = False
+    # called around every step, see profiling.StepHook
+    hooks = ()
+
+    def __init__(self, inplace: bool = True, track_allocations: bool = False, hooks=None):
+        """
+        Initialize the pipeline with its copy semantics.
+
+        args:
+            inplace: bool - mutate the frame returned by _load_data when True, otherwise
+                copy it once before the first step and leave it untouched
+            track_allocations: bool - record the peak bytes allocated by each step
+            hooks: list - objects with before_step(name, data), after_step(name, result) and
+                optionally step_failed(name, error) methods called around every step, such
+                as profiling.StepProfiler
+        returns:
+            None
+        """
+        self.inplace = inplace
+        self.track_allocations = track_allocations
+        self.allocations = {}
+        self.hooks = list(hooks or [])
+
+    def run_pipeline(self, path: str):  # public method
+        """
+        The template method running every step on the data at path.
+
+        args:
+            path: str - path to the data
+        returns:
+            pandas.DataFrame - the processed dataframe
+        """
+        return self.run_pipeline_with_plot(path)[0]
+
+    def run_pipeline_with_plot(self, path: str) -> Tuple[pd.DataFrame, Optional[Future]]:  # public method
+        """
+        The template method, also returning the Future of the plot artifacts when the plot
+        step renders off-thread. The Future is not kept on the pipeline, which stays picklable.
+
+        args:
+            path: str - path to the data
+        returns:
+            tuple - the processed dataframe, and the plot Future or None
+        """
+        self.allocations = {}
+        token = _source.set(path)
+        try:
+            df = self._run_step("load_data", self._load_data, path)  # private
+            if not self.inplace:
+                df = self._run_step("copy", df.copy)  # the only copy of the run
+            df = self._run_step("handle_missing", self.handle_missing, df)  # public
+            df = self._run_step("change_datatype", self.change_datatype, df, "outcome")  # public
+            rendered = self._run_step("plot", self._plot_basic_distributions, df, "credit_score")
+        finally:
+            _source.reset(token)
+        return df, rendered if isinstance(rendered, Future) else None
+
+    # hooks and allocation tracking around every step, shared with template_pattern
+    _run_step = run_step
+
+    @abstractmethod
+    def _load_data(self, path):
+        """
+        The abstract method to load the data.
+        """
+        pass
+
+    @abstractmethod
+    def handle_missing(self, df):
+        """
+        The abstract method to handle the missing values.
+        """
+        pass
+
+    @abstractmethod
+    def change_datatype(self, df, column):
+        """
+        The abstract method to encode the categoricals.
+        """
+        pass
+
+    def _plot_basic_distributions(self, df, column):
+        """
+        The private method to plot the basic distributions.
+        """
+        print("Plotting histogram and boxplot (default logic)")
+
+
+# concrete class
+class ProcessData(DataPreprocessing):
+    def __init__(self, usecols=None, engine: str = "c", cache=None, plot_dir: str = None, **kwargs):
+        """
+        Initialize the pipeline with its loader and plot options.
+
+        args:
+            usecols: List[str] - only load these columns, all of them when None
+            engine: str - csv parser, "c" or "pyarrow"
+            cache: load_cache.LoadCache - columnar cache of parsed files, parse every run when None
+            plot_dir: str - directory the plots are rendered to, a temporary directory when None
+            kwargs: options of DataPreprocessing
+        returns:
+            None
+        """
+        super().__init__(**kwargs)
+        self.usecols = usecols
+        self.engine = engine
+        self.cache = cache
+        self.plot_dir = plot_dir or os.path.join(tempfile.gettempdir(), "car_insurance_plots")
+
+    def _load_data(self, path: str) -> pd.DataFrame:
+        """
+        The concrete method to load the data with compact, declared dtypes.
+
+        args:
+            path: str - path to the data
+        returns:
+            pandas.DataFrame - dataframe loaded from the path
+        """
+        # buffers, e.g. the appended tail read by incremental.IncrementalRunner, bypass the cache
+        if self.cache is not None and isinstance(path, (str, os.PathLike)):
+            schema = {"dtypes": CAR_INSURANCE_DTYPES, "usecols": self.usecols}
+            return self.cache.load(path, self._parse, schema)
+        return self._parse(path)
+
+    def _parse(self, path: str) -> pd.DataFrame:
+        """
+        The private method to parse the csv with the declared dtypes.
+
+        args:
+            path: str - path to the data
+        returns:
+            pandas.DataFrame - dataframe parsed from the path
+        """
+        return read_typed_csv(path, usecols=self.usecols, engine=self.engine)
+
+    def handle_missing(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        The concrete method to handle the missing values.
+
+        args:
+            df: pandas.DataFrame - dataframe to handle missing values
+        returns:
+            pandas.DataFrame - dataframe with missing values handled
+        """
+        df.dropna(inplace=True)
+        return df
+
+    def change_datatype(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """
+        The concrete method to encode the categoricals.
+
+        args:
+            df: pandas.DataFrame - dataframe to encode categoricals
+            column: str - column to encode categoricals
+        returns:
+            pandas.DataFrame
+        """
+        df[column] = df[column].astype(str)
+        return df
+
+    def _plot_basic_distributions(self, df: pd.DataFrame, column: str) -> Future:
+        """
+        The private method to plot the basic distributions without blocking the pipeline.
+        The histogram bins and box statistics are computed here with NumPy, then only
+        those few numbers go to a background thread rendering the figure headless.
+
+        args:
+            df: pandas.DataFrame - dataframe to plot the basic distributions
+            column: str - column to plot the basic distributions
+        returns:
+            Future - resolves to the path of the rendered png, None when the column has no values
+        """
+        summary = _distribution_summary(df[column])
+        if summary is None:
+            empty = Future()
+            empty.set_result(None)
+            return empty
+        # named after the input of the run, so runs on other inputs keep their own png
+        path = os.path.join(self.plot_dir, f"{_source_name(_source.get())}_{column}_distribution.png")
+        return _plot_executor().submit(_render_distribution, *summary, column, path)
+
+
+_executor = None
+
+
+def _source_name(source) -> str:
+    """
+    File name prefix identifying the input of a run: the file stem and a hash of its
+    absolute path for a path, a unique token for a buffer.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.path.abspath(os.fspath(source))
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return f"{stem}-{hashlib.sha1(path.encode()).hexdigest()[:8]}"
+    return f"buffer-{uuid.uuid4().hex[:8]}"
+
+
+def _plot_executor() -> ThreadPoolExecutor:
+    """
+    The single worker thread rendering plots, created on first use in each process.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plot")
+    return _executor
+
+
+def _forget_executor() -> None:
+    """
+    Drop the executor inherited by a forked child, e.g. a run_parallel worker: its
+    thread did not survive the fork, so work submitted to it would never run.
+    """
+    global _executor
+    _executor = None
+
+
+if hasattr(os, "register_at_fork"):  # not available on windows, which spawns instead
+    os.register_at_fork(after_in_child=_forget_executor)
+
+
+def _distribution_summary(values: pd.Series, bins: int = 50, max_fliers: int = 1000):
+    """
+    Histogram and box plot statistics of a column, small enough to hand to matplotlib.
+
+    args:
+        values: pandas.Series - column to summarize
+        bins: int - number of histogram bins
+        max_fliers: int - outliers kept for the box plot, evenly subsampled beyond that
+    returns:
+        tuple - (counts, edges) of the histogram and the box statistics of Axes.bxp,
+            None when the column has no non-missing value
+    """
+    values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return None
+    histogram = np.histogram(values, bins=bins)
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+    inside = values[(values >= low) & (values <= high)]
+    fliers = values[(values < low) | (values > high)]
+    if fliers.size > max_fliers:
+        fliers = fliers[:: -(-fliers.size // max_fliers)]
+    box = {
+        "med": median, "q1": q1, "q3": q3,
+        "whislo": inside.min(), "whishi": inside.max(),
+        "fliers": fliers, "label": "",
+    }
+    return histogram, box
+
+
+def _render_distribution(histogram, box, column: str, path: str) -> str:
+    """
+    Render the histogram and box plot to a png with the Agg canvas, outside pyplot.
+
+    args:
+        histogram: tuple - (counts, edges)
+        box: dict - box statistics of Axes.bxp
+        column: str - column name used in the titles
+        path: str - png to write
+    returns:
+        str - path of the png
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(10, 4))
+    FigureCanvasAgg(figure)
+    hist_axes, box_axes = figure.subplots(1, 2)
+    hist_axes.stairs(*histogram, fill=True)
+    hist_axes.set_title(f"{column} histogram")
+    box_axes.bxp([box])
+    box_axes.set_title(f"{column} box plot")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    figure.savefig(path)
+    return path
+
+
+# usage, run from the repository root: python -m design_patterns.private_method.private
+if __name__ == "__main__":
+    process_data = ProcessData()
+    df, plot = process_data.run_pipeline_with_plot(path="data/car_insurance.csv")
+    print(df.head())
+    print(f"plots written to {plot.result()}")
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from ._lazy import LazyModule
+
+pd = LazyModule("pandas")
+
+
+try:
+    import resource
+except ImportError:  # not available on windows
+    resource = None
+
+
+# base class for the hooks called around every template step
+class StepHook:
+    """
+    A StepHook is called before and after each step of a run_pipeline template.
+    A step that raises gets step_failed instead of after_step, so every before_step
+    is matched by one of the two. Subclasses override the callbacks they need, the
+    defaults do nothing.
+    """
+
+    def before_step(self, name: str, data) -> None:
+        """
+        Called before a step runs.
+
+        args:
+            name: str - name of the step
+            data: input of the step, a path for the load step, a dataframe otherwise
+        returns:
+            None
+        """
+        pass
+
+    def after_step(self, name: str, result) -> None:
+        """
+        Called after a step has run.
+
+        args:
+            name: str - name of the step
+            result: output of the step, a dataframe or None
+        returns:
+            None
+        """
+        pass
+
+    def step_failed(self, name: str, error: BaseException) -> None:
+        """
+        Called instead of after_step when a step raises, before the error propagates.
+
+        args:
+            name: str - name of the step
+            error: BaseException - the error raised by the step
+        returns:
+            None
+        """
+        pass
+
+
+class CallbackHook(StepHook):
+    """
+    A StepHook built from plain functions, for one-off pre-step and post-step callbacks.
+    """
+
+    def __init__(self, before=None, after=None, failed=None):
+        """
+        Initialize the hook with its callbacks.
+
+        args:
+            before: callable(name, data) - called before each step
+            after: callable(name, result) - called after each step
+            failed: callable(name, error) - called when a step raises
+        returns:
+            None
+        """
+        self._before = before
+        self._after = after
+        self._failed = failed
+
+    def before_step(self, name, data):
+        if self._before is not None:
+            self._before(name, data)
+
+    def after_step(self, name, result):
+        if self._after is not None:
+            self._after(name, result)
+
+    def step_failed(self, name, error):
+        if self._failed is not None:
+            self._failed(name, error)
+
+
+def run_step(pipeline, name: str, step, *args):
+    """
+    Run one step of a template between the before_step and after_step calls of every
+    hook of the pipeline, recording the peak bytes it allocates in pipeline.allocations
+    when pipeline.track_allocations is set. When the step raises, the hooks whose
+    before_step ran get step_failed instead and the error propagates. Both run_pipeline
+    templates use it as their _run_step method.
+
+    args:
+        pipeline: template with hooks, track_allocations and allocations attributes
+        name: str - name of the step
+        step: callable - the step to run
+        args: arguments of the step
+    returns:
+        the result of the step
+    """
+    entered = []
+    try:
+        for hook in pipeline.hooks:
+            hook.before_step(name, args[0] if args else None)
+            entered.append(hook)
+        if not pipeline.track_allocations:
+            result = step(*args)
+        else:
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            try:
+                result = step(*args)
+            finally:
+                pipeline.allocations[name] = tracemalloc.get_traced_memory()[1] - before
+                if started:
+                    tracemalloc.stop()
+    except BaseException as error:
+        # in reverse, so tracing started by an outer hook is stopped last
+        for hook in reversed(entered):
+            failed = getattr(hook, "step_failed", None)  # optional outside StepHook
+            if failed is not None:
+                failed(name, error)
+        raise
+    for hook in pipeline.hooks:
+        hook.after_step(name, result)
+    return result
+
+
+def _size(data):
+    """
+    Rows and bytes of a step input or output.
+
+    args:
+        data: dataframe, path or None
+    returns:
+        tuple - (rows, bytes), None where unknown
+    """
+    if isinstance(data, pd.DataFrame):
+        return len(data), int(data.memory_usage(index=True, deep=False).sum())
+    if isinstance(data, (str, os.PathLike)) and os.path.exists(data):
+        return None, os.path.getsize(data)
+    return None, None
+
+
+def _max_rss() -> int:
+    """
+    Peak resident set size of the process in bytes, None when unavailable.
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class StepProfiler(StepHook):
+    """
+    Records wall time, cpu time, memory and rows/bytes in and out of every step.
+    One record is kept per step run, so a profiler shared by many runs accumulates them all.
+    A step that raises is recorded with its error and no output, and the tracing the
+    profiler started for it is stopped.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        """
+        Initialize the profiler with no records.
+
+        args:
+            trace_memory: bool - measure the tracemalloc peak of each step, which
+                slows the steps down while tracing
+        returns:
+            None
+        """
+        self.trace_memory = trace_memory
+        self.records = []
+        self._pending = {}
+
+    def before_step(self, name, data):
+        rows_in, bytes_in = _size(data)
+        started_tracing = False
+        if self.trace_memory:
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        self._pending[name] = {
+            "rows_in": rows_in,
+            "bytes_in": bytes_in,
+            "max_rss": _max_rss(),
+            "traced": tracemalloc.get_traced_memory()[0] if self.trace_memory else None,
+            "started_tracing": started_tracing,
+            "cpu": time.process_time(),
+            "wall": time.perf_counter(),
+        }
+
+    def after_step(self, name, result):
+        self._record(name, result, None)
+
+    def step_failed(self, name, error):
+        self._record(name, None, repr(error))
+
+    def _record(self, name, result, error):
+        """
+        Close the pending measurement of a step and append its record.
+
+        args:
+            name: str - name of the step
+            result: output of the step, None when it raised
+            error: str - repr of the error raised by the step, None when it succeeded
+        returns:
+            None
+        """
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        start = self._pending.pop(name)
+        peak_traced = None
+        if self.trace_memory:
+            peak_traced = tracemalloc.get_traced_memory()[1] - start["traced"]
+            if start["started_tracing"]:
+                tracemalloc.stop()
+        max_rss = _max_rss()
+        rows_out, bytes_out = _size(result)
+        self.records.append({
+            "step": name,
+            "wall_time": wall - start["wall"],
+            "cpu_time": cpu - start["cpu"],
+            "peak_traced_bytes": peak_traced,
+            "max_rss_growth": None if max_rss is None else max_rss - start["max_rss"],
+            "rows_in": start["rows_in"],
+            "bytes_in": start["bytes_in"],
+            "rows_out": rows_out,
+            "bytes_out": bytes_out,
+            "error": error,
+        })
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        The records as a dataframe, one row per step run.
+
+        returns:
+            pandas.DataFrame
+        """
+        return pd.DataFrame(self.records)
+
+    def to_json(self, path: str = None) -> str:
+        """
+        The records as json, also written to path when given.
+
+        args:
+            path: str - optional file to write the json to
+        returns:
+            str - json document
+        """
+        document = json.dumps(self.records, indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(document)
+        return document
@@ -1,5 +1,13 @@
-import pandas as pd
+from __future__ import annotations
+
+import json
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from .._lazy import LazyModule
+from ..column_profile import profile_of
+
+pd = LazyModule("pandas")
 
 
 # base strategy interface
@@ -10,6 +18,22 @@ class MissingValueStrategy(ABC):
     The Context uses this interface to call the algorithm defined by Concrete Strategies.
     """
 
+    # mutate the dataframe passed in, or work on a single copy of it
+    inplace = True
+
+    def __init__(self, inplace: Optional[bool] = None):
+        """
+        Initialize the strategy with its copy semantics.
+
+        args:
+            inplace: bool - mutate the dataframe passed in when True, otherwise
+                leave it untouched and return a new dataframe; None keeps the class default
+        returns:
+            None
+        """
+        if inplace is not None:
+            self.inplace = inplace
+
     @abstractmethod
     def handle_missing(self, df, column):
         """
@@ -24,6 +48,9 @@ class DropStrategy(MissingValueStrategy):
     The Concrete Strategy implements the algorithm while following the base Strategy interface.
     """
 
+    # dropping the column returns a new dataframe unless inplace=True is asked for
+    inplace = False
+
     def handle_missing(
         self, df: pd.DataFrame, column: str) -> pd.DataFrame:  # public method
         """
@@ -36,6 +63,10 @@ class DropStrategy(MissingValueStrategy):
             pandas.DataFrame
         """
         if self._column_has_missing_values(df, column):
+            if self.inplace:
+                df.drop(columns=[column], inplace=True)
+                profile_of(df).invalidate(column)
+                return df
             return df.drop(columns=[column])
         else:
             return df
@@ -50,11 +81,16 @@ class DropStrategy(MissingValueStrategy):
         returns:
             bool - True if the column has missing values, False otherwise
         """
-        return df[column].isnull().any()
+        return profile_of(df).column(column).null_count > 0
 
 
 # strategy 2: mean imputation
 class MeanStrategy(MissingValueStrategy):
+    def __init__(self, inplace: Optional[bool] = None):
+        super().__init__(inplace)
+        # mean per column learned by fit, reused by every transform
+        self.fill_values_ = {}
+
     def handle_missing(self, df: pd.DataFrame, column: str) -> pd.DataFrame:  # public
         """
         The concrete method to handle the missing values using mean imputation.
@@ -65,7 +101,10 @@ class MeanStrategy(MissingValueStrategy):
             pandas.DataFrame
         """
         mean_value = self._calculate_mean(df, column)
+        if not self.inplace:
+            df = df.copy()
         df[column] = df[column].fillna(mean_value)
+        profile_of(df).invalidate(column)
         return df
 
     def _calculate_mean(self, df: pd.DataFrame, column: str) -> float:
@@ -77,11 +116,68 @@ class MeanStrategy(MissingValueStrategy):
         returns:
             float - mean of the column
         """
-        return df[column].mean()
+        return profile_of(df).column(column).mean
+
+    def fit(self, df: pd.DataFrame, column: str) -> "MeanStrategy":  # public
+        """
+        The public method to learn the mean of the column from a reference dataframe.
+        args:
+            df: pandas.DataFrame
+            column: str
+        returns:
+            MeanStrategy - self
+        """
+        self.fill_values_[column] = float(self._calculate_mean(df, column))
+        return self
+
+    def transform(self, df: pd.DataFrame, column: str) -> pd.DataFrame:  # public
+        """
+        The public method to fill the missing values with the fitted mean.
+        args:
+            df: pandas.DataFrame
+            column: str
+        returns:
+            pandas.DataFrame
+        """
+        if column not in self.fill_values_:
+            raise ValueError(f"MeanStrategy is not fitted for column '{column}'")
+        if not self.inplace:
+            df = df.copy()
+        df[column] = df[column].fillna(self.fill_values_[column])
+        profile_of(df).invalidate(column)
+        return df
+
+    def save(self, path: str) -> None:  # public
+        """
+        The public method to persist the fitted means as json.
+        args:
+            path: str - path of the json file
+        returns:
+            None
+        """
+        with open(path, "w") as f:
+            json.dump(self.fill_values_, f)
+
+    @classmethod
+    def load(cls, path: str) -> "MeanStrategy":  # public
+        """
+        The public method to create a fitted strategy from means persisted by save.
+        args:
+            path: str - path of the json file
+        returns:
+            MeanStrategy - fitted strategy
+        """
+        strategy = cls()
+        with open(path) as f:
+            strategy.fill_values_ = json.load(f)
+        return strategy
 
 
 # strategy 3: custom imputation
 class CustomStrategy(MissingValueStrategy):
+    # returns a new dataframe unless inplace=True is asked for
+    inplace = False
+
     def handle_missing(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
         """
         The public method to handle the missing values using custom imputation.
@@ -91,10 +187,17 @@ class CustomStrategy(MissingValueStrategy):
         returns:
             pandas.DataFrame
         """
-        if self._too_many_nulls(df, column):
-            return df.drop(columns=[column])
-        else:
+        too_many_nulls = self._too_many_nulls(df, column)
+        if not self.inplace:
+            if too_many_nulls:
+                return df.drop(columns=[column])
             return df.fillna({column: self._get_default_value()})
+        if too_many_nulls:
+            df.drop(columns=[column], inplace=True)
+        else:
+            df.fillna({column: self._get_default_value()}, inplace=True)
+        profile_of(df).invalidate(column)
+        return df
 
     def _too_many_nulls(self, df: pd.DataFrame, column: str) -> bool:
         """
@@ -106,7 +209,7 @@ class CustomStrategy(MissingValueStrategy):
         returns:
             bool - True if the column has too many nulls, False otherwise
         """
-        return df[column].isnull().mean() > 0.6
+        return profile_of(df).column(column).null_ratio > 0.6
 
     def _get_default_value(self) -> int:
         """
@@ -119,7 +222,7 @@ class CustomStrategy(MissingValueStrategy):
         return -1
 
 
-# usage
+# usage, run from the repository root: python -m design_patterns.public_method.public
 if __name__ == "__main__":
     df = pd.read_csv("data/car_insurance.csv")
 
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Tuple
+
+
+class Operation:
+    """
+    One column-level operation of a pipeline, declaring the columns it reads and writes
+    so a plan can prune the loaded columns and skip operations nobody needs.
+    """
+
+    def __init__(self, kind: str, column: str, reads: Iterable[str] = (), filters: bool = False):
+        """
+        Initialize the operation.
+
+        args:
+            kind: str - name of the pipeline method running a batch of operations of this
+                kind, e.g. "fill" or "encode"
+            column: str - the column written
+            reads: Iterable[str] - other columns read, the written column is always read
+            filters: bool - True when the operation drops rows, which changes every column
+        returns:
+            None
+        """
+        self.kind = kind
+        self.column = column
+        self.reads = [column] + [name for name in reads if name != column]
+        self.filters = filters
+
+    def __repr__(self):
+        return f"{self.kind}({self.column})"
+
+
+class QueryPlan:
+    """
+    The columns to load and the fused stages to run on them.
+    Consecutive operations of the same kind form one stage, executed by a single
+    call over all of their columns instead of one call per column. The call may drop
+    rows before running the other operations of the stage, so an operation dropping
+    rows joins a stage only while that stage drops rows and nothing else.
+    """
+
+    def __init__(self, columns: Optional[List[str]], stages: List[Tuple[str, List[str]]]):
+        """
+        Initialize the plan.
+
+        args:
+            columns: List[str] - columns to load, every column when None
+            stages: List[Tuple[str, List[str]]] - kind and columns of each fused stage, in order
+        returns:
+            None
+        """
+        self.columns = columns
+        self.stages = stages
+
+    @classmethod
+    def build(cls, operations: List[Operation], select: Optional[List[str]] = None) -> "QueryPlan":
+        """
+        Plan the operations for the selected output columns.
+        Walking the operations backwards, an operation is kept when it writes a column
+        that is selected or read by a kept operation after it, or when it drops rows.
+        The projection is the selected columns plus every column the kept operations read.
+
+        args:
+            operations: List[Operation] - operations in execution order
+            select: List[str] - columns of the result, every column when None
+        returns:
+            QueryPlan
+        """
+        kept = []
+        needed = None if select is None else set(select)
+        for operation in reversed(operations):
+            if needed is None or operation.filters or operation.column in needed:
+                kept.append(operation)
+                if needed is not None:
+                    needed.update(operation.reads)
+        kept.reverse()
+
+        stages = []
+        only_filters = False
+        for operation in kept:
+            fuses = stages and stages[-1][0] == operation.kind and (only_filters or not operation.filters)
+            if fuses:
+                stages[-1][1].append(operation.column)
+                only_filters = only_filters and operation.filters
+            else:
+                stages.append((operation.kind, [operation.column]))
+                only_filters = operation.filters
+
+        columns = None
+        if select is not None:
+            # selected columns first, in the order given, then the ones only operations read
+            columns = list(dict.fromkeys(list(select) + [c for operation in kept for c in operation.reads]))
+        return cls(columns, stages)
+
+    def explain(self) -> str:
+        """
+        Readable description of the plan.
+        """
+        lines = [f"load {'all columns' if self.columns is None else ', '.join(self.columns)}"]
+        lines += [f"{kind} {', '.join(columns)}" for kind, columns in self.stages]
+        return "\n".join(lines)
+
+
+#   usage
+if __name__ == "__main__":
+    operations = [
+        Operation("fill", "annual_mileage"),
+        Operation("fill", "credit_score", reads=["income"]),
+        Operation("encode", "vehicle_type"),
+        Operation("encode", "vehicle_year"),
+    ]
+    print(QueryPlan.build(operations, select=["vehicle_type", "annual_mileage"]).explain())
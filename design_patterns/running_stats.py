@@ -0,0 +1,454 @@
+from __future__ import annotations
+
+import itertools
+import numbers
+
+from ._lazy import LazyModule
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+
+# mergeable statistics used to compute exact fill values across chunks
+class RunningMean:
+    """
+    Running mean that can be updated chunk by chunk and merged with other
+    partial means, so the result is exact no matter how the data is split.
+    """
+
+    def __init__(self):
+        self.total = 0.0
+        self.count = 0
+
+    def update(self, values: pd.Series) -> "RunningMean":
+        """
+        Add the non-null values of a chunk to the running mean.
+
+        args:
+            values: pandas.Series - values of one chunk
+        returns:
+            RunningMean - self
+        """
+        self.total += float(values.sum())
+        self.count += int(values.count())
+        return self
+
+    def merge(self, other: "RunningMean") -> "RunningMean":
+        """
+        Combine the running mean with another partial mean.
+
+        args:
+            other: RunningMean - partial mean computed on other chunks
+        returns:
+            RunningMean - self
+        """
+        self.total += other.total
+        self.count += other.count
+        return self
+
+    def value(self) -> float:
+        """
+        The mean of every value seen so far.
+
+        returns:
+            float - mean, NaN when no value has been seen
+        """
+        if self.count == 0:
+            return float("nan")
+        return self.total / self.count
+
+    def to_state(self) -> dict:
+        """
+        Json-serializable state, restored by from_state.
+        """
+        return {"total": self.total, "count": self.count}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "RunningMean":
+        """
+        Running mean restored from to_state.
+        """
+        statistic = cls()
+        statistic.total, statistic.count = state["total"], state["count"]
+        return statistic
+
+
+class RunningMoments:
+    """
+    Running count, sum, mean and variance, computed in a single pass over any iterable,
+    NumPy array or buffer of numbers, and mergeable with the moments of other chunks.
+    Values are folded in block by block: each block is reduced with NumPy and combined
+    with the running moments by the pairwise form of Welford's update (Chan et al.),
+    which stays accurate when the mean is large next to the spread. The sum is
+    accumulated with Kahan compensation across blocks, and while every value is an
+    integer integer_total also keeps their exact sum, which floats lose past 2**53.
+    """
+
+    # values folded in at a time, bounding the memory of one update
+    block = 1 << 20
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.total = 0.0
+        self._compensation = 0.0
+        # exact sum while every value is an integer, None once another value is seen
+        self.integer_total = 0
+
+    def _combine(self, count: int, mean: float, m2: float, total: float) -> None:
+        """
+        Fold the moments of other values into the running moments.
+        """
+        if count == 0:
+            return
+        combined = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / combined
+        self.m2 += m2 + delta * delta * self.count * count / combined
+        self.count = combined
+        # Kahan summation of the block totals
+        addend = total - self._compensation
+        summed = self.total + addend
+        self._compensation = (summed - self.total) - addend
+        self.total = summed
+
+    def _update_block(self, values: np.ndarray) -> None:
+        if self.integer_total is not None:
+            exact = _integer_sum(values)
+            self.integer_total = None if exact is None else self.integer_total + exact
+        values = np.asarray(values, dtype=np.float64)
+        missing = np.isnan(values)
+        if missing.any():
+            values = values[~missing]
+        if values.size:
+            total = float(values.sum())
+            mean = total / values.size
+            self._combine(values.size, mean, float(np.square(values - mean).sum()), total)
+
+    def update(self, values) -> "RunningMoments":
+        """
+        Add the non-null values of a chunk, in one pass.
+
+        args:
+            values: iterable of numbers, numpy.ndarray, pandas.Series or any buffer,
+                e.g. a generator or an array.array
+        returns:
+            RunningMoments - self
+        """
+        if hasattr(values, "to_numpy"):
+            if values.dtype.kind in "iub":
+                # integer pandas data, possibly with pd.NA, keeps its integer dtype
+                values = values.dropna().to_numpy()
+            else:
+                # pandas data, possibly with pd.NA
+                values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        elif not hasattr(values, "__array__") and not isinstance(values, (list, tuple)):
+            try:
+                values = memoryview(values)
+            except TypeError:
+                # a plain iterator is consumed block by block, without materializing it
+                iterator = iter(values)
+                while True:
+                    if self.integer_total is None:
+                        part = np.fromiter(itertools.islice(iterator, self.block), dtype=np.float64)
+                    else:
+                        # python ints become an integer array, keeping integer_total exact
+                        part = np.asarray(list(itertools.islice(iterator, self.block)))
+                    if part.size == 0:
+                        return self
+                    self._update_block(part)
+        values = np.asarray(values)
+        for start in range(0, len(values), self.block):
+            self._update_block(values[start:start + self.block])
+        return self
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """
+        Combine with the moments computed on other chunks, e.g. by another worker.
+
+        args:
+            other: RunningMoments - partial moments
+        returns:
+            RunningMoments - self
+        """
+        self._combine(other.count, other.mean, other.m2, other.total - other._compensation)
+        if self.integer_total is not None:
+            self.integer_total = None if other.integer_total is None else self.integer_total + other.integer_total
+        return self
+
+    def value(self) -> float:
+        """
+        The mean of every value seen so far.
+
+        returns:
+            float - mean, NaN when no value has been seen
+        """
+        return self.mean if self.count else float("nan")
+
+    def variance(self, ddof: int = 0) -> float:
+        """
+        Variance of every value seen so far.
+
+        args:
+            ddof: int - delta degrees of freedom, 1 for the sample variance
+        returns:
+            float - variance, NaN when there are not more than ddof values
+        """
+        if self.count <= ddof:
+            return float("nan")
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 0) -> float:
+        """
+        Standard deviation of every value seen so far.
+        """
+        return self.variance(ddof) ** 0.5
+
+    def to_state(self) -> dict:
+        """
+        Json-serializable state, restored by from_state.
+        """
+        return {
+            "count": self.count, "mean": self.mean, "m2": self.m2,
+            "total": self.total, "compensation": self._compensation,
+            "integer_total": self.integer_total,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "RunningMoments":
+        """
+        Running moments restored from to_state.
+        """
+        statistic = cls()
+        statistic.count, statistic.mean, statistic.m2 = state["count"], state["mean"], state["m2"]
+        statistic.total, statistic._compensation = state["total"], state["compensation"]
+        # states saved before integer_total existed no longer know whether it is exact
+        statistic.integer_total = state.get("integer_total")
+        return statistic
+
+
+def _integer_sum(values: np.ndarray):
+    """
+    Exact sum of a block of at most RunningMoments.block integers.
+
+    args:
+        values: numpy.ndarray - block of values
+    returns:
+        int - exact sum, None when the block holds a value that is not an integer
+    """
+    if values.size == 0:
+        return 0
+    if values.dtype.kind == "O":
+        if all(isinstance(value, numbers.Integral) for value in values):
+            return int(sum(values))
+        return None
+    if values.dtype.kind not in "iub":
+        return None
+    values = values.astype(np.uint64 if values.dtype == np.uint64 else np.int64, copy=False)
+    # the high and low 32 bits are summed apart, so neither int64 sum of a block overflows
+    high = int((values >> 32).sum(dtype=np.int64))
+    low = int((values & 0xFFFFFFFF).sum(dtype=np.int64))
+    return (high << 32) + low
+
+
+class ExactMedian:
+    """
+    Exact median across chunks.
+    Only the non-null values of the single column are kept, never the whole
+    chunk, so memory grows with one column instead of the full file.
+    """
+
+    def __init__(self):
+        self.parts = []
+
+    def update(self, values: pd.Series) -> "ExactMedian":
+        """
+        Keep the non-null values of a chunk.
+
+        args:
+            values: pandas.Series - values of one chunk
+        returns:
+            ExactMedian - self
+        """
+        self.parts.append(values.dropna().to_numpy(dtype=np.float64))
+        return self
+
+    def merge(self, other: "ExactMedian") -> "ExactMedian":
+        """
+        Combine with the values kept by another partial median.
+
+        args:
+            other: ExactMedian - partial median computed on other chunks
+        returns:
+            ExactMedian - self
+        """
+        self.parts.extend(other.parts)
+        return self
+
+    def value(self) -> float:
+        """
+        The median of every value seen so far.
+
+        returns:
+            float - median, NaN when no value has been seen
+        """
+        if not self.parts:
+            return float("nan")
+        values = np.concatenate(self.parts)
+        if values.size == 0:
+            return float("nan")
+        self.parts = [values]
+        return float(np.median(values))
+
+    def to_state(self) -> dict:
+        """
+        Json-serializable state, restored by from_state. It holds every value kept,
+        prefer a QuantileSketch when the state has to stay small.
+        """
+        return {"values": np.concatenate(self.parts).tolist() if self.parts else []}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "ExactMedian":
+        """
+        Exact median restored from to_state.
+        """
+        statistic = cls()
+        statistic.parts = [np.asarray(state["values"], dtype=np.float64)]
+        return statistic
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL quantile sketch: approximate median in memory bounded by the error,
+    not by the number of values.
+    Values are kept in levels of compactors, an item at level h standing for 2**h values.
+    A level over its capacity is sorted and every other item, from a random offset, is
+    promoted to the next level, so the total weight always equals the count.
+    The sketch size k follows the empirical KLL bound: the normalized rank error of a
+    quantile stays below error with 99% confidence.
+    """
+
+    def __init__(self, error: float = 0.01, seed=None):
+        """
+        Initialize an empty sketch.
+
+        args:
+            error: float - target normalized rank error, e.g. 0.01 for the 49th to 51st percentile
+            seed: seed of the random compaction offsets, for reproducible sketches
+        returns:
+            None
+        """
+        self.error = error
+        self.k = max(8, int(np.ceil((2.296 / error) ** (1 / 0.9723))))
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        """
+        Capacity of a level, shrinking geometrically below the top level.
+        """
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        """
+        Compact every level over its capacity into the level above it.
+        """
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if items.size > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # an odd item out stays behind so the weight is preserved exactly
+                kept = items[-1:] if items.size % 2 else items[:0]
+                paired = items[: items.size - kept.size]
+                promoted = paired[self._rng.integers(2)::2]
+                self.levels[level] = kept
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    # values folded in at a time, bounding the memory of one update
+    block = 1 << 20
+
+    def update(self, values) -> "QuantileSketch":
+        """
+        Add the non-null values of a chunk to the sketch, block by block so even a
+        memory-mapped column is never copied whole.
+
+        args:
+            values: pandas.Series | numpy.ndarray - values of one chunk
+        returns:
+            QuantileSketch - self
+        """
+        values = np.asarray(values)
+        for start in range(0, len(values), self.block):
+            part = np.asarray(values[start:start + self.block], dtype=np.float64)
+            part = part[~np.isnan(part)]
+            self.count += part.size
+            self.levels[0] = np.concatenate([self.levels[0], part])
+            self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Combine with a sketch built on other chunks, e.g. by another worker.
+
+        args:
+            other: QuantileSketch - partial sketch
+        returns:
+            QuantileSketch - self
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Approximate quantile of every value seen so far.
+
+        args:
+            q: float - quantile between 0 and 1
+        returns:
+            float - quantile, NaN when no value has been seen
+        """
+        if self.count == 0:
+            return float("nan")
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(level.size, 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, q * cumulative[-1])
+        return float(items[order][min(index, items.size - 1)])
+
+    def value(self) -> float:
+        """
+        Approximate median of every value seen so far.
+
+        returns:
+            float - median, NaN when no value has been seen
+        """
+        return self.quantile(0.5)
+
+    def to_state(self) -> dict:
+        """
+        Json-serializable state, restored by from_state.
+        """
+        return {"error": self.error, "count": self.count, "levels": [level.tolist() for level in self.levels]}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "QuantileSketch":
+        """
+        Sketch restored from to_state.
+        """
+        sketch = cls(state["error"])
+        sketch.count = state["count"]
+        sketch.levels = [np.asarray(level, dtype=np.float64) for level in state["levels"]]
+        return sketch
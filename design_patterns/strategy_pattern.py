@@ -0,0 +1,790 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+import tempfile
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from ._lazy import LazyModule
+from .column_profile import profile_of
+from .running_stats import ExactMedian, QuantileSketch, RunningMean
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+
+# abstract base class for missing value strategies
+class MissingValueStrategy(ABC):
+    """
+    The Strategy interface declares operations common to all supported versions
+    of some algorithm.
+    The Context uses this interface to call the algorithm defined by Concrete Strategies.
+    """
+    # name of the DataFrame reduction computing the fill value, used to batch columns
+    reduction = None
+    # mutate the dataframe passed in, or work on a single copy of it
+    inplace = True
+
+    def __init__(self, inplace: Optional[bool] = None):
+        """
+        Initialize the strategy with its copy semantics.
+
+        args:
+            inplace: bool - mutate the dataframe passed in when True, otherwise
+                copy it once and leave it untouched; None keeps the class default
+        returns:
+            None
+        """
+        if inplace is not None:
+            self.inplace = inplace
+        # fill value per column learned by fit, reused by every transform
+        self.fill_values_ = {}
+
+    @abstractmethod
+    def handle_missing(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """
+        The abstract method to handle the missing values.
+        
+        args:
+            df: pandas.DataFrame - dataframe to handle missing values
+            column: str - column to handle missing values
+        returns:
+            pandas.DataFrame - dataframe with missing values handled
+        """
+        pass
+
+    def new_statistic(self):
+        """
+        The statistic accumulated over every chunk before any chunk is handled.
+        Strategies that need no statistic return None.
+
+        returns:
+            RunningMean | ExactMedian | None - empty mergeable statistic
+        """
+        return None
+
+    def handle_chunk(self, chunk: pd.DataFrame, column: str, fill_value) -> pd.DataFrame:
+        """
+        Handle the missing values of one chunk using the statistic computed over all chunks.
+
+        args:
+            chunk: pandas.DataFrame - chunk to handle missing values
+            column: str - column to handle missing values
+            fill_value: value of the statistic returned by new_statistic, computed once
+                after every chunk was seen; None when the strategy has no statistic
+        returns:
+            pandas.DataFrame - chunk with missing values handled
+        """
+        return self.handle_missing(chunk, column)
+
+    def _target(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        The dataframe a fill is written to: df itself in place, else its one copy.
+        """
+        return df if self.inplace else df.copy()
+
+    def in_place(self) -> "MissingValueStrategy":
+        """
+        The strategy writing to the dataframe it is given, for callers that already own
+        their working frame, e.g. a pipeline after its single copy.
+
+        returns:
+            MissingValueStrategy - self when it runs in place, otherwise a shallow copy
+                that does, sharing the fitted fill values
+        """
+        if self.inplace:
+            return self
+        strategy = copy.copy(self)
+        strategy.inplace = True
+        return strategy
+
+    def fit(self, df: pd.DataFrame, column: str) -> "MissingValueStrategy":
+        """
+        Learn the fill value of the column from a reference dataframe.
+
+        args:
+            df: pandas.DataFrame - reference dataframe
+            column: str - column to learn the fill value of
+        returns:
+            MissingValueStrategy - self
+        """
+        statistic = self.new_statistic()
+        if statistic is not None:
+            self.fill_values_[column] = statistic.update(df[column]).value()
+        return self
+
+    def transform(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """
+        Fill the missing values with the fitted value, without reducing the column again.
+
+        args:
+            df: pandas.DataFrame - dataframe to handle missing values
+            column: str - column to handle missing values
+        returns:
+            pandas.DataFrame - dataframe with missing values handled
+        """
+        if self.new_statistic() is None:
+            return self.handle_missing(df, column)
+        if column not in self.fill_values_:
+            raise ValueError(f"{type(self).__name__} is not fitted for column '{column}'")
+        df = self._target(df)
+        df[column] = df[column].fillna(self.fill_values_[column])
+        profile_of(df).invalidate(column)
+        return df
+
+    def save(self, path: str) -> None:
+        """
+        Persist the fitted fill values as json.
+
+        args:
+            path: str - path of the json file
+        returns:
+            None
+        """
+        with open(path, "w") as f:
+            json.dump({"strategy": type(self).__name__, "fill_values": self.fill_values_}, f)
+
+    @classmethod
+    def load(cls, path: str) -> "MissingValueStrategy":
+        """
+        Create a fitted strategy from fill values persisted by save.
+
+        args:
+            path: str - path of the json file
+        returns:
+            MissingValueStrategy - fitted strategy
+        """
+        with open(path) as f:
+            state = json.load(f)
+        if state["strategy"] != cls.__name__:
+            raise ValueError(f"{path} holds a {state['strategy']}, not a {cls.__name__}")
+        strategy = cls()
+        strategy.fill_values_ = state["fill_values"]
+        return strategy
+
+# concrete strategies dropping missing values
+class DropStrategy(MissingValueStrategy):
+    # dropping rows returns a new dataframe unless inplace=True is asked for
+    inplace = False
+
+    def handle_missing(self, df, column)->pd.DataFrame:
+        """
+        perform the concrete strategy of dropping missing values.
+        
+        args:
+            df: pandas.DataFrame - dataframe to handle missing values
+            column: str - column to handle missing values
+        returns:
+            pandas.DataFrame - dataframe with missing values handled
+        """
+        if self.inplace:
+            df.dropna(subset=[column], inplace=True)
+            profile_of(df).invalidate()
+            return df
+        return df.dropna(subset=[column])
+
+class MeanStrategy(MissingValueStrategy):
+    reduction = "mean"
+
+    def handle_missing(self, df, column)->pd.DataFrame:
+        """
+        Concrete Strategies implement the algorithm while following the base Strategy interface.
+        
+        args:
+            df: pandas.DataFrame
+            column: str
+        returns:
+            pandas.DataFrame
+        """
+        df = self._target(df)
+        df[column] = df[column].fillna(profile_of(df).column(column).mean)
+        profile_of(df).invalidate(column)
+        return df
+
+    def new_statistic(self) -> RunningMean:
+        return RunningMean()
+
+    def handle_chunk(self, chunk, column, fill_value)->pd.DataFrame:
+        chunk[column] = chunk[column].fillna(fill_value)
+        return chunk
+
+class MedianStrategy(MissingValueStrategy):
+    reduction = "median"
+
+    def __init__(self, inplace: Optional[bool] = None, approximate: bool = False, error: float = 0.01):
+        """
+        Initialize the strategy, exact by default.
+
+        args:
+            inplace: bool - mutate the dataframe passed in when True, otherwise
+                copy it once and leave it untouched; None keeps the class default
+            approximate: bool - compute the median with a mergeable QuantileSketch in
+                bounded memory instead of selecting it over the whole column
+            error: float - normalized rank error of the approximate median
+        returns:
+            None
+        """
+        super().__init__(inplace)
+        self.approximate = approximate
+        self.error = error
+        if approximate:
+            # the sketch is not a DataFrame reduction, handle_many falls back to handle_missing
+            self.reduction = None
+
+    def handle_missing(self, df, column)->pd.DataFrame:
+        """
+        Concrete Strategies implement the algorithm while following the base Strategy interface.
+        
+        args:
+            df: pandas.DataFrame
+            column: str
+        returns:
+            pandas.DataFrame
+        """
+        df = self._target(df)
+        if self.approximate:
+            median = self.new_statistic().update(df[column]).value()
+        else:
+            median = df[column].median()
+        df[column] = df[column].fillna(median)
+        profile_of(df).invalidate(column)
+        return df
+
+    def new_statistic(self):
+        if self.approximate:
+            return QuantileSketch(self.error)
+        return ExactMedian()
+
+    def handle_chunk(self, chunk, column, fill_value)->pd.DataFrame:
+        chunk[column] = chunk[column].fillna(fill_value)
+        return chunk
+
+class ConstantStrategy(MissingValueStrategy):
+    """
+    Fills the missing values with a fixed value, -1 by default like public.CustomStrategy.
+    """
+
+    def __init__(self, value=-1, inplace: Optional[bool] = None):
+        """
+        Initialize the strategy with its fill value.
+
+        args:
+            value: value written in place of the missing values
+            inplace: bool - mutate the dataframe passed in when True, otherwise
+                copy it once and leave it untouched; None keeps the class default
+        returns:
+            None
+        """
+        super().__init__(inplace)
+        self.value = value
+
+    def handle_missing(self, df, column)->pd.DataFrame:
+        """
+        Fill with the constant, adding it to the categories of a categorical column.
+
+        args:
+            df: pandas.DataFrame
+            column: str
+        returns:
+            pandas.DataFrame
+        """
+        df = self._target(df)
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype) and self.value not in values.cat.categories:
+            values = values.cat.add_categories([self.value])
+        df[column] = values.fillna(self.value)
+        profile_of(df).invalidate(column)
+        return df
+
+# group-wise imputation
+class GroupedStrategy(MissingValueStrategy):
+    """
+    Fills each missing value with the mean or median of its group, e.g. the median
+    credit_score of rows with the same income and age.
+    Group statistics come from one vectorized groupby pass, rows whose group has no
+    value (or whose key is missing) fall back to the statistic of the whole column.
+    """
+
+    def __init__(self, by: Union[str, List[str]], statistic: str = "median", inplace: Optional[bool] = None):
+        """
+        Initialize the strategy with its group keys.
+
+        args:
+            by: str | List[str] - key column(s) defining the groups
+            statistic: str - "mean" or "median"
+            inplace: bool - mutate the dataframe passed in when True, otherwise
+                copy it once and leave it untouched; None keeps the class default
+        returns:
+            None
+        """
+        super().__init__(inplace)
+        self.by = [by] if isinstance(by, str) else list(by)
+        self.statistic = statistic
+        # group statistics of the fitted columns, rebuilt from fill_values_ after load
+        self._tables = {}
+
+    def handle_missing(self, df, column)->pd.DataFrame:
+        """
+        Fill with the group statistic, computed in one groupby transform over the frame.
+
+        args:
+            df: pandas.DataFrame
+            column: str
+        returns:
+            pandas.DataFrame
+        """
+        df = self._target(df)
+        values = df[column]
+        groups = df.groupby(self.by, observed=True, sort=False)[column]
+        fallback = getattr(values, self.statistic)()
+        df[column] = values.fillna(groups.transform(self.statistic)).fillna(fallback)
+        profile_of(df).invalidate(column)
+        return df
+
+    def fit(self, df: pd.DataFrame, column: str) -> "GroupedStrategy":
+        """
+        Learn the statistic of every group and of the whole column.
+
+        args:
+            df: pandas.DataFrame - reference dataframe
+            column: str - column to learn the fill values of
+        returns:
+            GroupedStrategy - self
+        """
+        table = getattr(df.groupby(self.by, observed=True, sort=False)[column], self.statistic)().dropna()
+        keys = table.index.to_frame(index=False).to_numpy().tolist()
+        self.fill_values_[column] = {
+            "fallback": float(getattr(df[column], self.statistic)()),
+            "keys": keys,
+            "values": table.tolist(),
+        }
+        self._tables[column] = table
+        return self
+
+    def _table(self, column: str) -> pd.Series:
+        """
+        Fitted group statistics of the column, indexed by the group keys.
+        """
+        if column not in self._tables:
+            state = self.fill_values_[column]
+            if len(self.by) == 1:
+                index = pd.Index([key[0] for key in state["keys"]], name=self.by[0])
+            else:
+                index = pd.MultiIndex.from_tuples([tuple(key) for key in state["keys"]], names=self.by)
+            self._tables[column] = pd.Series(state["values"], index=index, dtype=np.float64)
+        return self._tables[column]
+
+    def transform(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """
+        Fill with the fitted group statistics, looking up only the rows that are missing.
+
+        args:
+            df: pandas.DataFrame - dataframe to handle missing values
+            column: str - column to handle missing values
+        returns:
+            pandas.DataFrame - dataframe with missing values handled
+        """
+        if column not in self.fill_values_:
+            raise ValueError(f"GroupedStrategy is not fitted for column '{column}'")
+        df = self._target(df)
+        missing = profile_of(df).column(column).null_mask
+        if missing.any():
+            keys = df.loc[missing, self.by]
+            if len(self.by) == 1:
+                index = pd.Index(keys[self.by[0]])
+            else:
+                index = pd.MultiIndex.from_frame(keys)
+            fill = self._table(column).reindex(index).to_numpy(dtype=np.float64)
+            df.loc[missing, column] = np.where(np.isnan(fill), self.fill_values_[column]["fallback"], fill)
+            profile_of(df).invalidate(column)
+        return df
+
+    def save(self, path: str) -> None:
+        """
+        Persist the group keys and fitted group statistics as json.
+
+        args:
+            path: str - path of the json file
+        returns:
+            None
+        """
+        with open(path, "w") as f:
+            json.dump({
+                "strategy": type(self).__name__,
+                "by": self.by,
+                "statistic": self.statistic,
+                "fill_values": self.fill_values_,
+            }, f)
+
+    @classmethod
+    def load(cls, path: str) -> "GroupedStrategy":
+        """
+        Create a fitted strategy from the state persisted by save.
+
+        args:
+            path: str - path of the json file
+        returns:
+            GroupedStrategy - fitted strategy
+        """
+        with open(path) as f:
+            state = json.load(f)
+        if state["strategy"] != cls.__name__:
+            raise ValueError(f"{path} holds a {state['strategy']}, not a {cls.__name__}")
+        strategy = cls(state["by"], state["statistic"])
+        strategy.fill_values_ = state["fill_values"]
+        return strategy
+
+# cost-based strategy selection
+class AutoStrategy(MissingValueStrategy):
+    """
+    Picks the cheapest strategy meeting an accuracy target for each column, from its
+    dtype, null ratio, skew and size, all read from the shared column profile.
+
+    - no missing value: nothing to do
+    - null ratio at most drop_below: drop the few incomplete rows
+    - boolean, non-numeric, or null ratio above max_null_ratio: fill with a constant
+    - |skew| / 3 at most tolerance: mean. By Pearson's second skewness coefficient
+      |mean - median| is about |skew| / 3 standard deviations, so the mean is then
+      within tolerance standard deviations of the median at the cost of a sum
+    - more than exact_median_rows values: median from a QuantileSketch with a rank
+      error of 0.4 * tolerance, about tolerance standard deviations near the median
+      of a roughly normal column
+    - otherwise: exact median
+
+    The skew, the only statistic needing a full pass of its own, is computed only
+    when the choice gets to the mean or median branches.
+    Every choice and its reason is kept in decisions_, see explain.
+    """
+
+    def __init__(
+        self,
+        tolerance: float = 0.05,
+        drop_below: float = 0.001,
+        max_null_ratio: float = 0.6,
+        exact_median_rows: int = 1_000_000,
+        constant=-1,
+        categorical_constant="missing",
+        boolean_constant=False,
+        inplace: Optional[bool] = None,
+    ):
+        """
+        Initialize the selection thresholds.
+
+        args:
+            tolerance: float - accepted distance to the exact median, in standard deviations
+            drop_below: float - null ratio up to which incomplete rows are dropped
+            max_null_ratio: float - null ratio above which a constant is used
+            exact_median_rows: int - values above which the median is sketched
+            constant: fill value of numeric columns with too many nulls
+            categorical_constant: fill value of non-numeric columns
+            boolean_constant: fill value of boolean columns, which have no mean or median
+            inplace: bool - mutate the dataframe passed in when True, otherwise
+                copy it once and leave it untouched; None keeps the class default
+        returns:
+            None
+        """
+        super().__init__(inplace)
+        self.tolerance = tolerance
+        self.drop_below = drop_below
+        self.max_null_ratio = max_null_ratio
+        self.exact_median_rows = exact_median_rows
+        self.constant = constant
+        self.categorical_constant = categorical_constant
+        self.boolean_constant = boolean_constant
+        self.decisions_ = {}
+        self._chosen = {}
+
+    def choose(self, df: pd.DataFrame, column: str):
+        """
+        Select the strategy of a column and record why.
+
+        args:
+            df: pandas.DataFrame - dataframe to inspect
+            column: str - column to choose a strategy for
+        returns:
+            MissingValueStrategy | None - chosen strategy, None when nothing is missing
+        """
+        profile = profile_of(df).column(column)
+        # computed only by the branches choosing between mean and median
+        skew = float("nan")
+        if profile.null_count == 0:
+            strategy, reason = None, "no missing values"
+        elif profile.null_ratio <= self.drop_below:
+            strategy = DropStrategy(inplace=self.inplace)
+            reason = f"null ratio {profile.null_ratio:.4f} <= {self.drop_below}, dropping rows loses little"
+        elif pd.api.types.is_bool_dtype(profile.values.dtype):
+            strategy = ConstantStrategy(self.boolean_constant, inplace=self.inplace)
+            reason = f"boolean dtype {profile.values.dtype}, no mean or median to fill with"
+        elif not profile.is_numeric:
+            strategy = ConstantStrategy(self.categorical_constant, inplace=self.inplace)
+            reason = f"non-numeric dtype {profile.values.dtype}"
+        elif profile.null_ratio > self.max_null_ratio:
+            strategy = ConstantStrategy(self.constant, inplace=self.inplace)
+            reason = f"null ratio {profile.null_ratio:.4f} > {self.max_null_ratio}, too sparse to estimate"
+        else:
+            skew = profile.skew
+            if abs(skew) / 3 <= self.tolerance:
+                strategy = MeanStrategy(inplace=self.inplace)
+                reason = f"skew {skew:.3f}: mean within ~{abs(skew) / 3:.3f} std of the median"
+            elif profile.size - profile.null_count > self.exact_median_rows:
+                strategy = MedianStrategy(inplace=self.inplace, approximate=True, error=0.4 * self.tolerance)
+                reason = (
+                    f"skew {skew:.3f} too large for the mean, "
+                    f"{profile.size - profile.null_count} values > {self.exact_median_rows}: sketched median"
+                )
+            else:
+                strategy = MedianStrategy(inplace=self.inplace)
+                reason = f"skew {skew:.3f} too large for the mean: exact median"
+        self.decisions_[column] = {
+            "strategy": type(strategy).__name__ if strategy is not None else None,
+            "reason": reason,
+            "null_ratio": profile.null_ratio,
+            "skew": skew,
+            "rows": profile.size,
+        }
+        self._chosen[column] = strategy
+        return strategy
+
+    def explain(self) -> pd.DataFrame:
+        """
+        The decision taken for every column handled so far.
+
+        returns:
+            pandas.DataFrame - one row per column with the strategy and its reason
+        """
+        return pd.DataFrame.from_dict(self.decisions_, orient="index")
+
+    def handle_missing(self, df, column)->pd.DataFrame:
+        """
+        Choose the strategy of the column, then let it handle the missing values.
+
+        args:
+            df: pandas.DataFrame
+            column: str
+        returns:
+            pandas.DataFrame
+        """
+        strategy = self.choose(df, column)
+        if strategy is None:
+            return self._target(df)
+        return strategy.handle_missing(df, column)
+
+    def fit(self, df: pd.DataFrame, column: str) -> "AutoStrategy":
+        """
+        Choose the strategy of the column on a reference dataframe and fit it.
+
+        args:
+            df: pandas.DataFrame - reference dataframe
+            column: str - column to choose and fit a strategy for
+        returns:
+            AutoStrategy - self
+        """
+        strategy = self.choose(df, column)
+        if strategy is not None:
+            strategy.fit(df, column)
+        return self
+
+    def transform(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """
+        Apply the strategy chosen and fitted by fit.
+
+        args:
+            df: pandas.DataFrame - dataframe to handle missing values
+            column: str - column to handle missing values
+        returns:
+            pandas.DataFrame - dataframe with missing values handled
+        """
+        if column not in self._chosen:
+            raise ValueError(f"AutoStrategy is not fitted for column '{column}'")
+        strategy = self._chosen[column]
+        if strategy is None:
+            return self._target(df)
+        return strategy.transform(df, column)
+
+# context class for missing value strategies
+class DataHandlerContext:
+    """
+    The Context class defines the interface of interest to clients.
+    It also maintains a reference to a Concrete Strategy object.
+    """
+    def __init__(self, strategy: MissingValueStrategy):
+        """
+        The Context class initializes with a specific strategy.
+        
+        args:
+            strategy: MissingValueStrategy - strategy to handle missing values
+        returns:
+            None
+        """
+        self._strategy = strategy
+        
+    def set_strategy(self, strategy: MissingValueStrategy):
+        """
+        Set the strategy to handle missing values.
+        
+        args:
+            strategy: MissingValueStrategy - strategy to handle missing values
+        returns:
+            None
+        """
+        self._strategy = strategy
+
+    def handle(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """
+        The Context class delegates the responsibility to the strategy object.
+        
+        args:
+            df: pandas.DataFrame - dataframe to handle missing values
+            column: str - column to handle missing values
+        returns:
+            pandas.DataFrame - dataframe with missing values handled
+        """
+        return self._strategy.handle_missing(df, column)
+
+    @staticmethod
+    def handle_many(
+        df: pd.DataFrame, strategies: Dict[str, MissingValueStrategy], inplace: bool = True
+    ) -> pd.DataFrame:
+        """
+        Handle the missing values of many columns at once instead of one handle call per column.
+        Rows are dropped first for every DropStrategy column, then the means and medians of
+        the columns that still have missing values are computed with one reduction each
+        and applied with a single fillna. Strategies without a reduction fall back to handle_missing.
+        With inplace=False df is copied once up front and every step mutates that copy.
+        The inplace setting of each strategy is not used: the fallbacks write to the working
+        frame too, so no other copy is made.
+
+        args:
+            df: pandas.DataFrame - dataframe to handle missing values
+            strategies: Dict[str, MissingValueStrategy] - strategy per column
+            inplace: bool - mutate df when True, otherwise work on a single copy
+        returns:
+            pandas.DataFrame - dataframe with missing values handled
+        """
+        drop_columns = [column for column, strategy in strategies.items() if isinstance(strategy, DropStrategy)]
+        if not inplace:
+            df = df.copy()
+        if drop_columns:
+            df.dropna(subset=drop_columns, inplace=True)
+            profile_of(df).invalidate()
+
+        columns_by_reduction = {}
+        fallback = []
+        for column, strategy in strategies.items():
+            if strategy.reduction is not None:
+                columns_by_reduction.setdefault(strategy.reduction, []).append(column)
+            elif not isinstance(strategy, DropStrategy):
+                fallback.append((column, strategy))
+
+        # columns without missing values need no reduction at all
+        reduced_columns = [column for columns in columns_by_reduction.values() for column in columns]
+        has_missing = df[reduced_columns].isna().any()
+        fill_values = {}
+        for reduction, columns in columns_by_reduction.items():
+            columns = [column for column in columns if has_missing[column]]
+            if columns:
+                fill_values.update(getattr(df[columns], reduction)().to_dict())
+        if fill_values:
+            df.fillna(fill_values, inplace=True)
+            for column in fill_values:
+                profile_of(df).invalidate(column)
+
+        for column, strategy in fallback:
+            df = strategy.in_place().handle_missing(df, column)
+        return df
+
+    def handle_stream(
+        self,
+        source: Union[str, Iterable[pd.DataFrame]],
+        column: str,
+        output_path: str,
+        chunksize: int = 100_000,
+    ) -> int:
+        """
+        Handle the missing values of a csv larger than memory, chunk by chunk.
+        The first pass accumulates the strategy statistic over every chunk so the
+        fill value is exact, the second pass handles each chunk and appends it to
+        the output csv. The fill value is computed once, between the two passes.
+        An iterator of chunks is spooled to a temporary directory during the first
+        pass so it can be read a second time. Strategies without a statistic, such
+        as DropStrategy, need no first pass and handle the source in a single one.
+
+        args:
+            source: str | Iterable[pandas.DataFrame] - csv path or iterator of chunks
+            column: str - column to handle missing values
+            output_path: str - csv the handled chunks are written to
+            chunksize: int - rows per chunk when reading a csv path
+        returns:
+            int - number of rows written
+        """
+        statistic = self._strategy.new_statistic()
+        is_path = isinstance(source, (str, os.PathLike))
+        if statistic is None:
+            chunks = pd.read_csv(source, chunksize=chunksize) if is_path else iter(source)
+            return self._write_chunks(chunks, column, None, output_path)
+        with tempfile.TemporaryDirectory() as spool_dir:
+            if is_path:
+                for chunk in pd.read_csv(source, chunksize=chunksize):
+                    statistic.update(chunk[column])
+                chunks = pd.read_csv(source, chunksize=chunksize)
+            else:
+                spooled = []
+                for i, chunk in enumerate(source):
+                    statistic.update(chunk[column])
+                    spooled.append(os.path.join(spool_dir, f"{i}.pkl"))
+                    chunk.to_pickle(spooled[-1])
+                chunks = (pd.read_pickle(part) for part in spooled)
+            return self._write_chunks(chunks, column, statistic.value(), output_path)
+
+    def _write_chunks(
+        self, chunks: Iterator[pd.DataFrame], column: str, fill_value, output_path: str
+    ) -> int:
+        """
+        Handle each chunk and append it to the output csv.
+
+        args:
+            chunks: Iterator[pandas.DataFrame] - chunks to handle
+            column: str - column to handle missing values
+            fill_value: value of the statistic computed over all chunks, None without one
+            output_path: str - csv the handled chunks are written to
+        returns:
+            int - number of rows written
+        """
+        rows = 0
+        header = True
+        for chunk in chunks:
+            chunk = self._strategy.handle_chunk(chunk, column, fill_value)
+            chunk.to_csv(output_path, mode="w" if header else "a", header=header, index=False)
+            header = False
+            rows += len(chunk)
+        return rows
+
+# usage
+if __name__ == "__main__":
+    # load the data
+    df = pd.read_csv('data/car_insurance.csv')
+
+    # create a context using the MedianStrategy, leaving df untouched
+    data_handler = DataHandlerContext(MedianStrategy(inplace=False))
+
+    # handle the missing values
+    df_cleaned = data_handler.handle(df, 'credit_score')
+    #print the cleaned column
+    print(df_cleaned['credit_score'])
+
+    # stream the csv chunk by chunk instead of loading it whole
+    with tempfile.TemporaryDirectory() as out_dir:
+        rows = data_handler.handle_stream(
+            'data/car_insurance.csv', 'credit_score', os.path.join(out_dir, 'cleaned.csv'), chunksize=2_500
+        )
+        print(f"streamed {rows} rows")
+
+        # fit once on the reference data, persist, and reload to score small batches
+        fitted_path = os.path.join(out_dir, 'median.json')
+        MedianStrategy().fit(df, 'credit_score').save(fitted_path)
+        scorer = MedianStrategy.load(fitted_path)
+        print(scorer.transform(df.head(5), 'credit_score')['credit_score'])
+
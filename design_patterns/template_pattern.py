@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from ._lazy import LazyModule
+from .column_profile import profile_of
+from .encoders import EncoderContext, OrdinalEncoder
+from .profiling import run_step
+from .query_plan import Operation, QueryPlan
+from .strategy_pattern import DataHandlerContext, DropStrategy, MeanStrategy
+from .typed_loader import CAR_INSURANCE_DTYPES, read_typed_csv
+
+pd = LazyModule("pandas")
+
+
+class ExploratoryDataAnalysis(ABC):
+    """
+    The Template class defines a template method that contains a skeleton of some algorithm.
+    The algorithm can be varied by overriding the abstract operations.
+    Every step after load_data mutates the frame it is given and returns it.
+    """
+
+    # steps mutate the loaded frame, or a single copy of it taken after loading
+    inplace = True
+    # record the bytes allocated by each step in self.allocations
+    track_allocations = False
+    # called around every step, see profiling.StepHook
+    hooks = ()
+    # run the steps as a QueryPlan built from operations()
+    lazy = False
+    # result columns of a lazy run, every column when None
+    select = None
+
+    # step name reported to the hooks for each kind of fused stage
+    stage_steps = {"fill": "handle_missing", "encode": "encode_categoricals"}
+
+    def __init__(
+        self,
+        inplace: bool = True,
+        track_allocations: bool = False,
+        hooks=None,
+        lazy: bool = False,
+        select: Optional[List[str]] = None,
+    ):
+        """
+        Initialize the pipeline with its copy semantics.
+
+        args:
+            inplace: bool - mutate the frame returned by load_data when True, otherwise
+                copy it once before the first step and leave it untouched
+            track_allocations: bool - record the peak bytes allocated by each step
+            hooks: list - objects with before_step(name, data), after_step(name, result) and
+                optionally step_failed(name, error) methods called around every step, such
+                as profiling.StepProfiler
+            lazy: bool - build a QueryPlan from the operations the subclass declares, load
+                only the columns it needs and run consecutive operations of a kind as one stage
+            select: List[str] - columns the caller needs from a lazy run, every column when None.
+                Other columns are not loaded and operations writing only them are skipped
+        returns:
+            None
+        """
+        self.inplace = inplace
+        self.track_allocations = track_allocations
+        self.allocations = {}
+        self.hooks = list(hooks or [])
+        self.lazy = lazy
+        self.select = select
+
+    def run_pipeline(self, path: str):
+        """
+        The template method defines the skeleton of an algorithm.
+        At most one copy of the data is materialized per run, only when inplace is False.
+        params:
+            path: str - path to the data
+        returns:
+            pandas.DataFrame - dataframe processed from the path    
+        """
+        self.allocations = {}
+        plan = self.plan() if self.lazy else None
+        df = self._run_step("load_data", self._load, path, plan)
+        return self._process(df, plan)
+
+    def run_pipelines(self, paths: Iterable[str], prefetch: int = 2) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        The template method over a stream of files, loading ahead in a background thread
+        so load_data of the next files overlaps the other steps of the current one.
+        At most prefetch loaded frames wait in memory: the loader blocks once they are
+        queued and resumes as the frames are consumed. The abstract steps are the same
+        as run_pipeline, so any subclass works unchanged. Prefetched loads run outside
+        the hooks and allocation tracking, which would otherwise measure overlapping work.
+
+        params:
+            paths: Iterable[str] - paths to the data
+            prefetch: int - loaded frames allowed to wait for processing
+        returns:
+            Iterator[Tuple[str, pandas.DataFrame]] - path and processed dataframe, in input order
+        """
+        plan = self.plan() if self.lazy else None
+        loaded = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> bool:
+            # wait for room in the queue, giving up when the consumer went away
+            while not stop.is_set():
+                try:
+                    loaded.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def load_all():
+            try:
+                for path in paths:
+                    if not put((path, self._load(path, plan), None)):
+                        return
+            except Exception as error:
+                put((None, None, error))
+                return
+            put(done)
+
+        loader = threading.Thread(target=load_all, daemon=True)
+        loader.start()
+        try:
+            while True:
+                item = loaded.get()
+                if item is done:
+                    break
+                path, df, error = item
+                if error is not None:
+                    raise error
+                self.allocations = {}
+                yield path, self._process(df, plan)
+        finally:
+            stop.set()
+            loader.join()
+
+    def plan(self) -> QueryPlan:
+        """
+        The plan of a lazy run, built from the declared operations and the selected columns.
+
+        returns:
+            QueryPlan
+        """
+        return QueryPlan.build(self.operations(), self.select)
+
+    def _load(self, path: str, plan: Optional[QueryPlan]) -> pd.DataFrame:
+        """
+        load_data, or load_columns with the projection of a lazy plan.
+        """
+        if plan is None or plan.columns is None:
+            return self.load_data(path)
+        return self.load_columns(path, plan.columns)
+
+    def _process(self, df: pd.DataFrame, plan: Optional[QueryPlan] = None) -> pd.DataFrame:
+        """
+        The steps of the template following load_data, or the stages of a lazy plan.
+        At most one copy of the data is materialized, only when inplace is False.
+
+        params:
+            df: pandas.DataFrame - loaded dataframe
+            plan: QueryPlan - stages to run instead of the eager steps, when lazy
+        returns:
+            pandas.DataFrame - processed dataframe
+        """
+        if not self.inplace:
+            df = self._run_step("copy", df.copy)
+        if plan is None:
+            df = self._run_step("handle_missing", self.handle_missing, df)
+            df = self._run_step("encode_categoricals", self.encode_categoricals, df)
+        else:
+            for kind, columns in plan.stages:
+                df = self._run_step(self.stage_steps.get(kind, kind), getattr(self, kind), df, columns)
+        self._run_step("plot", self.plot, df)
+        return df
+
+    # hooks and allocation tracking around every step, shared with private.DataPreprocessing
+    _run_step = run_step
+
+    @abstractmethod
+    def load_data(self):
+        """
+        The abstract method to load the data.
+        """
+        pass
+
+    @abstractmethod
+    def handle_missing(self, df):
+        """
+        The abstract method to handle the missing values.
+        """
+        pass
+
+    @abstractmethod
+    def encode_categoricals(self, df):
+        """
+        The abstract method to encode the categorical variables.
+        """
+        pass
+
+    def plot(self, df):
+        """
+        The method to plot the data.
+        """
+        print("Plotting basic distributions")
+
+    def operations(self) -> List[Operation]:
+        """
+        The hook declaring the operations of a lazy run, in execution order. Each
+        Operation kind names the method running a stage of them, called as
+        method(df, columns) and returning the dataframe.
+        """
+        raise ValueError(f"{type(self).__name__} declares no operations, it cannot run lazily")
+
+    def load_columns(self, path: str, columns: List[str]) -> pd.DataFrame:
+        """
+        The hook loading only some columns in a lazy run. The default loads every
+        column and projects afterwards; override it to push the projection into the reader.
+        """
+        return self.load_data(path)[columns]
+
+
+# concrete implementation
+class ProcessData(ExploratoryDataAnalysis):
+    """
+    The Concrete class implements the abstract operations.
+    """
+
+    def __init__(self, usecols=None, engine: str = "c", cache=None, encoders=None, imputers=None, **kwargs):
+        """
+        Initialize the pipeline with its loader, imputer and encoder options.
+
+        args:
+            usecols: List[str] - only load these columns, all of them when None
+            engine: str - csv parser, "c" or "pyarrow"
+            cache: load_cache.LoadCache - columnar cache of parsed files, parse every run when None
+            encoders: encoders.EncoderContext - fitted encoder per column, ordinal
+                vehicle_type and vehicle_year when None
+            imputers: Dict[str, MissingValueStrategy] - strategy per column, mean
+                annual_mileage when None. A strategy fitted on a column fills it with
+                its fitted value instead of reducing the frame again
+            kwargs: options of ExploratoryDataAnalysis
+        returns:
+            None
+        """
+        super().__init__(**kwargs)
+        self.usecols = usecols
+        self.engine = engine
+        self.cache = cache
+        if encoders is None:
+            encoders = EncoderContext({
+                "vehicle_type": OrdinalEncoder({"sedan": 0, "sports car": 1}),
+                "vehicle_year": OrdinalEncoder({"before 2015": 0, "after 2015": 1}),
+            })
+        self.encoders = encoders
+        self.imputers = imputers if imputers is not None else {"annual_mileage": MeanStrategy()}
+
+    def load_data(self, path: str) -> pd.DataFrame:
+        """
+        The concrete method to load the data with compact, declared dtypes.
+
+        args:
+            path: str - path to the data
+        returns:
+            pandas.DataFrame - dataframe loaded from the path
+        """
+        return self.load_columns(path, self.usecols)
+
+    def load_columns(self, path: str, columns: Optional[List[str]]) -> pd.DataFrame:
+        """
+        The concrete method to load some columns, parsing only those.
+
+        args:
+            path: str - path to the data
+            columns: List[str] - columns to load, every column when None
+        returns:
+            pandas.DataFrame - dataframe loaded from the path
+        """
+        if self.usecols is not None and columns is not None:
+            columns = [column for column in columns if column in self.usecols]
+        # buffers, e.g. the appended tail read by incremental.IncrementalRunner, bypass the cache
+        if self.cache is not None and isinstance(path, (str, os.PathLike)):
+            schema = {"dtypes": CAR_INSURANCE_DTYPES, "usecols": columns}
+            return self.cache.load(path, lambda path: self._parse(path, columns), schema)
+        return self._parse(path, columns)
+
+    def _parse(self, path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        The private method to parse the csv with the declared dtypes.
+
+        args:
+            path: str - path to the data
+            columns: List[str] - columns to parse, every column when None
+        returns:
+            pandas.DataFrame - dataframe parsed from the path
+        """
+        return read_typed_csv(path, usecols=columns, engine=self.engine)
+
+    def handle_missing(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        The concrete method to handle the missing values. The imputers write to the
+        working frame whatever their own inplace setting, so the run keeps a single copy.
+
+        args:
+            df: pandas.DataFrame - dataframe to handle missing values
+        returns:
+            pandas.DataFrame - dataframe with missing values handled
+        """
+        for column, strategy in self.imputers.items():
+            strategy = strategy.in_place()
+            if column in strategy.fill_values_:
+                df = strategy.transform(df, column)
+            else:
+                df = strategy.handle_missing(df, column)
+        return df
+
+    def encode_categoricals(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        The concrete method to encode the categorical variables.
+
+        args:
+            df: pandas.DataFrame - dataframe to encode categorical variables
+        returns:
+            pandas.DataFrame - dataframe with categorical variables encoded
+        """
+        return self.encoders.transform(df)
+
+    def operations(self) -> List[Operation]:
+        """
+        The concrete operations: one fill per imputer, then one encode per encoder.
+        """
+        fills = [
+            Operation("fill", column, reads=getattr(strategy, "by", ()), filters=isinstance(strategy, DropStrategy))
+            for column, strategy in self.imputers.items()
+        ]
+        encodes = [Operation("encode", column) for column in self.encoders.encoders]
+        return fills + encodes
+
+    def fill(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """
+        The fused fill stage. Fitted mean and median imputers are applied with a
+        single fillna, unfitted ones are batched through DataHandlerContext.handle_many,
+        which drops rows first. The plan only puts a dropping imputer in a stage whose
+        earlier imputers drop rows too, so the fills see the rows they see in an eager run.
+
+        args:
+            df: pandas.DataFrame - dataframe to handle missing values
+            columns: List[str] - imputed columns
+        returns:
+            pandas.DataFrame - dataframe with missing values handled
+        """
+        fitted, transformed, unfitted = {}, [], {}
+        for column in columns:
+            strategy = self.imputers[column]
+            if column not in strategy.fill_values_:
+                unfitted[column] = strategy
+            elif strategy.reduction is not None:
+                fitted[column] = strategy.fill_values_[column]
+            else:
+                transformed.append(column)
+        if fitted:
+            df.fillna(fitted, inplace=True)
+            for column in fitted:
+                profile_of(df).invalidate(column)
+        for column in transformed:
+            df = self.imputers[column].in_place().transform(df, column)
+        if unfitted:
+            df = DataHandlerContext.handle_many(df, unfitted)
+        return df
+
+    def encode(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """
+        The fused encode stage, encoding the columns in one pass.
+
+        args:
+            df: pandas.DataFrame - dataframe to encode categorical variables
+            columns: List[str] - encoded columns
+        returns:
+            pandas.DataFrame - dataframe with the columns encoded
+        """
+        return EncoderContext({column: self.encoders.encoders[column] for column in columns}).transform(df)
+
+
+#   usage
+if __name__ == "__main__":
+    from .profiling import StepProfiler
+
+    profiler = StepProfiler()
+    pipeline = ProcessData(hooks=[profiler])
+    df_cleaned = pipeline.run_pipeline(path="data/car_insurance.csv")
+    print(df_cleaned[["vehicle_type", "vehicle_year", "annual_mileage"]].head())
+    print(profiler.to_frame())
+
+    # lazy run loading and processing only the columns printed
+    lazy = ProcessData(lazy=True, select=["vehicle_type", "vehicle_year", "annual_mileage"])
+    print(lazy.plan().explain())
+    print(lazy.run_pipeline(path="data/car_insurance.csv").head())
+    
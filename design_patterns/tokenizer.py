@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import itertools
+import os
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Union
+
+from ._lazy import LazyModule
+
+np = LazyModule("numpy")
+
+
+class Vocabulary(dict):
+    """
+    Interned token -> id mapping. Looking up an unseen token assigns it the next id,
+    so tokenizing is a single dict lookup per token. tokens[id] gives the token back.
+    """
+
+    def __init__(self, tokens: Iterable[str] = ()):
+        """
+        Initialize the vocabulary, with ids assigned to tokens in order.
+
+        args:
+            tokens: Iterable[str] - initial tokens
+        returns:
+            None
+        """
+        super().__init__()
+        self.tokens = []
+        for token in tokens:
+            self[token]
+
+    def __missing__(self, token: str) -> int:
+        token = sys.intern(token)
+        index = self[token] = len(self.tokens)
+        self.tokens.append(token)
+        return index
+
+    def __reduce__(self):
+        return Vocabulary, (self.tokens,)
+
+
+class TokenBatch:
+    """
+    Token ids of many documents in two flat buffers, instead of a list of strings
+    per document: ids holds every id back to back and the ids of document i are
+    ids[offsets[i]:offsets[i + 1]].
+    """
+
+    __slots__ = ("offsets", "ids", "vocabulary")
+
+    def __init__(self, vocabulary: Vocabulary, offsets: Optional[array] = None, ids: Optional[array] = None):
+        """
+        Initialize the batch.
+
+        args:
+            vocabulary: Vocabulary - vocabulary the ids refer to
+            offsets: array('q') - start of every document, then the end of the last one
+            ids: array('i') - token ids
+        returns:
+            None
+        """
+        self.vocabulary = vocabulary
+        self.offsets = offsets if offsets is not None else array("q", [0])
+        self.ids = ids if ids is not None else array("i")
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> array:
+        if not -len(self) <= index < len(self):
+            raise IndexError("document index out of range")
+        index %= len(self)
+        return self.ids[self.offsets[index]:self.offsets[index + 1]]
+
+    def tokens(self, index: int) -> List[str]:
+        """
+        Tokens of one document, as Tokenizer.tokenize would return them.
+        """
+        return [self.vocabulary.tokens[i] for i in self[index]]
+
+    def to_numpy(self):
+        """
+        The offsets and ids as numpy arrays sharing the batch buffers.
+
+        returns:
+            tuple - int64 offsets, int32 ids
+        """
+        return np.frombuffer(self.offsets, dtype=np.int64), np.frombuffer(self.ids, dtype=np.int32)
+
+
+def _tokenize_chunk(documents: List[str]):
+    """
+    Tokenize documents against a fresh vocabulary inside a worker.
+
+    returns:
+        tuple - local tokens, token count per document, local ids
+    """
+    vocabulary = Vocabulary()
+    lookup = vocabulary.__getitem__
+    ids, counts = array("i"), array("q")
+    for document in documents:
+        tokens = document.split()
+        counts.append(len(tokens))
+        ids.extend(map(lookup, tokens))
+    return vocabulary.tokens, counts, ids
+
+
+class BatchTokenizer:
+    """
+    Whitespace tokenizer for corpora, splitting like Tokenizer.tokenize but streaming
+    documents and emitting ids of a shared Vocabulary in TokenBatch buffers.
+    With workers, chunks of documents are tokenized in a process pool against local
+    vocabularies, and the parent remaps their ids into the shared one.
+    """
+
+    def __init__(self, vocabulary: Optional[Vocabulary] = None, workers: int = 0, chunksize: int = 10_000):
+        """
+        Initialize the tokenizer.
+
+        args:
+            vocabulary: Vocabulary - vocabulary to extend, a new one when None
+            workers: int - worker processes, 0 to tokenize in this process
+            chunksize: int - documents sent to a worker at a time
+        returns:
+            None
+        """
+        self.vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+        self.workers = workers
+        self.chunksize = chunksize
+
+    @staticmethod
+    def _documents(source: Union[str, os.PathLike, Iterable[str]]) -> Iterator[str]:
+        """
+        Documents of an iterable, or the lines of a file, read lazily.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, encoding="utf-8") as f:
+                yield from f
+        else:
+            yield from source
+
+    def tokenize(self, source: Union[str, os.PathLike, Iterable[str]]) -> TokenBatch:
+        """
+        Token ids of every document.
+
+        args:
+            source: str | Iterable[str] - path of a file with one document per line, or documents
+        returns:
+            TokenBatch
+        """
+        batch = TokenBatch(self.vocabulary)
+        for part in self.iter_batches(source):
+            base = batch.offsets[-1]
+            batch.offsets.extend(offset + base for offset in part.offsets[1:])
+            batch.ids.extend(part.ids)
+        return batch
+
+    def iter_batches(self, source: Union[str, os.PathLike, Iterable[str]]) -> Iterator[TokenBatch]:
+        """
+        Token ids of the documents, one TokenBatch per chunksize documents, so a corpus
+        larger than memory can be processed chunk by chunk.
+
+        args:
+            source: str | Iterable[str] - path of a file with one document per line, or documents
+        returns:
+            Iterator[TokenBatch]
+        """
+        documents = self._documents(source)
+        chunks = iter(lambda: list(itertools.islice(documents, self.chunksize)), [])
+        if not self.workers:
+            for chunk in chunks:
+                yield self._tokenize_local(chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            # a bounded number of chunks in flight keeps memory flat on long streams
+            in_flight = deque(pool.submit(_tokenize_chunk, chunk) for chunk in itertools.islice(chunks, 2 * self.workers))
+            while in_flight:
+                tokens, counts, ids = in_flight.popleft().result()
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    in_flight.append(pool.submit(_tokenize_chunk, chunk))
+                yield self._remap(tokens, counts, ids)
+
+    def _tokenize_local(self, documents: List[str]) -> TokenBatch:
+        """
+        Tokenize documents in this process, straight into the shared vocabulary.
+        """
+        lookup = self.vocabulary.__getitem__
+        batch = TokenBatch(self.vocabulary)
+        offsets, ids = batch.offsets, batch.ids
+        for document in documents:
+            ids.extend(map(lookup, document.split()))
+            offsets.append(len(ids))
+        return batch
+
+    def _remap(self, tokens: List[str], counts: array, ids: array) -> TokenBatch:
+        """
+        Batch of a worker result, its local ids translated into the shared vocabulary.
+        """
+        remap = np.fromiter(map(self.vocabulary.__getitem__, tokens), dtype=np.int32, count=len(tokens))
+        local = np.frombuffer(ids, dtype=np.int32)
+        offsets = array("q", [0])
+        offsets.frombytes(np.cumsum(np.frombuffer(counts, dtype=np.int64)).tobytes())
+        return TokenBatch(self.vocabulary, offsets, array("i", remap[local].tobytes()))
+
+
+#   usage
+if __name__ == "__main__":
+    tokenizer = BatchTokenizer()
+    batch = tokenizer.tokenize(["Hi my name is bhavesh", "and i am a Data Scientist", "hi my name"])
+    print(len(batch), batch.tokens(1), batch[2].tolist(), len(tokenizer.vocabulary))
+    offsets, ids = batch.to_numpy()
+    print(offsets, ids)
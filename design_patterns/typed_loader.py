@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from ._lazy import LazyModule
+
+pd = LazyModule("pandas")
+
+
+
+# compact dtypes of data/car_insurance.csv
+# low-cardinality text columns become categories, integer columns nullable Int8/Int32,
+# and the 0/1 flags written as floats ("1.0") float32 like the other float columns,
+# so a missing value in any column still loads and keeps its text form
+CAR_INSURANCE_DTYPES = {
+    "id": "Int32",
+    "age": "Int8",
+    "gender": "Int8",
+    "driving_experience": "category",
+    "education": "category",
+    "income": "category",
+    "credit_score": "float32",
+    "vehicle_ownership": "float32",
+    "vehicle_year": "category",
+    "married": "float32",
+    "children": "float32",
+    "postal_code": "Int32",
+    "annual_mileage": "float32",
+    "vehicle_type": "category",
+    "speeding_violations": "Int8",
+    "duis": "Int8",
+    "past_accidents": "Int8",
+    "outcome": "float32",
+}
+
+
+def read_typed_csv(
+    path: str,
+    dtypes: Dict[str, str] = CAR_INSURANCE_DTYPES,
+    usecols: Optional[List[str]] = None,
+    engine: str = "c",
+) -> pd.DataFrame:
+    """
+    Read a csv with declared dtypes instead of inferring them from every row.
+
+    args:
+        path: str - path to the csv
+        dtypes: Dict[str, str] - dtype per column, columns not listed are inferred
+        usecols: List[str] - only parse these columns, all of them when None
+        engine: str - "c" or "pyarrow", the pyarrow engine parses with several threads
+    returns:
+        pandas.DataFrame - dataframe with the declared dtypes
+    """
+    if usecols is not None:
+        dtypes = {column: dtype for column, dtype in dtypes.items() if column in usecols}
+    if engine != "c":
+        return pd.read_csv(path, dtype=dtypes, usecols=usecols, engine=engine)
+    # the c parser is several times slower on nullable integers than on floats,
+    # so they are parsed as float64 (exact for 32-bit integers) and converted after
+    nullable = {column: dtype for column, dtype in dtypes.items() if dtype in ("Int8", "Int16", "Int32")}
+    parsed = {**dtypes, **{column: "float64" for column in nullable}}
+    return pd.read_csv(path, dtype=parsed, usecols=usecols, engine=engine).astype(nullable)
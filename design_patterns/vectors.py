@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Union
+
+from ._lazy import LazyModule
+from .oops import Vector
+
+np = LazyModule("numpy")
+
+
+class VectorArray:
+    """
+    Many 2D vectors in one contiguous (n, 2) float64 array.
+    Arithmetic runs on the whole array at once, so adding or scaling a million
+    vectors allocates one result array instead of a million Vector objects.
+    Operators follow Vector: + and * are component-wise, and either side may be
+    a VectorArray of the same length, a single Vector or a scalar.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        """
+        Initialize the array, without copying float64 (n, 2) data.
+
+        args:
+            data: array-like of shape (n, 2) - x and y of each vector
+        returns:
+            None
+        """
+        data = np.asarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 2:
+            raise ValueError(f"VectorArray needs data of shape (n, 2), got {data.shape}")
+        self.data = data
+
+    @classmethod
+    def from_xy(cls, x, y) -> "VectorArray":
+        """
+        Array of the vectors (x[i], y[i]).
+        """
+        return cls(np.column_stack([x, y]))
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector]) -> "VectorArray":
+        """
+        Array holding the components of Vector objects.
+        """
+        vectors = list(vectors)
+        data = np.fromiter((c for vector in vectors for c in (vector.x, vector.y)), np.float64, 2 * len(vectors))
+        return cls(data.reshape(-1, 2))
+
+    @property
+    def x(self) -> np.ndarray:
+        """
+        View of the x components.
+        """
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """
+        View of the y components.
+        """
+        return self.data[:, 1]
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index) -> Union[Vector, "VectorArray"]:
+        if isinstance(index, (int, np.integer)):
+            x, y = self.data[index].tolist()
+            return Vector(x, y)
+        return VectorArray(self.data[index])
+
+    def __iter__(self) -> Iterator[Vector]:
+        return (Vector(x, y) for x, y in self.data.tolist())
+
+    def __repr__(self):
+        return f"VectorArray({len(self)} vectors)"
+
+    @staticmethod
+    def _operand(other):
+        """
+        The other operand as something broadcasting against an (n, 2) array.
+        """
+        if isinstance(other, VectorArray):
+            return other.data
+        if isinstance(other, Vector):
+            return np.array([other.x, other.y], dtype=np.float64)
+        if np.isscalar(other):
+            return other
+        return NotImplemented
+
+    def __add__(self, other) -> "VectorArray":
+        other = self._operand(other)
+        return NotImplemented if other is NotImplemented else VectorArray(self.data + other)
+
+    __radd__ = __add__
+
+    def __iadd__(self, other) -> "VectorArray":
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        self.data += other
+        return self
+
+    def __mul__(self, other) -> "VectorArray":
+        other = self._operand(other)
+        return NotImplemented if other is NotImplemented else VectorArray(self.data * other)
+
+    __rmul__ = __mul__
+
+    def __imul__(self, other) -> "VectorArray":
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        self.data *= other
+        return self
+
+    def dot(self, other) -> np.ndarray:
+        """
+        Dot product of each vector with the matching vector of other, or with one Vector.
+
+        args:
+            other: VectorArray | Vector
+        returns:
+            numpy.ndarray - one dot product per vector
+        """
+        other = self._operand(other)
+        if other is NotImplemented or np.isscalar(other):
+            raise ValueError("dot needs a VectorArray or a Vector")
+        return np.einsum("ij,ij->i", self.data, np.broadcast_to(other, self.data.shape))
+
+    def norm(self) -> np.ndarray:
+        """
+        Euclidean length of each vector.
+        """
+        return np.hypot(self.data[:, 0], self.data[:, 1])
+
+    def sum(self) -> Vector:
+        """
+        Sum of every vector, as one Vector.
+        """
+        x, y = self.data.sum(axis=0).tolist()
+        return Vector(x, y)
+
+    def mean(self) -> Vector:
+        """
+        Mean of every vector, as one Vector.
+        """
+        x, y = self.data.mean(axis=0).tolist()
+        return Vector(x, y)
+
+
+#   usage
+if __name__ == "__main__":
+    vectors = VectorArray.from_vectors([Vector(1, 2), Vector(3, 4), Vector(-1, 0)])
+    print(vectors + Vector(1, 1), (vectors * 2).data.tolist())
+    print(vectors.dot(Vector(1, 0)), vectors.norm(), vectors.sum(), len(vectors[0]))
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+from design_patterns.column_profile import profile_of
+from design_patterns.strategy_pattern import AutoStrategy
+
+
+def test_complete_and_constant_columns_skip_the_skew_pass():
+    df = pd.DataFrame({"full": np.arange(10.0), "text": ["a", None] * 5})
+    strategy = AutoStrategy()
+    for column in df:
+        strategy.choose(df, column)
+        assert "skew" not in vars(profile_of(df).column(column))
+
+
+def test_nullable_boolean_column_filled_with_a_constant():
+    df = pd.DataFrame({"flag": pd.array([True, None, False, True] * 10, dtype="boolean")})
+    strategy = AutoStrategy(inplace=False)
+    result = strategy.handle_missing(df, "flag")
+    assert strategy.decisions_["flag"]["strategy"] == "ConstantStrategy"
+    assert result["flag"].tolist() == [True, False, False, True] * 10
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from design_patterns import strategy_pattern
+from design_patterns.column_profile import profile_of
+from design_patterns.encoders import EncoderContext, OrdinalEncoder
+from design_patterns.public_method import public
+
+
+def test_profile_recomputed_after_column_assignment():
+    df = pd.DataFrame({"a": [1.0, np.nan, 3.0]})
+    assert public.MeanStrategy().fit(df, "a").fill_values_["a"] == 2.0
+    df["a"] = [100.0, np.nan, 300.0]
+    assert public.MeanStrategy().fit(df, "a").fill_values_["a"] == 200.0
+    assert strategy_pattern.MeanStrategy().handle_missing(df, "a")["a"].tolist() == [100.0, 200.0, 300.0]
+
+
+def test_profile_recomputed_after_loc_write():
+    df = pd.DataFrame({"a": [1.0, np.nan, 3.0]})
+    assert profile_of(df).column("a").mean == 2.0
+    df.loc[0, "a"] = 101.0
+    assert profile_of(df).column("a").mean == 52.0
+
+
+def test_null_ratio_recomputed_after_column_emptied():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [1.0, 2.0, 3.0]})
+    assert profile_of(df).column("a").null_ratio == 0
+    df["a"] = np.nan
+    assert public.CustomStrategy().handle_missing(df, "a").columns.tolist() == ["b"]
+
+
+def test_profile_recomputed_after_encoder_write():
+    df = pd.DataFrame({"a": ["x", None, "y"]})
+    assert not profile_of(df).column("a").is_numeric
+    df = EncoderContext({"a": OrdinalEncoder()}).fit(df).transform(df)
+    assert profile_of(df).column("a").is_numeric
+
+
+def test_stale_profiles_released():
+    df = pd.DataFrame({"a": [1.0, np.nan], "b": [1.0, 2.0]})
+    profile_of(df).column("a").mean
+    profile_of(df).column("b").mean
+    df["a"] = [5.0, 6.0]
+    df["b"] = [7.0, 8.0]
+    profile_of(df).column("a")
+    assert list(profile_of(df)._columns) == ["a"]
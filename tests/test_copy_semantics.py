@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from design_patterns import strategy_pattern, template_pattern
+from design_patterns.public_method import public
+
+
+def frame() -> pd.DataFrame:
+    return pd.DataFrame({"a": [1.0, np.nan, np.nan, np.nan], "b": [1.0, 2.0, 3.0, 4.0]})
+
+
+def test_returning_strategies_leave_the_frame_untouched_by_default():
+    for strategy in (strategy_pattern.DropStrategy(), public.DropStrategy(), public.CustomStrategy()):
+        df = frame()
+        result = strategy.handle_missing(df, "a")
+        assert result is not df
+        assert df.equals(frame())
+
+
+def test_filling_strategies_mutate_by_default():
+    for strategy in (strategy_pattern.MeanStrategy(), public.MeanStrategy()):
+        df = frame()
+        assert strategy.handle_missing(df, "a") is df
+        assert not df["a"].isna().any()
+
+
+def test_inplace_is_opt_in_and_opt_out():
+    df = frame()
+    assert strategy_pattern.DropStrategy(inplace=True).handle_missing(df, "a") is df
+    assert len(df) == 1
+    df = frame()
+    strategy_pattern.MeanStrategy(inplace=False).handle_missing(df, "a")
+    assert df.equals(frame())
+
+
+def test_pipeline_imputers_write_to_the_single_working_copy(monkeypatch):
+    copies = []
+    original_copy = pd.DataFrame.copy
+
+    def counting_copy(self, *args, **kwargs):
+        copies.append(len(self))
+        return original_copy(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "copy", counting_copy)
+    for lazy in (False, True):
+        for inplace, expected in ((True, 0), (False, 1)):
+            imputers = {
+                "credit_score": strategy_pattern.DropStrategy(),
+                "annual_mileage": strategy_pattern.MedianStrategy(inplace=False, approximate=True),
+            }
+            copies.clear()
+            result = template_pattern.ProcessData(imputers=imputers, inplace=inplace, lazy=lazy).run_pipeline(
+                "data/car_insurance.csv"
+            )
+            assert len(copies) == expected
+            assert not result[["credit_score", "annual_mileage"]].isna().any().any()
+            assert not imputers["credit_score"].inplace
@@ -0,0 +1,28 @@
+import pytest
+
+from design_patterns.fleet import CarFleet
+from design_patterns.oops import Car, ElectricCar
+
+
+def text(car) -> str:
+    return str(car) if isinstance(car, ElectricCar) else car.get_description()
+
+
+def test_descriptions_match_the_objects():
+    cars = [
+        ElectricCar("Tesla", "Model 3", 2020, 75.0, 10000),
+        ElectricCar("Nissan", "Leaf", 2018, 40, 9999.5),
+        Car("Ford", "Mustang", 2021, 25000),
+    ]
+    fleet = CarFleet.from_cars(cars)
+    assert fleet.descriptions() == [text(car) for car in cars]
+    assert [text(view) for view in fleet] == [text(car) for car in cars]
+
+
+def test_view_writes_keep_the_value_or_raise():
+    fleet = CarFleet.from_cars([Car("Ford", "Mustang", 2021, 25000)])
+    fleet[0].price = 19999.99
+    assert fleet[0].price == 19999.99
+    with pytest.raises(ValueError):
+        fleet[0].year = 1900.5
+    assert fleet[0].year == 2021
@@ -0,0 +1,41 @@
+import contextlib
+import io
+import json
+import os
+
+import pandas as pd
+
+from design_patterns.incremental import IncrementalRunner
+from design_patterns.private_method import private
+from design_patterns.strategy_pattern import MedianStrategy
+from design_patterns.template_pattern import ProcessData
+
+
+def test_appended_rows_keep_their_row_number(tmp_path):
+    source = pd.read_csv("data/car_insurance.csv", nrows=300)
+    path = str(tmp_path / "growing.csv")
+    for pipeline in (ProcessData(), private.ProcessData(plot_dir=str(tmp_path))):
+        runner = IncrementalRunner(pipeline, str(tmp_path / f"{type(pipeline).__module__}.json"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            source[:200].to_csv(path, index=False)
+            runner.run(path)
+            source[200:].to_csv(path, mode="a", header=False, index=False)
+            delta = runner.run(path)
+            full = type(pipeline)().run_pipeline(path)
+        expected = full.loc[full.index >= 200]
+        assert delta.index.equals(expected.index)
+        assert delta["annual_mileage"].tolist() == expected["annual_mileage"].tolist()
+
+
+def test_median_state_stays_bounded(tmp_path):
+    source = pd.read_csv("data/car_insurance.csv")
+    path, state_path = str(tmp_path / "growing.csv"), str(tmp_path / "state.json")
+    runner = IncrementalRunner(ProcessData(imputers={"annual_mileage": MedianStrategy()}), state_path)
+    source[:2000].to_csv(path, index=False)
+    runner.run(path)
+    size = os.path.getsize(state_path)
+    source[2000:].to_csv(path, mode="a", header=False, index=False)
+    runner.run(path)
+    with open(state_path) as f:
+        assert json.load(f)["statistics"]["annual_mileage"]["type"] == "QuantileSketch"
+    assert os.path.getsize(state_path) < 2 * size
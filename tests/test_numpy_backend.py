@@ -0,0 +1,50 @@
+import gc
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from design_patterns.column_profile import profile_of
+from design_patterns.numpy_backend import NpyFrame
+from design_patterns.strategy_pattern import MeanStrategy, MedianStrategy
+
+COLUMNS = ["credit_score", "annual_mileage"]
+
+
+@pytest.fixture
+def frames(tmp_path):
+    reference = pd.read_csv("data/car_insurance.csv", usecols=COLUMNS, dtype="float32")
+    return NpyFrame.from_csv("data/car_insurance.csv", str(tmp_path / "npy"), COLUMNS), reference
+
+
+@pytest.mark.parametrize("strategy", [MeanStrategy, MedianStrategy, lambda: MedianStrategy(approximate=True)])
+def test_fit_save_load_transform_on_npy_frame(frames, tmp_path, strategy):
+    npy, reference = frames
+    fitted = strategy().fit(npy, "credit_score")
+    expected = strategy().fit(reference, "credit_score").fill_values_["credit_score"]
+    # the sketched median is randomized, within about its 1% rank error of the exact one
+    assert fitted.fill_values_["credit_score"] == pytest.approx(expected, abs=0.01)
+
+    path = str(tmp_path / "fitted.json")
+    fitted.save(path)
+    loaded = type(fitted).load(path)
+    result = loaded.transform(npy, "credit_score")
+    assert not np.isnan(np.asarray(result["credit_score"])).any()
+
+
+def test_profile_notices_in_place_fill(frames):
+    npy, _ = frames
+    assert profile_of(npy).column("annual_mileage").null_count > 0
+    npy["annual_mileage"].fillna(0)
+    assert profile_of(npy).column("annual_mileage").null_count == 0
+
+
+def test_temporary_copy_is_removed_with_the_frame(frames):
+    npy, _ = frames
+    result = MeanStrategy(inplace=False).handle_missing(npy, "credit_score")
+    directory = result.directory
+    assert os.path.isdir(directory) and directory != npy.directory
+    del result
+    gc.collect()
+    assert not os.path.exists(directory)
@@ -0,0 +1,35 @@
+import numpy as np
+
+from design_patterns.oops import AutoInsurance, Insurance
+from design_patterns.policy_store import PolicyStore
+
+RECORDS = [
+    Insurance("0000000001", "John Doe", "Life", "01/02/2024", "2024-13-45"),
+    AutoInsurance("0000000002", "Jane Doe", "Auto", "2024-01-01", "2024-12-31", "Toyota", "Corolla", 2020),
+]
+
+
+def test_records_round_trip_unchanged():
+    store = PolicyStore.from_policies(RECORDS)
+    for view, record in zip(store, RECORDS):
+        assert vars(view.to_policy()) == vars(record)
+    assert store[1].get_info().equals(RECORDS[1].get_info())
+
+
+def test_dates_parsed_with_an_explicit_format():
+    frame = PolicyStore.from_policies(RECORDS).to_frame(date_format="%Y-%m-%d")
+    assert frame["Policy Start Date"].isna().tolist() == [True, False]
+    assert str(frame["Policy End Date"][1].date()) == "2024-12-31"
+
+
+def test_to_frame_wraps_the_stored_codes_without_copying():
+    store = PolicyStore.from_policies(RECORDS)
+    # enough makes that pandas keeps their codes as int16
+    store.extend(
+        AutoInsurance(f"{n:010d}", "Jim Doe", "Auto", "2024-01-01", "2024-12-31", f"make {n}", "Model", 2020)
+        for n in range(200)
+    )
+    frame = store.to_frame(labels=False)
+    assert frame["car_make"].cat.codes.dtype == np.int16
+    for field in ("policy_type", "policy_start_date", "car_make", "car_model"):
+        assert np.shares_memory(frame[field].array.codes, store._values[field]), field
@@ -0,0 +1,52 @@
+import io
+import os
+import pickle
+
+import pandas as pd
+
+from design_patterns.parallel import run_parallel
+from design_patterns.private_method import private
+
+
+def write_sample(directory, name, rows=200) -> str:
+    path = os.path.join(directory, name)
+    pd.read_csv("data/car_insurance.csv", nrows=rows).to_csv(path, index=False)
+    return path
+
+
+def test_pipeline_stays_picklable_after_a_run(tmp_path):
+    pipeline = private.ProcessData(plot_dir=str(tmp_path))
+    _, plot = pipeline.run_pipeline_with_plot(write_sample(tmp_path, "a.csv"))
+    plot.result()
+    pickle.dumps(pipeline)
+    paths = [write_sample(tmp_path, "b.csv"), write_sample(tmp_path, "c.csv")]
+    assert all(result.ok for result in run_parallel(pipeline, paths, workers=2))
+    # the workers render their own plots, not only the parent
+    rendered = sorted(name.split("-")[0] for name in os.listdir(tmp_path) if name.endswith(".png"))
+    assert rendered == ["a", "b", "c"]
+
+
+def test_plots_of_different_inputs_do_not_overwrite(tmp_path):
+    pipeline = private.ProcessData(plot_dir=str(tmp_path))
+    plots = [pipeline.run_pipeline_with_plot(write_sample(tmp_path, name))[1] for name in ("a.csv", "b.csv")]
+    rendered = [plot.result() for plot in plots]
+    assert len(set(rendered)) == 2 and all(os.path.exists(path) for path in rendered)
+
+
+def test_empty_frame_plots_nothing(tmp_path):
+    df = pd.read_csv("data/car_insurance.csv", nrows=20)
+    df["credit_score"] = float("nan")
+    result, plot = private.ProcessData(plot_dir=str(tmp_path)).run_pipeline_with_plot(io.StringIO(df.to_csv(index=False)))
+    assert result.empty
+    assert plot.result() is None
+
+
+def test_subclass_keeps_the_two_argument_plot_hook(tmp_path):
+    class Summary(private.ProcessData):
+        def _plot_basic_distributions(self, df, column):
+            self.summary = df[column].describe()
+
+    pipeline = Summary(plot_dir=str(tmp_path))
+    result, plot = pipeline.run_pipeline_with_plot(write_sample(tmp_path, "a.csv"))
+    assert plot is None
+    assert pipeline.summary["count"] == len(result)
@@ -0,0 +1,24 @@
+import tracemalloc
+
+import pytest
+
+from design_patterns import template_pattern
+from design_patterns.profiling import CallbackHook, StepProfiler
+
+
+def test_failing_step_stops_tracing_and_closes_the_profiler_record(tmp_path):
+    profiler = StepProfiler()
+    failed = []
+    hooks = [profiler, CallbackHook(failed=lambda name, error: failed.append(name))]
+    pipeline = template_pattern.ProcessData(track_allocations=True, hooks=hooks)
+    with pytest.raises(FileNotFoundError):
+        pipeline.run_pipeline(str(tmp_path / "missing.csv"))
+    assert not tracemalloc.is_tracing()
+    assert failed == ["load_data"]
+    assert profiler._pending == {}
+    assert profiler.records[-1]["step"] == "load_data"
+    assert "FileNotFoundError" in profiler.records[-1]["error"]
+    # the profiler is still usable for the next run
+    pipeline.run_pipeline("data/car_insurance.csv")
+    assert profiler.records[-1]["error"] is None
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,27 @@
+import pandas as pd
+import pytest
+
+from design_patterns import template_pattern
+from design_patterns.query_plan import Operation, QueryPlan
+from design_patterns.strategy_pattern import DropStrategy, MeanStrategy, MedianStrategy
+
+
+def test_a_drop_after_a_fill_starts_its_own_stage():
+    plan = QueryPlan.build([
+        Operation("fill", "a"),
+        Operation("fill", "b", filters=True),
+        Operation("fill", "c", filters=True),
+        Operation("fill", "d"),
+    ])
+    assert plan.stages == [("fill", ["a"]), ("fill", ["b", "c", "d"])]
+
+
+@pytest.mark.parametrize("imputers", [
+    lambda: {"annual_mileage": MeanStrategy(), "credit_score": DropStrategy(inplace=True)},
+    lambda: {"credit_score": DropStrategy(inplace=True), "annual_mileage": MedianStrategy()},
+    lambda: {"annual_mileage": MeanStrategy(), "credit_score": DropStrategy(), "past_accidents": MedianStrategy()},
+])
+def test_lazy_run_matches_the_eager_run(imputers):
+    eager = template_pattern.ProcessData(imputers=imputers()).run_pipeline("data/car_insurance.csv")
+    lazy = template_pattern.ProcessData(imputers=imputers(), lazy=True).run_pipeline("data/car_insurance.csv")
+    pd.testing.assert_frame_equal(lazy, eager[lazy.columns])
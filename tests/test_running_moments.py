@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+
+from design_patterns.oops import AvgCalculator
+from design_patterns.running_stats import RunningMoments
+
+
+def test_integer_totals_stay_exact():
+    for numbers in ([10**17 + 1, 1], iter([10**17 + 1, 1]), np.array([10**17 + 1, 1])):
+        assert AvgCalculator(numbers).total() == 10**17 + 2
+    assert AvgCalculator(np.array([2**62, 2**62, -5])).total() == 2**63 - 5
+    assert AvgCalculator(pd.Series([10**17 + 1, None, 1], dtype="Int64")).total() == 10**17 + 2
+
+
+def test_a_float_value_falls_back_to_the_float_total():
+    assert AvgCalculator([1, 2.5]).total() == 3.5
+
+
+def test_merged_and_restored_moments_keep_the_exact_total():
+    moments = RunningMoments().update([10**17 + 1]).merge(RunningMoments().update([1]))
+    assert RunningMoments.from_state(moments.to_state()).integer_total == 10**17 + 2
+    assert moments.merge(RunningMoments().update([0.5])).integer_total is None
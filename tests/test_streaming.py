@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from design_patterns.strategy_pattern import DataHandlerContext, DropStrategy, MeanStrategy, MedianStrategy
+
+PATH = "data/car_insurance.csv"
+
+
+@pytest.mark.parametrize("strategy", [MeanStrategy, MedianStrategy, DropStrategy])
+@pytest.mark.parametrize("from_path", [True, False])
+def test_stream_matches_whole_frame(tmp_path, strategy, from_path):
+    output = str(tmp_path / "streamed.csv")
+    source = PATH if from_path else pd.read_csv(PATH, chunksize=777)
+    rows = DataHandlerContext(strategy()).handle_stream(source, "credit_score", output, chunksize=777)
+
+    expected = DataHandlerContext(strategy()).handle(pd.read_csv(PATH), "credit_score")
+    streamed = pd.read_csv(output)
+    assert rows == len(expected) == len(streamed)
+    assert np.allclose(streamed["credit_score"], expected["credit_score"].to_numpy())
+
+
+def test_statistic_value_computed_once(tmp_path, monkeypatch):
+    from design_patterns import running_stats
+
+    calls = []
+    value = running_stats.ExactMedian.value
+    monkeypatch.setattr(running_stats.ExactMedian, "value", lambda self: calls.append(1) or value(self))
+    DataHandlerContext(MedianStrategy()).handle_stream(PATH, "credit_score", str(tmp_path / "out.csv"), chunksize=500)
+    assert len(calls) == 1
@@ -0,0 +1,31 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from design_patterns.private_method import private
+from design_patterns.template_pattern import ProcessData
+from design_patterns.typed_loader import read_typed_csv
+
+
+def csv_with_missing(*columns) -> str:
+    df = pd.read_csv("data/car_insurance.csv", nrows=50)
+    for row, column in enumerate(columns):
+        df.loc[row, column] = np.nan
+    return df.to_csv(index=False)
+
+
+def test_missing_values_load_in_every_declared_column():
+    text = csv_with_missing("children", "age", "id", "outcome")
+    for engine in ("c", "pyarrow"):
+        df = read_typed_csv(io.StringIO(text), engine=engine)
+        assert df[["children", "age", "id", "outcome"]].isna().sum().tolist() == [1, 1, 1, 1]
+        assert str(df["age"].dtype) == "Int8"
+
+
+def test_both_pipelines_load_a_missing_flag():
+    text = csv_with_missing("children")
+    assert len(ProcessData().run_pipeline(path=io.StringIO(text))) == 50
+    df = private.ProcessData().run_pipeline(path=io.StringIO(text))
+    assert len(df) < 50
+    assert set(df["outcome"]) <= {"0.0", "1.0"}
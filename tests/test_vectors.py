@@ -0,0 +1,17 @@
+import numpy as np
+
+from design_patterns.oops import Vector
+from design_patterns.vectors import VectorArray
+
+
+def test_vector_on_the_left_defers_to_vector_array():
+    array = VectorArray([[1.0, 2.0], [3.0, 4.0]])
+    for result in (Vector(1, 1) + array, Vector(2, 3) * array):
+        assert isinstance(result, VectorArray)
+    assert np.array_equal((Vector(1, 1) + array).data, (array + Vector(1, 1)).data)
+    assert np.array_equal((Vector(2, 3) * array).data, [[2.0, 6.0], [6.0, 12.0]])
+
+
+def test_vector_arithmetic_is_unchanged():
+    assert str(Vector(1, 2) + Vector(3, 4)) == "Vector(4, 6)"
+    assert str(Vector(1, 2) * Vector(3, 4)) == "Vector(3, 8)"